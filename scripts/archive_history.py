@@ -0,0 +1,43 @@
+"""Move closed months of timesheets and EWA transactions to cold storage.
+
+Months before the cutoff (default: $JEM_ARCHIVE_HORIZON_MONTHS months ago)
+are written to compressed files under the archive directory and deleted
+from the hot tables. get_payslip() keeps answering for archived months.
+
+Usage:
+    python scripts/archive_history.py [--before 2025-03] [--archive-dir DIR] [--db DB]
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.db.archive import archive_closed_months
+from src.db.connection import get_engine, get_session
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+
+def main() -> None:
+    """Run the archive job."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--before", default=None, help="First YYYY-MM month to keep hot."
+    )
+    parser.add_argument(
+        "--archive-dir", type=Path, default=None, help="Archive root directory."
+    )
+    parser.add_argument("--db", type=Path, default=None, help="Database file path.")
+    args = parser.parse_args()
+
+    get_engine(args.db)
+    with get_session() as session:
+        archive_closed_months(session, args.before, args.archive_dir)
+
+
+if __name__ == "__main__":
+    main()
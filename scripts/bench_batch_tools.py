@@ -0,0 +1,80 @@
+"""Benchmark batch tool APIs against per-employee tool calls.
+
+Loads a synthetic payroll, then times check_ewa_eligibility_batch,
+get_employees_bulk and get_leave_balances_bulk over every employee, and a
+sample of single check_ewa_eligibility calls extrapolated to the same count.
+
+Usage:
+    python scripts/bench_batch_tools.py [--employees 100000] [--sample 2000]
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.orm import Session
+
+from src.db.connection import create_profiled_engine
+from src.db.models import Base
+from src.db.seed import generate_synthetic_data, synthetic_employee_id
+from src.mcp_server.tools.ewa_tools import (
+    check_ewa_eligibility,
+    check_ewa_eligibility_batch,
+)
+from src.mcp_server.tools.hr_tools import get_employees_bulk, get_leave_balances_bulk
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=100_000)
+    parser.add_argument("--sample", type=int, default=2_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_profiled_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", "bulk-load")
+        Base.metadata.create_all(engine)
+        with Session(engine, expire_on_commit=False) as session:
+            generate_synthetic_data(session, args.employees)
+        ids = [synthetic_employee_id(n) for n in range(1, args.employees + 1)]
+
+        logger.info("%-32s %10s %14s", "operation", "seconds", "employees/s")
+        for name, fn in (
+            ("check_ewa_eligibility_batch", check_ewa_eligibility_batch),
+            ("get_employees_bulk", get_employees_bulk),
+            ("get_leave_balances_bulk", get_leave_balances_bulk),
+        ):
+            with Session(engine) as session:
+                started = time.perf_counter()
+                results = fn(ids, session)
+                elapsed = time.perf_counter() - started
+            assert len(results) == len(ids)
+            logger.info("%-32s %10.2f %14.0f", name, elapsed, len(ids) / elapsed)
+
+        sample = ids[: args.sample]
+        with Session(engine) as session:
+            started = time.perf_counter()
+            for emp_id in sample:
+                check_ewa_eligibility(emp_id, session)
+            per_call = (time.perf_counter() - started) / len(sample)
+        logger.info(
+            "%-32s %10.2f %14.0f  (extrapolated from %d calls)",
+            "check_ewa_eligibility x N",
+            per_call * len(ids),
+            1 / per_call,
+            len(sample),
+        )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
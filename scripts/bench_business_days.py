@@ -0,0 +1,93 @@
+"""Benchmark business-day counting against the day-by-day loop.
+
+Times the previous submit_leave_request loop (extended with the holiday
+calendar so results are comparable) against count_business_days and
+count_business_days_batch for ranges of increasing length.
+
+Usage:
+    python scripts/bench_business_days.py [--ranges 2000] [--lengths 5 30 180 365 1825]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from datetime import date, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.workdays import count_business_days, count_business_days_batch, public_holidays
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+
+def _loop_count(start: date, end: date) -> int:
+    """Day-by-day count, as _count_business_days did, skipping holidays."""
+    holidays = {
+        day
+        for year in range(start.year, end.year + 1)
+        for day, _ in public_holidays(year)
+    }
+    days = 0
+    current = start
+    while current <= end:
+        if current.weekday() < 5 and current not in holidays:
+            days += 1
+        current += timedelta(days=1)
+    return days
+
+
+def main() -> None:
+    """Run the benchmark across range lengths."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ranges", type=int, default=2_000)
+    parser.add_argument(
+        "--lengths", type=int, nargs="+", default=[5, 30, 180, 365, 1825]
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    count_business_days_batch([(date(2026, 1, 1), date(2026, 1, 2))])  # warm-up
+    logger.info(
+        "%8s  %12s  %12s  %12s  %8s",
+        "days",
+        "loop us",
+        "o(1) us",
+        "batch us",
+        "speedup",
+    )
+    for length in args.lengths:
+        ranges = []
+        for _ in range(args.ranges):
+            start = date(2020, 1, 1) + timedelta(days=rng.randrange(2000))
+            ranges.append((start, start + timedelta(days=length - 1)))
+
+        started = time.perf_counter()
+        expected = [_loop_count(start, end) for start, end in ranges]
+        loop_us = (time.perf_counter() - started) * 1e6 / len(ranges)
+
+        started = time.perf_counter()
+        single = [count_business_days(start, end) for start, end in ranges]
+        single_us = (time.perf_counter() - started) * 1e6 / len(ranges)
+
+        started = time.perf_counter()
+        batch = count_business_days_batch(ranges)
+        batch_us = (time.perf_counter() - started) * 1e6 / len(ranges)
+
+        assert single == expected and batch == expected
+        logger.info(
+            "%8d  %12.2f  %12.2f  %12.2f  %7.0fx",
+            length,
+            loop_us,
+            single_us,
+            batch_us,
+            loop_us / single_us,
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Benchmark EWA transaction ID schemes: random-suffix vs time-ordered.
+
+Inserts the same number of rows into a table keyed like ewa_transactions
+with each scheme and reports insert throughput, primary-key collisions, and
+the shape of the primary-key index afterwards (leaf pages and how full they
+are, from SQLite's dbstat table). Random insert positions split pages and
+leave them part-empty; time-ordered IDs append at the right edge.
+
+The old scheme is "EWA-YYYYMMDD-" plus six random hex characters, with rows
+spread evenly over --days days.
+
+Usage:
+    python scripts/bench_ewa_ids.py [--rows 5000000] [--days 100]
+"""
+
+import argparse
+import logging
+import sqlite3
+import sys
+import tempfile
+import time
+import uuid
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Callable, Iterator
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.db.ids import new_id
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+BATCH_SIZE = 10_000
+INDEX_NAME = "sqlite_autoindex_ewa_transactions_1"
+
+
+def random_suffix_ids(rows: int, days: int) -> Iterator[str]:
+    """The previous scheme: date prefix plus 24 random bits."""
+    per_day = max(1, rows // days)
+    start = date(2026, 1, 1)
+    for n in range(rows):
+        day = start + timedelta(days=n // per_day)
+        yield f"EWA-{day:%Y%m%d}-{uuid.uuid4().hex[:6].upper()}"
+
+
+def time_ordered_ids(rows: int, days: int) -> Iterator[str]:
+    """The new scheme from src.db.ids."""
+    for _ in range(rows):
+        yield new_id("EWA-")
+
+
+def run(path: Path, ids: Iterator[str]) -> dict:
+    """Insert every ID, returning throughput, collisions and index shape.
+
+    Only the INSERTs are timed, not ID generation.
+    """
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE ewa_transactions "
+        "(id VARCHAR(20) PRIMARY KEY, employee_id VARCHAR(10), amount FLOAT)"
+    )
+    inserted = attempted = 0
+    elapsed = 0.0
+    batch = []
+    for txn_id in ids:
+        batch.append((txn_id, "EMP001", 500.0))
+        if len(batch) == BATCH_SIZE:
+            started = time.perf_counter()
+            inserted += _insert(conn, batch)
+            elapsed += time.perf_counter() - started
+            attempted += len(batch)
+            batch = []
+    if batch:
+        started = time.perf_counter()
+        inserted += _insert(conn, batch)
+        elapsed += time.perf_counter() - started
+        attempted += len(batch)
+
+    pages, used, size = conn.execute(
+        "SELECT count(*), sum(pgsize - unused), sum(pgsize) FROM dbstat "
+        "WHERE name = ? AND pagetype = 'leaf'",
+        (INDEX_NAME,),
+    ).fetchone()
+    conn.close()
+    return {
+        "rows_per_second": attempted / elapsed,
+        "collisions": attempted - inserted,
+        "leaf_pages": pages,
+        "fill": used / size,
+    }
+
+
+def _insert(conn: sqlite3.Connection, batch: list[tuple]) -> int:
+    """Insert one batch in its own transaction; duplicates are skipped."""
+    with conn:
+        cursor = conn.executemany(
+            "INSERT OR IGNORE INTO ewa_transactions VALUES (?, ?, ?)", batch
+        )
+    return cursor.rowcount
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=5_000_000)
+    parser.add_argument("--days", type=int, default=100)
+    args = parser.parse_args()
+
+    schemes: dict[str, Callable[[int, int], Iterator[str]]] = {
+        "random suffix (old)": random_suffix_ids,
+        "time-ordered (new)": time_ordered_ids,
+    }
+    logger.info(
+        "%-22s %12s %11s %11s %8s",
+        "scheme",
+        "rows/s",
+        "collisions",
+        "leaf pages",
+        "fill",
+    )
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, scheme in schemes.items():
+            path = Path(tmp) / f"{name.split()[0]}.db"
+            result = run(path, scheme(args.rows, args.days))
+            logger.info(
+                "%-22s %12.0f %11d %11d %7.1f%%",
+                name,
+                result["rows_per_second"],
+                result["collisions"],
+                result["leaf_pages"],
+                result["fill"] * 100,
+            )
+
+
+if __name__ == "__main__":
+    main()
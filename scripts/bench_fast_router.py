@@ -0,0 +1,136 @@
+"""Measure the keyword fast path of intent routing on a labelled corpus.
+
+For every message in data/eval/routing_corpus.jsonl, runs fast_route() and
+reports per language how often it answers without the LLM (intent hits and
+tool hits), how often those answers match the labels, and how long a match
+takes. Then runs the English messages end to end through the graph with
+the fast path on and off, the model replaced by the deterministic stub from
+src.agents.testing, and reports LLM calls and milliseconds per turn.
+Policy questions are left out of the end-to-end run because they query
+the policy vector store, and non-English turns because their responses go
+through the NLLB translator; neither changes the routing cost.
+
+Usage:
+    python scripts/bench_fast_router.py [--prefill-ms 150] [--ms-per-token 15]
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.graph import build_graph, invoke_turn
+from src.agents.nodes.intent_router import FAST_ROUTE_ENV_VAR, fast_route
+from src.agents.state import create_initial_state
+from src.agents.testing import StubLLMFactory, use_llm
+from src.db.connection import get_engine, get_session, reset_engine
+from src.db.models import EWATransaction
+from src.db.seed import seed_database
+
+logging.basicConfig(level=logging.WARNING, format="%(message)s")
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+CORPUS = Path(__file__).parent.parent / "data" / "eval" / "routing_corpus.jsonl"
+
+
+def report_fast_path(rows: list[dict], repeat: int) -> None:
+    """Log fast-path hit rate, accuracy and match time per language."""
+    by_language: dict[str, list] = {}
+    for row in rows:
+        started = time.perf_counter()
+        for _ in range(repeat):
+            route = fast_route(row["text"])
+        micros = (time.perf_counter() - started) * 1e6 / repeat
+        by_language.setdefault(row["language"], []).append((row, route, micros))
+    by_language["all"] = [
+        result for results in by_language.values() for result in results
+    ]
+
+    logger.info(
+        "%-5s %5s %8s %9s %8s %9s %8s",
+        "lang", "msgs", "intent", "correct", "tool", "correct", "us/msg",
+    )
+    for language, results in by_language.items():
+        hits = [(row, route) for row, route, _ in results if route is not None]
+        tools = [(row, route) for row, route in hits if route["tool_call"]]
+        logger.info(
+            "%-5s %5d %7.0f%% %8.0f%% %7.0f%% %8.0f%% %8.1f",
+            language,
+            len(results),
+            100 * len(hits) / len(results),
+            100 * sum(row["intent"] == route["intent"] for row, route in hits)
+            / max(len(hits), 1),
+            100 * len(tools) / len(results),
+            100 * sum(row["tool"] == route["tool_call"]["name"] for row, route in tools)
+            / max(len(tools), 1),
+            sum(micros for _, _, micros in results) / len(results),
+        )
+
+
+def report_turn_latency(
+    messages: list[str], prefill_ms: float, ms_per_token: float
+) -> None:
+    """Log LLM calls and latency per turn with the fast path on and off."""
+    with tempfile.TemporaryDirectory() as tmp:
+        reset_engine()
+        get_engine(Path(tmp) / "bench.db")
+        with get_session() as session:
+            seed_database(session)
+            seeded = {txn_id for (txn_id,) in session.query(EWATransaction.id)}
+
+        logger.info("")
+        logger.info("%-10s %8s %12s %12s", "fast path", "turns", "LLM calls", "ms/turn")
+        graph = build_graph("sequential")
+        results = {}
+        for mode, threshold in (("off", "1"), ("on", "")):
+            os.environ[FAST_ROUTE_ENV_VAR] = threshold
+            factory = StubLLMFactory(prefill_ms, ms_per_token)
+            started = time.perf_counter()
+            with use_llm(factory):
+                for message in messages:
+                    invoke_turn(graph, create_initial_state("EMP002", message))
+                    with get_session() as session:
+                        session.query(EWATransaction).filter(
+                            EWATransaction.id.not_in(seeded)
+                        ).delete(synchronize_session=False)
+            results[mode] = (time.perf_counter() - started) * 1000 / len(messages)
+            logger.info(
+                "%-10s %8d %12.2f %12.1f",
+                mode,
+                len(messages),
+                len(factory.calls) / len(messages),
+                results[mode],
+            )
+        os.environ.pop(FAST_ROUTE_ENV_VAR)
+        logger.info("fast path saves %.1f ms per turn", results["off"] - results["on"])
+        reset_engine()
+
+
+def main() -> None:
+    """Report fast-path quality on the corpus and its end-to-end effect."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prefill-ms", type=float, default=150.0)
+    parser.add_argument("--ms-per-token", type=float, default=15.0)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    rows = [json.loads(line) for line in CORPUS.read_text().splitlines()]
+    report_fast_path(rows, args.repeat)
+    messages = [
+        row["text"]
+        for row in rows
+        if row["language"] == "en" and row["intent"] != "policy_question"
+    ]
+    report_turn_latency(messages, args.prefill_ms, args.ms_per_token)
+
+
+if __name__ == "__main__":
+    main()
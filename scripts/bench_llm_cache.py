@@ -0,0 +1,147 @@
+"""Measure the LLM response cache on a repetitive stream of turns.
+
+Draws turns from the English HR and EWA messages in
+data/eval/routing_corpus.jsonl with Zipf-distributed frequencies (a few
+questions asked over and over, a long tail asked rarely), runs them through
+the graph with the model replaced by the deterministic stub from
+src.agents.testing, and reports LLM calls and milliseconds per turn with
+the response cache off and on, each with the keyword fast path off and on.
+Also reports what a cache hit costs on its own, in memory and from the
+SQLite file.
+
+Usage:
+    python scripts/bench_llm_cache.py [--turns 200] [--prefill-ms 150]
+"""
+
+import argparse
+import json
+import logging
+import os
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.graph import build_graph, invoke_turn
+from src.agents.llm import ResponseCache, cache_key
+from src.agents.nodes.intent_router import FAST_ROUTE_ENV_VAR
+from src.agents.state import create_initial_state
+from src.agents.testing import StubLLMFactory, use_llm
+from src.db.connection import get_engine, get_session, reset_engine
+from src.db.models import EWATransaction
+from src.db.seed import seed_database
+
+logging.basicConfig(level=logging.WARNING, format="%(message)s")
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+CORPUS = Path(__file__).parent.parent / "data" / "eval" / "routing_corpus.jsonl"
+
+
+def zipf_stream(messages: list[str], turns: int, seed: int) -> list[str]:
+    """Draw turns with frequency proportional to 1 / popularity rank."""
+    rng = random.Random(seed)
+    ranked = rng.sample(messages, len(messages))
+    weights = [1 / rank for rank in range(1, len(ranked) + 1)]
+    return rng.choices(ranked, weights, k=turns)
+
+
+def report_turns(stream: list[str], prefill_ms: float, ms_per_token: float) -> None:
+    """Log LLM calls, latency and hit rate per turn for each configuration."""
+    with tempfile.TemporaryDirectory() as tmp:
+        reset_engine()
+        get_engine(Path(tmp) / "bench.db")
+        with get_session() as session:
+            seed_database(session)
+            seeded = {txn_id for (txn_id,) in session.query(EWATransaction.id)}
+
+        logger.info(
+            "%-10s %-6s %8s %12s %12s %9s",
+            "fast path", "cache", "turns", "LLM calls", "ms/turn", "hit rate",
+        )
+        graph = build_graph("sequential")
+        for fast_path, threshold in (("off", "1"), ("on", "")):
+            os.environ[FAST_ROUTE_ENV_VAR] = threshold
+            for cache, ttl in (("off", 0), ("on", 3600)):
+                factory = StubLLMFactory(
+                    prefill_ms, ms_per_token, ResponseCache(ttl=ttl)
+                )
+                started = time.perf_counter()
+                with use_llm(factory):
+                    for message in stream:
+                        invoke_turn(graph, create_initial_state("EMP002", message))
+                        with get_session() as session:
+                            session.query(EWATransaction).filter(
+                                EWATransaction.id.not_in(seeded)
+                            ).delete(synchronize_session=False)
+                elapsed = (time.perf_counter() - started) * 1000 / len(stream)
+                logger.info(
+                    "%-10s %-6s %8d %12.2f %12.1f %8.0f%%",
+                    fast_path,
+                    cache,
+                    len(stream),
+                    len(factory.calls) / len(stream),
+                    elapsed,
+                    100 * factory.cache.stats()["hit_rate"],
+                )
+        os.environ.pop(FAST_ROUTE_ENV_VAR)
+        reset_engine()
+
+
+def report_hit_cost(repeat: int) -> None:
+    """Log the cost of one cache hit from memory and from the SQLite file."""
+    prompt = 'Classify this HR employee message.\nMessage: "leave balance?"'
+    params = {"num_predict": 20, "format": None}
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "llm_cache.db"
+        ResponseCache(path=path).set(cache_key("m", params, prompt), "hr_query")
+
+        cache = ResponseCache(path=path)
+        started = time.perf_counter()
+        for _ in range(repeat):
+            cache.get(cache_key("m", params, prompt))
+        memory_us = (time.perf_counter() - started) * 1e6 / repeat
+
+        started = time.perf_counter()
+        for _ in range(repeat):
+            ResponseCache(path=path).get(cache_key("m", params, prompt))
+        disk_us = (time.perf_counter() - started) * 1e6 / repeat
+
+    logger.info("")
+    logger.info(
+        "hit from memory: %.1f us; from disk (fresh process): %.1f us",
+        memory_us,
+        disk_us,
+    )
+
+
+def main() -> None:
+    """Report the cache's effect on turn cost, and the cost of a hit."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--prefill-ms", type=float, default=150.0)
+    parser.add_argument("--ms-per-token", type=float, default=15.0)
+    parser.add_argument("--repeat", type=int, default=1000)
+    args = parser.parse_args()
+
+    rows = [json.loads(line) for line in CORPUS.read_text().splitlines()]
+    messages = [
+        row["text"]
+        for row in rows
+        if row["language"] == "en" and row["intent"] != "policy_question"
+    ]
+    stream = zipf_stream(messages, args.turns, args.seed)
+    logger.info(
+        "%d turns over %d distinct messages", len(stream), len(set(stream))
+    )
+    report_turns(stream, args.prefill_ms, args.ms_per_token)
+    report_hit_cost(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+"""Measure per-call client overhead with and without the pooled LLM client.
+
+Starts a local mock of Ollama's /api/chat endpoint (HTTP/1.1 keep-alive,
+a canned streamed reply, no model behind it) and points the agents' LLM
+client at it through OLLAMA_HOST. Then makes the same number of
+classification-sized calls two ways:
+
+    fresh   a new ChatOllama per call, as get_llm() used to build
+    pooled  get_llm(), which reuses one client and its connections
+
+and reports milliseconds per call and the TCP connections the server saw,
+first from one thread and then from several threads at once, where the
+pooled client keeps at most $JEM_LLM_MAX_CONNECTIONS connections open.
+
+Usage:
+    python scripts/bench_llm_client.py [--calls 500] [--threads 8]
+"""
+
+import argparse
+import gc
+import json
+import logging
+import os
+import socket
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from langchain_ollama import ChatOllama
+
+from src.agents.llm import MODEL_NAME, get_llm, reset_clients
+
+logging.basicConfig(level=logging.WARNING, format="%(message)s")
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+PROMPT = 'Classify this HR employee message.\nMessage: "What is my leave balance?"'
+
+
+class MockOllamaHandler(BaseHTTPRequestHandler):
+    """Answers /api/chat with a two-chunk NDJSON stream."""
+
+    protocol_version = "HTTP/1.1"
+    server: "MockOllamaServer"
+
+    def setup(self) -> None:
+        """Count each new TCP connection and disable Nagle, as Ollama does."""
+        super().setup()
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.server.count_connection()
+
+    def do_POST(self) -> None:
+        """Reply to one chat request after the configured delay."""
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        self.server.delay()
+        chunks = [
+            {
+                "model": MODEL_NAME,
+                "created_at": "2026-01-01T00:00:00Z",
+                "message": {"role": "assistant", "content": "hr_query"},
+                "done": False,
+            },
+            {
+                "model": MODEL_NAME,
+                "created_at": "2026-01-01T00:00:00Z",
+                "message": {"role": "assistant", "content": ""},
+                "done": True,
+                "done_reason": "stop",
+                "prompt_eval_count": 40,
+                "eval_count": 3,
+            },
+        ]
+        body = "".join(json.dumps(chunk) + "\n" for chunk in chunks).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/x-ndjson")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        """Keep the benchmark output clean."""
+
+
+class MockOllamaServer(ThreadingHTTPServer):
+    """Threaded mock server that counts the connections it accepts."""
+
+    daemon_threads = True
+
+    def __init__(self, server_ms: float) -> None:
+        super().__init__(("127.0.0.1", 0), MockOllamaHandler)
+        self.server_ms = server_ms
+        self.connections = 0
+        self._lock = threading.Lock()
+
+    def count_connection(self) -> None:
+        """Record a new connection."""
+        with self._lock:
+            self.connections += 1
+
+    def delay(self) -> None:
+        """Sleep for the simulated generation time."""
+        time.sleep(self.server_ms / 1000)
+
+
+def fresh_call() -> None:
+    """Make one call the old way, constructing a new client."""
+    ChatOllama(model=MODEL_NAME, num_predict=20).invoke(PROMPT)
+
+
+def pooled_call() -> None:
+    """Make one call through the pooled client."""
+    get_llm(max_tokens=20).invoke(PROMPT)
+
+
+def run(
+    server: MockOllamaServer, call: Callable[[], None], calls: int, threads: int
+) -> tuple[float, int]:
+    """Return (ms per call, connections opened) for calls spread over threads."""
+    reset_clients()
+    # Close the sockets of clients left over from the previous run first
+    gc.collect()
+    before = server.connections
+    started = time.perf_counter()
+    if threads == 1:
+        for _ in range(calls):
+            call()
+    else:
+        with ThreadPoolExecutor(threads) as pool:
+            for future in [pool.submit(call) for _ in range(calls)]:
+                future.result()
+    elapsed = (time.perf_counter() - started) * 1000
+    return elapsed / calls, server.connections - before
+
+
+def main() -> None:
+    """Compare fresh and pooled clients against the mock server."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=500)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--server-ms", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = MockOllamaServer(args.server_ms)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    os.environ["OLLAMA_HOST"] = f"http://127.0.0.1:{server.server_port}"
+
+    # Warm up imports and the server before timing
+    fresh_call()
+    pooled_call()
+
+    logger.info(
+        "%-8s %8s %8s %10s %12s", "client", "threads", "calls", "ms/call", "connections"
+    )
+    results = {}
+    for threads in (1, args.threads):
+        for name, call in (("fresh", fresh_call), ("pooled", pooled_call)):
+            per_call, connections = run(server, call, args.calls, threads)
+            results[name, threads] = per_call
+            logger.info(
+                "%-8s %8d %8d %10.3f %12d",
+                name,
+                threads,
+                args.calls,
+                per_call,
+                connections,
+            )
+    logger.info(
+        "pooling saves %.3f ms per call (1 thread), %.3f ms (%d threads)",
+        results["fresh", 1] - results["pooled", 1],
+        results["fresh", args.threads] - results["pooled", args.threads],
+        args.threads,
+    )
+    reset_clients()
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Benchmark ORM hydration against column projection for employee reads.
+
+Compares session.query(Employee) + to_dict() with EmployeeRecord.select() +
+EmployeeRecord.to_dict() over a synthetic employee table, reporting
+objects/sec and tracemalloc peak memory.
+
+Usage:
+    python scripts/bench_projection.py [--employees 100000]
+"""
+
+import argparse
+import gc
+import logging
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from src.db.connection import create_profiled_engine
+from src.db.models import Base, Employee
+from src.db.records import EmployeeRecord
+from src.db.seed import generate_synthetic_data
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+
+def _orm_path(session: Session) -> list[dict]:
+    """Hydrate full Employee instances, then serialise."""
+    return [emp.to_dict() for emp in session.query(Employee).all()]
+
+
+def _projection_path(session: Session) -> list[dict]:
+    """Select columns into EmployeeRecord, then serialise."""
+    return [
+        EmployeeRecord(*row).to_dict() for row in session.execute(EmployeeRecord.select())
+    ]
+
+
+def _measure(engine: Engine, fn) -> tuple[int, float, float]:
+    """Return (rows, objects/sec, peak MiB) for one run in a fresh session."""
+    gc.collect()
+    with Session(engine) as session:
+        tracemalloc.start()
+        started = time.perf_counter()
+        rows = fn(session)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return len(rows), len(rows) / elapsed, peak / (1024 * 1024)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_profiled_engine(f"sqlite:///{Path(tmp) / 'bench.db'}", "bulk-load")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            generate_synthetic_data(session, args.employees, periods=1)
+
+        logger.info("%-12s %10s %14s %12s", "path", "rows", "objects/s", "peak MiB")
+        for name, fn in (("orm", _orm_path), ("projection", _projection_path)):
+            rows, rate, peak = _measure(engine, fn)
+            logger.info("%-12s %10d %14.0f %12.1f", name, rows, rate, peak)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
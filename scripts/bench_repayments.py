@@ -0,0 +1,93 @@
+"""Benchmark payroll-close EWA repayment: set-based chunks vs ORM row by row.
+
+Loads a synthetic payroll with a high advance rate, then marks the latest
+month's advances repaid twice on copies of the same database: once with
+reconcile_ewa_repayments(), once by loading and updating each EWATransaction
+through the ORM.
+
+Usage:
+    python scripts/bench_repayments.py [--employees 100000] [--month 2026-02]
+"""
+
+import argparse
+import logging
+import shutil
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.db.connection import create_profiled_engine
+from src.db.models import Base, EWAStatus, EWATransaction
+from src.db.seed import generate_synthetic_data
+from src.mcp_server.tools.hr_tools import month_bounds
+from src.payroll import reconcile_ewa_repayments
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+
+def repay_row_by_row(session: Session, month: str) -> int:
+    """Baseline: load each disbursed advance and set its status via the ORM."""
+    start, end = month_bounds(month)
+    midnight = datetime.min.time()
+    count = 0
+    for txn in session.scalars(
+        select(EWATransaction).where(
+            EWATransaction.status == EWAStatus.DISBURSED.value,
+            EWATransaction.disbursed_at >= datetime.combine(start, midnight),
+            EWATransaction.disbursed_at < datetime.combine(end, midnight),
+        )
+    ):
+        txn.status = EWAStatus.REPAID.value
+        session.flush()
+        count += 1
+    session.commit()
+    return count
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--employees", type=int, default=100_000)
+    parser.add_argument("--month", default="2026-02")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        seeded = Path(tmp) / "seeded.db"
+        engine = create_profiled_engine(f"sqlite:///{seeded}", "bulk-load")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            generate_synthetic_data(session, args.employees, ewa_rate=0.9)
+        engine.dispose()
+
+        logger.info(
+            "%-24s %12s %10s %14s", "method", "transactions", "seconds", "rows/s"
+        )
+        for name in ("set-based", "orm row-by-row"):
+            path = Path(tmp) / f"{name}.db"
+            shutil.copy(seeded, path)
+            engine = create_profiled_engine(f"sqlite:///{path}", "bulk-load")
+            with Session(engine, expire_on_commit=False) as session:
+                started = time.perf_counter()
+                if name == "set-based":
+                    summary = reconcile_ewa_repayments(args.month, session)
+                    count = summary["transactions"]
+                else:
+                    count = repay_row_by_row(session, args.month)
+                elapsed = time.perf_counter() - started
+            logger.info(
+                "%-24s %12d %10.2f %14.0f", name, count, elapsed, count / elapsed
+            )
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
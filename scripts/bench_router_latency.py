@@ -0,0 +1,91 @@
+"""Compare end-to-end turn latency of the sequential and combined graphs.
+
+Runs the same HR and EWA messages through build_graph("sequential") and
+build_graph("combined") against a seeded database, with the model replaced
+by a deterministic local stub that simulates prefill and per-token latency.
+Reports LLM calls and milliseconds per turn for each topology.
+
+Usage:
+    python scripts/bench_router_latency.py [--prefill-ms 150] [--ms-per-token 15]
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.graph import build_graph, invoke_turn
+from src.agents.state import create_initial_state
+from src.agents.testing import StubLLMFactory, use_llm
+from src.db.connection import get_engine, get_session, reset_engine
+from src.db.models import EWATransaction
+from src.db.seed import seed_database
+
+logging.basicConfig(level=logging.WARNING, format="%(message)s")
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+MESSAGES = [
+    "How many leave days do I have?",
+    "Show my payslip",
+    "I want to book leave next week",
+    "Am I eligible for an advance?",
+    "I need an advance please",
+    "What are my profile details?",
+]
+
+
+def main() -> None:
+    """Run every message through both topologies and report averages."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prefill-ms", type=float, default=150.0)
+    parser.add_argument("--ms-per-token", type=float, default=15.0)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reset_engine()
+        get_engine(Path(tmp) / "bench.db")
+        with get_session() as session:
+            seed_database(session)
+            seeded = {txn_id for (txn_id,) in session.query(EWATransaction.id)}
+
+        logger.info("%-12s %8s %12s %12s", "topology", "turns", "LLM calls", "ms/turn")
+        results = {}
+        for topology in ("sequential", "combined"):
+            graph = build_graph(topology)
+            factory = StubLLMFactory(args.prefill_ms, args.ms_per_token)
+            turns = 0
+            started = time.perf_counter()
+            with use_llm(factory):
+                for _ in range(args.repeat):
+                    for message in MESSAGES:
+                        invoke_turn(graph, create_initial_state("EMP002", message))
+                        turns += 1
+                        with get_session() as session:
+                            session.query(EWATransaction).filter(
+                                EWATransaction.id.not_in(seeded)
+                            ).delete(synchronize_session=False)
+            per_turn = (time.perf_counter() - started) * 1000 / turns
+            results[topology] = per_turn
+            logger.info(
+                "%-12s %8d %12.2f %12.1f",
+                topology,
+                turns,
+                len(factory.calls) / turns,
+                per_turn,
+            )
+        logger.info(
+            "combined saves %.1f ms per turn",
+            results["sequential"] - results["combined"],
+        )
+        reset_engine()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,197 @@
+"""Measure slot extraction throughput and accuracy on generated utterances.
+
+Generates a large labelled corpus of leave, payslip and EWA messages in
+English, Afrikaans and isiZulu from templates (dates, months and Rand
+amounts in the formats users type), runs extract_slots() over it and
+reports utterances per second, microseconds per utterance, the share
+extracted exactly, and the share of tool calls that would still fall back
+to an LLM call.
+
+Usage:
+    python scripts/bench_slot_extraction.py [--utterances 200000] [--seed 7]
+"""
+
+import argparse
+import logging
+import random
+import sys
+import time
+from datetime import date
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.nodes.slot_filler import TOOL_ARGS, _needs_llm
+from src.i18n.slots import extract_slots
+
+logging.basicConfig(level=logging.WARNING, format="%(message)s")
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# A Wednesday; generated yearless dates fall after it, in the same year
+TODAY = date(2026, 2, 18)
+
+MONTHS = {
+    "en": (
+        "January", "February", "March", "April", "May", "June", "July",
+        "August", "September", "October", "November", "December",
+    ),
+    "af": (
+        "Januarie", "Februarie", "Maart", "April", "Mei", "Junie", "Julie",
+        "Augustus", "September", "Oktober", "November", "Desember",
+    ),
+    "zu": (
+        "Januwari", "Februwari", "Mashi", "Ephreli", "Meyi", "Juni",
+        "Julayi", "Agasti", "Septemba", "Okthoba", "Novemba", "Disemba",
+    ),
+}
+
+LEAVE_TEMPLATES = (
+    ("en", "Please book leave from {d1} to {d2} {month}"),
+    ("en", "I'd like to apply for leave from the {d1}th to the {d2}th of {month}"),
+    ("en", "Submit {type} leave for {d1}-{d2} {month}"),
+    ("en", "Can I take {month} {d1} off?"),
+    ("en", "leave {iso1} to {iso2}"),
+    ("af", "Ek wil verlof neem van {d1} tot {d2} {month}"),
+    ("zu", "Ngicela ikhefu ngomhla ka-{d1} {month}"),
+)
+PAYSLIP_TEMPLATES = (
+    ("en", "Show my payslip for {month}"),
+    ("en", "Can I see my payslip for {month} {year}?"),
+    ("en", "payslip {year}-{mm}"),
+    ("af", "Stuur asseblief my salarisstrokie vir {month} {year}"),
+    ("zu", "Ngicela umholo ka{month} {year}"),
+)
+EWA_TEMPLATES = (
+    ("en", "I need R{spaced} please"),
+    ("en", "Withdraw R{comma} from my earned wages"),
+    ("en", "give me {k}k"),
+    ("en", "Can I get an advance of {plain} rand"),
+    ("af", "Ek wil 'n voorskot van R{spaced} hê"),
+    ("zu", "Ngicela imali engu-R{plain}"),
+)
+NO_SLOT_MESSAGES = (
+    "What is my leave balance?",
+    "Show my personal details",
+    "Am I eligible for an advance?",
+    "Hoeveel verlof het ek oor?",
+)
+
+
+def _leave(rng: random.Random) -> tuple[str, str, dict]:
+    """A leave request with its expected slots."""
+    language, template = rng.choice(LEAVE_TEMPLATES)
+    month = rng.randint(3, 12)
+    d1 = rng.randint(1, 20)
+    d2 = d1 + rng.randint(0, 7)
+    leave_type = rng.choice(("annual", "sick", "family"))
+    single = "{d2}" not in template and "{iso2}" not in template
+    expected = {
+        "start_date": date(2026, month, d1).isoformat(),
+        "end_date": date(2026, month, d1 if single else d2).isoformat(),
+    }
+    if "{type}" in template:
+        expected["leave_type"] = leave_type
+    text = template.format(
+        d1=d1,
+        d2=d2,
+        month=MONTHS[language][month - 1],
+        type=leave_type,
+        iso1=expected["start_date"],
+        iso2=expected["end_date"],
+    )
+    return "submit_leave_request", text, expected
+
+
+def _payslip(rng: random.Random) -> tuple[str, str, dict]:
+    """A payslip request with its expected slots."""
+    language, template = rng.choice(PAYSLIP_TEMPLATES)
+    month = rng.randint(1, 12)
+    year = rng.choice((2024, 2025))
+    if "{year}" not in template:
+        # Yearless months resolve to the latest one on or before TODAY
+        month, year = rng.randint(1, 2), 2026
+    text = template.format(
+        month=MONTHS[language][month - 1], year=year, mm=f"{month:02d}"
+    )
+    return "get_payslip", text, {"month": f"{year:04d}-{month:02d}"}
+
+
+def _ewa(rng: random.Random) -> tuple[str, str, dict]:
+    """An EWA advance request with its expected slots."""
+    _, template = rng.choice(EWA_TEMPLATES)
+    hundreds = rng.randint(1, 40)
+    amount = hundreds * 100
+    text = template.format(
+        spaced=f"{amount:,}".replace(",", " "),
+        comma=f"{amount:,}",
+        k=f"{amount / 1000:g}",
+        plain=amount,
+    )
+    return "request_ewa_advance", text, {"amount": float(amount)}
+
+
+def generate(count: int, seed: int) -> list[tuple[str, str, dict]]:
+    """Generate (tool, utterance, expected slots) triples."""
+    rng = random.Random(seed)
+    makers = (_leave, _payslip, _ewa)
+    corpus = []
+    for _ in range(count):
+        if rng.random() < 0.1:
+            corpus.append(("get_leave_balance", rng.choice(NO_SLOT_MESSAGES), {}))
+        else:
+            corpus.append(rng.choice(makers)(rng))
+    return corpus
+
+
+def main() -> None:
+    """Extract slots from the whole corpus and report speed and accuracy."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--utterances", type=int, default=200_000)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    corpus = generate(args.utterances, args.seed)
+    started = time.perf_counter()
+    results = [extract_slots(text, TODAY) for _, text, _ in corpus]
+    elapsed = time.perf_counter() - started
+
+    exact = 0
+    fallbacks = 0
+    by_tool: dict[str, list[int]] = {}
+    for (tool, text, expected), slots in zip(corpus, results):
+        wanted = TOOL_ARGS.get(tool, ())
+        args_found = {name: value for name, value in slots.items() if name in wanted}
+        correct = args_found == expected
+        exact += correct
+        fallback = bool(wanted) and _needs_llm(tool, text, args_found)
+        fallbacks += fallback
+        counts = by_tool.setdefault(tool, [0, 0, 0])
+        counts[0] += 1
+        counts[1] += correct
+        counts[2] += fallback
+
+    logger.info("%-22s %9s %9s %9s", "tool", "messages", "exact", "LLM")
+    for tool, (total, correct, fallback) in sorted(by_tool.items()):
+        logger.info(
+            "%-22s %9d %8.2f%% %8.2f%%",
+            tool,
+            total,
+            100 * correct / total,
+            100 * fallback / total,
+        )
+    logger.info(
+        "%d utterances in %.2fs: %.0f utterances/s, %.1f us each; "
+        "%.2f%% exact, %.2f%% fall back to the LLM",
+        len(corpus),
+        elapsed,
+        len(corpus) / elapsed,
+        elapsed * 1e6 / len(corpus),
+        100 * exact / len(corpus),
+        100 * fallbacks / len(corpus),
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Measure time to first response token with and without graph streaming.
+
+Runs the English HR and EWA messages from data/eval/routing_corpus.jsonl
+through the graph twice, with the model replaced by the deterministic stub
+from src.agents.testing: once with invoke_turn(), where nothing can be
+shown until the whole turn is done, and once with stream_turn(), timing
+the first response token. Reports milliseconds to first visible text and
+to the end of the turn.
+
+Usage:
+    python scripts/bench_streaming.py [--prefill-ms 150] [--ms-per-token 15]
+"""
+
+import argparse
+import json
+import logging
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.graph import build_graph, invoke_turn, stream_turn
+from src.agents.state import create_initial_state
+from src.agents.testing import StubLLMFactory, use_llm
+from src.db.connection import get_engine, get_session, reset_engine
+from src.db.models import EWATransaction
+from src.db.seed import seed_database
+
+logging.basicConfig(level=logging.WARNING, format="%(message)s")
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+CORPUS = Path(__file__).parent.parent / "data" / "eval" / "routing_corpus.jsonl"
+
+
+def main() -> None:
+    """Compare time to first visible text for invoked and streamed turns."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--prefill-ms", type=float, default=150.0)
+    parser.add_argument("--ms-per-token", type=float, default=15.0)
+    args = parser.parse_args()
+
+    rows = [json.loads(line) for line in CORPUS.read_text().splitlines()]
+    messages = [
+        row["text"]
+        for row in rows
+        if row["language"] == "en" and row["intent"] != "policy_question"
+    ]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reset_engine()
+        get_engine(Path(tmp) / "bench.db")
+        with get_session() as session:
+            seed_database(session)
+            seeded = {txn_id for (txn_id,) in session.query(EWATransaction.id)}
+
+        graph = build_graph()
+        timings: dict[str, list[tuple[float, float]]] = {"invoke": [], "stream": []}
+        tokens = 0
+        for mode in timings:
+            # A fresh stub per mode, so neither run reuses the other's cache
+            with use_llm(StubLLMFactory(args.prefill_ms, args.ms_per_token)):
+                for message in messages:
+                    state = create_initial_state("EMP002", message)
+                    first: list[float] = []
+                    started = time.perf_counter()
+                    if mode == "invoke":
+                        invoke_turn(graph, state)
+                    else:
+
+                        def on_token(token: str) -> None:
+                            if not first:
+                                first.append(time.perf_counter())
+
+                        result = stream_turn(graph, state, on_token)
+                        tokens += len(result["response"]) / 4
+                    done = time.perf_counter()
+                    shown = first[0] if first else done
+                    timings[mode].append(
+                        ((shown - started) * 1000, (done - started) * 1000)
+                    )
+                    with get_session() as session:
+                        session.query(EWATransaction).filter(
+                            EWATransaction.id.not_in(seeded)
+                        ).delete(synchronize_session=False)
+        reset_engine()
+
+    logger.info(
+        "%d turns, about %.0f response tokens each",
+        len(messages),
+        tokens / len(messages),
+    )
+    logger.info("%-8s %16s %14s", "mode", "first text ms", "turn ms")
+    for mode, results in timings.items():
+        logger.info(
+            "%-8s %16.1f %14.1f",
+            mode,
+            sum(shown for shown, _ in results) / len(results),
+            sum(done for _, done in results) / len(results),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""Benchmark get_payslip and check_ewa_eligibility as history grows.
+
+Both tools aggregate in SQL, so per-call latency should stay flat as an
+employee accumulates timesheets and EWA transactions in past months.
+
+Usage:
+    python scripts/bench_tool_queries.py [--employees 10000] [--sizes 100 1000 10000 100000]
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import Session
+
+from src.db.models import (
+    Base,
+    EWAStatus,
+    EWATransaction,
+    Timesheet,
+    TimesheetStatus,
+)
+from src.db.seed import generate_synthetic_data, seed_database
+from src.mcp_server.tools.ewa_tools import check_ewa_eligibility
+from src.mcp_server.tools.hr_tools import get_payslip
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+EMPLOYEE_ID = "EMP002"
+CALLS = 200
+
+
+def _add_history(session: Session, start: int, stop: int) -> None:
+    """Insert historical rows [start, stop) dated before the current period."""
+    timesheets = []
+    advances = []
+    for i in range(start, stop):
+        day = date(2026, 1, 31) - timedelta(days=i % 3650)
+        timesheets.append(
+            {
+                "employee_id": EMPLOYEE_ID,
+                "pay_period_start": day,
+                "pay_period_end": day,
+                "hours_worked": 8.0,
+                "status": TimesheetStatus.APPROVED.value,
+            }
+        )
+        when = datetime.combine(day, datetime.min.time())
+        advances.append(
+            {
+                "id": f"EWA-HIST-{i:09d}",
+                "employee_id": EMPLOYEE_ID,
+                "amount": 50.0,
+                "fee": 10.0,
+                "status": EWAStatus.REPAID.value,
+                "requested_at": when,
+                "disbursed_at": when,
+            }
+        )
+    session.execute(insert(Timesheet), timesheets)
+    session.execute(insert(EWATransaction), advances)
+    session.commit()
+
+
+def _time_calls(fn, *args, session: Session) -> float:
+    """Return mean milliseconds per call over CALLS invocations."""
+    started = time.perf_counter()
+    for _ in range(CALLS):
+        fn(*args, session=session)
+    return (time.perf_counter() - started) * 1000 / CALLS
+
+
+def main() -> None:
+    """Run the benchmark across increasing history sizes."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[100, 1_000, 10_000, 100_000]
+    )
+    parser.add_argument(
+        "--employees", type=int, default=10_000, help="Synthetic background employees."
+    )
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        Base.metadata.create_all(engine)
+        with Session(engine, expire_on_commit=False) as session:
+            seed_database(session)
+            generate_synthetic_data(session, args.employees)
+
+            logger.info("%10s  %14s  %14s", "history", "payslip ms", "eligibility ms")
+            loaded = 0
+            for size in sorted(args.sizes):
+                _add_history(session, loaded, size)
+                loaded = size
+                payslip_ms = _time_calls(get_payslip, EMPLOYEE_ID, "2026-02", session=session)
+                eligibility_ms = _time_calls(check_ewa_eligibility, EMPLOYEE_ID, session=session)
+                logger.info("%10d  %14.3f  %14.3f", size, payslip_ms, eligibility_ms)
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,135 @@
+"""Report queries and sessions per agent turn, with and without request scope.
+
+Runs representative turns through the real graph with the LLM-backed steps
+stubbed out, once through a graph whose agent nodes run unscoped (each
+tool opens its own session) and once via invoke_turn on the normal graph
+(one shared session per agent node).
+
+Usage:
+    python scripts/bench_turn_sessions.py [--turns 200]
+"""
+
+import argparse
+import logging
+import sys
+import tempfile
+import time
+from contextlib import ExitStack
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.agents.graph import build_graph, invoke_turn
+from src.agents.state import create_initial_state
+from src.db.connection import get_engine, get_session, reset_engine, track_queries
+from src.db.models import EWATransaction
+from src.db.seed import seed_database
+
+logging.basicConfig(level=logging.WARNING, format="%(message)s")
+logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# (label, intent, tool-selection reply, message)
+TURNS = [
+    ("ewa request", "ewa_request", "request", "I need an advance"),
+    ("ewa check", "ewa_request", "check", "Am I eligible for an advance?"),
+    ("leave balance", "hr_query", "get_leave_balance", "How much leave do I have?"),
+    ("payslip", "hr_query", "get_payslip", "Show my payslip"),
+]
+
+
+def _stub_llm(reply: str) -> MagicMock:
+    """Return a get_llm replacement whose model always answers reply."""
+    llm = MagicMock()
+    llm.return_value.invoke.return_value = MagicMock(content=reply)
+    return llm
+
+
+def _discard_new_advances(seeded: set[str]) -> None:
+    """Delete advances created by a turn so every turn starts eligible."""
+    with get_session() as session:
+        session.query(EWATransaction).filter(
+            EWATransaction.id.not_in(seeded)
+        ).delete(synchronize_session=False)
+
+
+def main() -> None:
+    """Run each turn type both ways and report per-turn averages."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--turns", type=int, default=200)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        reset_engine()
+        get_engine(Path(tmp) / "bench.db")
+        with get_session() as session:
+            seed_database(session)
+            seeded = {txn_id for (txn_id,) in session.query(EWATransaction.id)}
+        graph = build_graph()
+        with patch("src.agents.graph._unit_of_work", lambda node: node):
+            unscoped = build_graph()
+
+        logger.info(
+            "%-14s %-12s %9s %9s %9s",
+            "turn",
+            "mode",
+            "queries",
+            "sessions",
+            "ms",
+        )
+        for label, intent, reply, message in TURNS:
+            for mode, run in (
+                ("per-tool", unscoped.invoke),
+                ("shared", lambda state: invoke_turn(graph, state)),
+            ):
+                with ExitStack() as stack:
+                    stack.enter_context(
+                        patch(
+                            "src.agents.nodes.language_detect._detect_language",
+                            return_value="en",
+                        )
+                    )
+                    stack.enter_context(
+                        patch(
+                            "src.agents.nodes.intent_router._classify_intent",
+                            return_value=intent,
+                        )
+                    )
+                    stack.enter_context(
+                        patch(
+                            "src.agents.nodes.response_format._format_response",
+                            return_value="ok",
+                        )
+                    )
+                    for node in ("ewa_agent", "hr_agent"):
+                        stack.enter_context(
+                            patch(f"src.agents.nodes.{node}.get_llm", _stub_llm(reply))
+                        )
+
+                    state = create_initial_state("EMP002", message)
+                    queries = sessions = 0
+                    elapsed = 0.0
+                    for _ in range(args.turns):
+                        started = time.perf_counter()
+                        with track_queries() as stats:
+                            run(state)
+                        elapsed += time.perf_counter() - started
+                        queries += stats.queries
+                        sessions += stats.sessions
+                        _discard_new_advances(seeded)
+
+                logger.info(
+                    "%-14s %-12s %9.1f %9.1f %9.2f",
+                    label,
+                    mode,
+                    queries / args.turns,
+                    sessions / args.turns,
+                    elapsed * 1000 / args.turns,
+                )
+        reset_engine()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Report process startup time by phase: imports, engine, schema, graph.
+
+Each run is a fresh interpreter against an existing, already-migrated
+database, which is the autoscaled-worker warm start. The legacy schema
+column times the previous path (create_all plus upgrade_schema) against
+the same database for comparison.
+
+Usage:
+    python scripts/profile_startup.py [--runs 5]
+"""
+
+import argparse
+import json
+import logging
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger(__name__)
+
+PHASES = ["imports", "engine", "schema", "legacy_schema", "graph"]
+
+# Runs in a fresh interpreter; prints phase timings in ms as JSON.
+_CHILD = """
+import json, sys, time
+started = time.perf_counter()
+import src.cli.demo
+from src.agents.graph import build_graph
+from src.db.connection import create_profiled_engine
+from src.db.migrations import ensure_schema, upgrade_schema
+from src.db.models import Base
+timings = {"imports": time.perf_counter() - started}
+
+url = "sqlite:///" + sys.argv[1]
+started = time.perf_counter()
+engine = create_profiled_engine(url)
+timings["engine"] = time.perf_counter() - started
+
+started = time.perf_counter()
+ensure_schema(engine)
+timings["schema"] = time.perf_counter() - started
+
+legacy = create_profiled_engine(url)
+started = time.perf_counter()
+Base.metadata.create_all(legacy)
+upgrade_schema(legacy)
+timings["legacy_schema"] = time.perf_counter() - started
+
+started = time.perf_counter()
+build_graph()
+timings["graph"] = time.perf_counter() - started
+print(json.dumps({k: v * 1000 for k, v in timings.items()}))
+"""
+
+
+def main() -> None:
+    """Run fresh processes and report median phase timings."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = str(Path(tmp) / "startup.db")
+        runs = []
+        # The first run creates and migrates the database; it is not reported
+        for _ in range(args.runs + 1):
+            out = subprocess.run(
+                [sys.executable, "-c", _CHILD, db_path],
+                cwd=ROOT,
+                capture_output=True,
+                text=True,
+                check=True,
+            )
+            runs.append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    logger.info("%-14s %10s", "phase", "median ms")
+    for phase in PHASES:
+        logger.info(
+            "%-14s %10.1f", phase, statistics.median(r[phase] for r in runs[1:])
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Verify the trigger-maintained summary tables against their raw rows.
+
+Checks the EWA ledger (ewa_transactions) and the earned-to-date accumulator
+(approved timesheets). Exits with status 1 if either disagrees, unless
+--repair or --rebuild was given.
+
+Usage:
+    python scripts/reconcile_ledgers.py [--repair | --rebuild] [--db data/jem_hr.db]
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.db.connection import get_engine, get_session
+from src.db.ledger import (
+    rebuild_earned_to_date,
+    rebuild_ewa_ledger,
+    reconcile_earned_to_date,
+    reconcile_ewa_ledger,
+)
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
+
+# Mismatches listed individually before summarising
+MAX_LISTED = 20
+
+# name -> (reconcile, rebuild)
+LEDGERS = {
+    "ewa_ledger": (reconcile_ewa_ledger, rebuild_ewa_ledger),
+    "earned_to_date": (reconcile_earned_to_date, rebuild_earned_to_date),
+}
+
+
+def main() -> None:
+    """Run the reconciliation."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--repair", action="store_true", help="Rebuild on mismatch.")
+    mode.add_argument(
+        "--rebuild", action="store_true", help="Rebuild unconditionally."
+    )
+    parser.add_argument("--db", type=Path, default=None, help="Database file path.")
+    args = parser.parse_args()
+
+    get_engine(args.db)
+    inconsistent = False
+    with get_session() as session:
+        for name, (reconcile, rebuild) in LEDGERS.items():
+            if args.rebuild:
+                rebuild(session)
+                continue
+
+            mismatches = reconcile(session, repair=args.repair)
+            for mismatch in mismatches[:MAX_LISTED]:
+                logger.warning("%s: %s", name, mismatch)
+            if len(mismatches) > MAX_LISTED:
+                logger.warning("... and %d more", len(mismatches) - MAX_LISTED)
+
+            if not mismatches:
+                logger.info("%s is consistent", name)
+            elif args.repair:
+                logger.info("%s rebuilt (%d rows corrected)", name, len(mismatches))
+            else:
+                inconsistent = True
+
+    if inconsistent:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
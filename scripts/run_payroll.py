@@ -0,0 +1,52 @@
+"""Run month-end payroll for every employee.
+
+Usage:
+    python scripts/run_payroll.py --month 2026-02 --output payroll.jsonl
+    python scripts/run_payroll.py --month 2026-02 --output payroll.csv --format csv
+    python scripts/run_payroll.py --month 2026-02 --output payroll.jsonl --close
+"""
+
+import argparse
+import logging
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.db.connection import get_engine
+from src.payroll import reconcile_ewa_repayments, run_payroll
+
+logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+
+
+def main() -> None:
+    """Compute and export payslips for a month."""
+    parser = argparse.ArgumentParser(description="Run month-end payroll.")
+    parser.add_argument("--month", required=True, help="Month in YYYY-MM format.")
+    parser.add_argument("--output", type=Path, required=True, help="Output file.")
+    parser.add_argument("--format", choices=["jsonl", "csv"], default="jsonl")
+    parser.add_argument(
+        "--numpy", action="store_true", help="Vectorise gross/net math with NumPy."
+    )
+    parser.add_argument(
+        "--close",
+        action="store_true",
+        help="Close the month: mark its deducted EWA advances as repaid.",
+    )
+    parser.add_argument(
+        "--resume-after",
+        default=None,
+        help="With --close, skip employees up to this ID (from a prior run's log).",
+    )
+    parser.add_argument("--db", type=Path, default=None, help="Database file path.")
+    args = parser.parse_args()
+
+    get_engine(args.db)
+    run_payroll(args.month, args.output, args.format, vectorize=args.numpy)
+    if args.close:
+        reconcile_ewa_repayments(args.month, start_after=args.resume_after)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,24 +1,69 @@
-"""Standalone database seeding script."""
+"""Standalone database seeding script.
 
+Usage:
+    python scripts/seed_db.py                      # 12 demo employees
+    python scripts/seed_db.py --scale 100000       # plus synthetic employees
+"""
+
+import argparse
 import logging
 import sys
+import time
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from src.db.connection import get_engine, get_session
-from src.db.seed import seed_database
+from src.db.seed import generate_synthetic_data, seed_database
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
+logger = logging.getLogger(__name__)
 
 
 def main() -> None:
     """Initialize database and seed with demo data."""
-    get_engine()
+    parser = argparse.ArgumentParser(description="Seed the Jem HR database.")
+    parser.add_argument(
+        "--scale", type=int, default=0, help="Number of synthetic employees to add."
+    )
+    parser.add_argument(
+        "--periods", type=int, default=6, help="Pay periods per synthetic employee."
+    )
+    parser.add_argument(
+        "--shifts", type=int, default=1, help="Timesheet rows per employee per period."
+    )
+    parser.add_argument(
+        "--ewa-rate", type=float, default=0.3, help="Advance probability per period."
+    )
+    parser.add_argument("--seed", type=int, default=42, help="Random seed.")
+    parser.add_argument("--db", type=Path, default=None, help="Database file path.")
+    args = parser.parse_args()
+
+    get_engine(args.db, profile="bulk-load" if args.scale else None)
     with get_session() as session:
         seed_database(session)
 
+    if args.scale:
+        started = time.perf_counter()
+        with get_session() as session:
+            counts = generate_synthetic_data(
+                session,
+                args.scale,
+                periods=args.periods,
+                shifts_per_period=args.shifts,
+                ewa_rate=args.ewa_rate,
+                seed=args.seed,
+            )
+        elapsed = time.perf_counter() - started
+        rows = sum(counts.values())
+        logger.info(
+            "Loaded %d rows in %.1fs (%.0f rows/s)",
+            rows,
+            elapsed,
+            rows / max(elapsed, 1e-9),
+        )
+
 
 if __name__ == "__main__":
     main()
@@ -1,6 +1,12 @@
 """LangGraph agent orchestration."""
 
-from .graph import build_graph
+from .graph import build_graph, invoke_turn, stream_turn
 from .state import AgentState, create_initial_state
 
-__all__ = ["AgentState", "build_graph", "create_initial_state"]
+__all__ = [
+    "AgentState",
+    "build_graph",
+    "create_initial_state",
+    "invoke_turn",
+    "stream_turn",
+]
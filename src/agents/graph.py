@@ -1,8 +1,14 @@
 """LangGraph agent graph definition."""
 
+import functools
 import logging
+import os
+from typing import Callable, Optional
 
 from langgraph.graph import END, StateGraph
+from sqlalchemy.exc import SQLAlchemyError
+
+from src.db.connection import request_scope, track_queries
 
 from .nodes import (
     ewa_agent,
@@ -12,25 +18,71 @@ from .nodes import (
     policy_rag,
     response_format,
     route_by_intent,
+    tool_router,
 )
 from .state import AgentState
 
 logger = logging.getLogger(__name__)
 
+# Graph topologies: "sequential" classifies intent and then lets the agent
+# pick its tool (two LLM calls); "combined" does both in one tool_router call
+TOPOLOGY_ENV_VAR = "JEM_GRAPH_TOPOLOGY"
+DEFAULT_TOPOLOGY = "sequential"
+TOPOLOGIES = {"sequential", "combined"}
+
+# Shown when the tool calls' writes could not be committed
+SAVE_FAILED_MESSAGE = "Your request could not be saved. Please try again."
+
+
+def _unit_of_work(node: Callable[[AgentState], dict]) -> Callable[[AgentState], dict]:
+    """Run a tool-calling node as one database unit of work.
+
+    Every tool call the node makes shares one session, which commits when
+    the node returns. That is before response_format generates the reply,
+    so SQLite's write lock is not held while the model writes, and a
+    commit that fails is reported as an error rather than as a success.
+    """
+
+    @functools.wraps(node)
+    def run(state: AgentState) -> dict:
+        try:
+            with request_scope():
+                return node(state)
+        except SQLAlchemyError:
+            logger.exception("Committing %s tool calls failed", node.__name__)
+            return {"tool_results": None, "error": SAVE_FAILED_MESSAGE}
 
-def build_graph() -> StateGraph:
+    return run
+
+
+def build_graph(topology: Optional[str] = None) -> StateGraph:
     """Build and compile the LangGraph agent graph.
 
+    Args:
+        topology: "sequential" or "combined". Defaults to
+                  $JEM_GRAPH_TOPOLOGY or "sequential".
+
     Returns:
         Compiled StateGraph.
+
+    Raises:
+        ValueError: If topology is not recognised.
     """
+    topology = topology or os.environ.get(TOPOLOGY_ENV_VAR) or DEFAULT_TOPOLOGY
+    if topology not in TOPOLOGIES:
+        raise ValueError(
+            f"Unknown graph topology '{topology}'. "
+            f"Expected one of: {', '.join(sorted(TOPOLOGIES))}"
+        )
+    router = intent_router if topology == "sequential" else tool_router
+
     graph = StateGraph(AgentState)
 
     # Add nodes
     graph.add_node("language_detect", language_detect)
-    graph.add_node("intent_router", intent_router)
-    graph.add_node("hr_agent", hr_agent)
-    graph.add_node("ewa_agent", ewa_agent)
+    graph.add_node("intent_router", router)
+    graph.add_node("hr_agent", _unit_of_work(hr_agent))
+    graph.add_node("ewa_agent", _unit_of_work(ewa_agent))
     graph.add_node("policy_rag", policy_rag)
     graph.add_node("response_format", response_format)
 
@@ -46,3 +98,55 @@ def build_graph() -> StateGraph:
     graph.add_edge("response_format", END)
 
     return graph.compile()
+
+
+def invoke_turn(graph, state: AgentState) -> dict:
+    """Run one user turn and log the queries it made.
+
+    The agent node's tool calls share one session, which commits when the
+    node finishes (before the response is generated) and rolls back
+    together on failure.
+
+    Args:
+        graph: Compiled graph from build_graph().
+        state: Initial state for the turn.
+
+    Returns:
+        Final graph state.
+    """
+    with track_queries() as stats:
+        result = graph.invoke(state)
+    logger.info(
+        "Turn used %d queries across %d sessions", stats.queries, stats.sessions
+    )
+    return result
+
+
+def stream_turn(graph, state: AgentState, on_token: Callable[[str], None]) -> dict:
+    """Run one user turn like invoke_turn(), passing on response tokens live.
+
+    Streams the graph in "custom" mode, where response_format writes each
+    piece of the response as it is generated, and "values" mode for the
+    final state. The agent node's tool calls have committed before the
+    first token, so no transaction or write lock stays open while the
+    response streams.
+
+    Args:
+        graph: Compiled graph from build_graph().
+        state: Initial state for the turn.
+        on_token: Called with each piece of the response, in order.
+
+    Returns:
+        Final graph state.
+    """
+    result: dict = {}
+    with track_queries() as stats:
+        for mode, chunk in graph.stream(state, stream_mode=["custom", "values"]):
+            if mode == "values":
+                result = chunk
+            elif isinstance(chunk, dict) and "token" in chunk:
+                on_token(chunk["token"])
+    logger.info(
+        "Turn used %d queries across %d sessions", stats.queries, stats.sessions
+    )
+    return result
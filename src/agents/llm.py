@@ -1,17 +1,403 @@
-"""Centralized LLM configuration for agent nodes."""
+"""Centralized LLM configuration for agent nodes.
 
+get_llm() hands out one long-lived ChatOllama per (model, max_tokens,
+format), so calls reuse the client's pooled keep-alive HTTP connections
+instead of opening a new connection per call. The connection pools live in
+httpx transports owned by this module, one for sync and one for async
+calls, so reset_clients() can close them. Connections per pool are capped
+by $JEM_LLM_MAX_CONNECTIONS; requests beyond the cap wait for a free
+connection.
+
+get_llm(cache=True) wraps the model in a response cache for prompts whose
+answer depends only on the prompt: intent, tool and language
+classification and argument extraction. Replies are keyed on the model,
+its parameters and the normalized prompt, held in an in-process LRU with a
+TTL and, when $JEM_LLM_CACHE_PATH is set, persisted to a SQLite file so
+they survive restarts. Free-form responses are never cached.
+"""
+
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import re
+import sqlite3
+import threading
+import time
+import unicodedata
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+import httpx
+from langchain_core.messages import AIMessage
 from langchain_ollama import ChatOllama
 
+from src.db.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
 MODEL_NAME = "llama3.1"
 
+# Response cache sizing, overridable per process; a TTL of 0 disables it
+CACHE_MAXSIZE_ENV_VAR = "JEM_LLM_CACHE_MAXSIZE"
+CACHE_TTL_ENV_VAR = "JEM_LLM_CACHE_TTL"
+CACHE_PATH_ENV_VAR = "JEM_LLM_CACHE_PATH"
+DEFAULT_CACHE_MAXSIZE = 10_000
+DEFAULT_CACHE_TTL = 86_400.0
+
+# HTTP connections per pooled client, and seconds an idle one is kept open
+MAX_CONNECTIONS_ENV_VAR = "JEM_LLM_MAX_CONNECTIONS"
+KEEPALIVE_ENV_VAR = "JEM_LLM_KEEPALIVE_SECONDS"
+DEFAULT_MAX_CONNECTIONS = 4
+DEFAULT_KEEPALIVE_SECONDS = 60.0
+
+# Pooled clients, keyed by (model, max_tokens, format), and the sync and
+# async transports holding their connections
+_clients: dict[tuple[str, int, str], ChatOllama] = {}
+_transports: dict[
+    tuple[str, int, str], tuple[httpx.HTTPTransport, httpx.AsyncHTTPTransport]
+] = {}
+_clients_lock = threading.Lock()
+
+_WHITESPACE = re.compile(r"\s+")
+# Closing punctuation of the quoted message that ends every cached prompt
+_TRAILING_PUNCTUATION = re.compile(r"[\s.?!]+(?=\"?$)")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    content TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    used_at REAL NOT NULL
+)
+"""
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Fold case, width and whitespace, and drop the message's final punctuation.
+
+    "How many leave days do I have?" and "how many leave days  do i have"
+    normalize to the same key.
+    """
+    text = unicodedata.normalize("NFKC", prompt).casefold()
+    text = _WHITESPACE.sub(" ", text).strip()
+    return _TRAILING_PUNCTUATION.sub("", text)
+
+
+def cache_key(model: str, params: dict, prompt: str) -> str:
+    """Return the cache key for a prompt sent to a model with params."""
+    payload = json.dumps(
+        [model, params, normalize_prompt(prompt)], sort_keys=True, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """LRU+TTL cache of model replies, optionally persisted to SQLite.
+
+    Lookups try memory first, then the SQLite file; replies found on disk
+    are promoted back into memory. The file holds at most maxsize entries,
+    the least recently used pruned first.
+
+    Args:
+        maxsize: Maximum entries in memory, and on disk.
+        ttl: Seconds a reply stays valid after it is stored. 0 disables
+             the cache.
+        path: SQLite file to persist replies to, or None for memory only.
+        clock: Wall-clock time source, injectable for testing.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = DEFAULT_CACHE_MAXSIZE,
+        ttl: float = DEFAULT_CACHE_TTL,
+        path: Optional[Path] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.ttl = ttl
+        self.path = Path(path) if path else None
+        self._clock = clock
+        self._memory = TTLCache("llm_responses", maxsize, ttl, clock)
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.disk_errors = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether replies are cached at all."""
+        return self.ttl > 0
+
+    def _count(self, counter: str) -> None:
+        """Increment one of the stats counters."""
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _connect(self) -> Optional[sqlite3.Connection]:
+        """Open the SQLite file on first use. Call with self._lock held."""
+        if self._conn is None and self.path is not None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(_SCHEMA)
+            self._conn.commit()
+        return self._conn
+
+    def _disk_get(self, key: str) -> Optional[tuple[float, str]]:
+        """Read a live entry from disk, marking it used."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return None
+            now = self._clock()
+            row = conn.execute(
+                "SELECT expires_at, content FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if row[0] <= now:
+                conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            else:
+                conn.execute(
+                    "UPDATE responses SET used_at = ? WHERE key = ?", (now, key)
+                )
+            conn.commit()
+            return row if row[0] > now else None
+
+    def _disk_set(self, key: str, expires_at: float, content: str) -> None:
+        """Write an entry to disk, pruning expired and excess entries."""
+        with self._lock:
+            conn = self._connect()
+            if conn is None:
+                return
+            now = self._clock()
+            conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?)",
+                (key, content, expires_at, now),
+            )
+            conn.execute("DELETE FROM responses WHERE expires_at <= ?", (now,))
+            conn.execute(
+                "DELETE FROM responses WHERE key IN (SELECT key FROM responses "
+                "ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self._memory.maxsize,),
+            )
+            conn.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached reply for key, or None on a miss."""
+        if not self.enabled:
+            return None
+        entry = self._memory.get(key)
+        # Entries promoted from disk keep their original expiry
+        if entry is not None and entry[0] <= self._clock():
+            self._memory.invalidate(key)
+            entry = None
+        if entry is None:
+            try:
+                entry = self._disk_get(key)
+            except sqlite3.Error:
+                self._count("disk_errors")
+                logger.exception("LLM cache read failed: %s", self.path)
+            if entry is None:
+                self._count("misses")
+                return None
+            self._count("disk_hits")
+            self._memory.set(key, entry)
+        self._count("hits")
+        return entry[1]
+
+    def set(self, key: str, content: str) -> None:
+        """Store a reply under key, in memory and on disk."""
+        if not self.enabled:
+            return
+        entry = (self._clock() + self.ttl, content)
+        self._memory.set(key, entry)
+        try:
+            self._disk_set(key, *entry)
+        except sqlite3.Error:
+            self._count("disk_errors")
+            logger.exception("LLM cache write failed: %s", self.path)
+
+    def clear(self) -> None:
+        """Drop every entry, in memory and on disk. Counters are kept."""
+        self._memory.clear()
+        with self._lock:
+            conn = self._connect()
+            if conn is not None:
+                conn.execute("DELETE FROM responses")
+                conn.commit()
+
+    def stats(self) -> dict:
+        """Return counters and current size for monitoring.
+
+        hits includes the disk_hits answered from the SQLite file.
+        """
+        lookups = self.hits + self.misses
+        memory = self._memory.stats()
+        return {
+            "size": memory["size"],
+            "maxsize": memory["maxsize"],
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "disk_hits": self.disk_hits,
+            "disk_errors": self.disk_errors,
+            "evictions": memory["evictions"],
+            "path": str(self.path) if self.path else None,
+        }
+
+
+class CachedLLM:
+    """Chat model wrapper that answers repeated prompts from a ResponseCache.
+
+    Args:
+        llm: Model to call on a miss.
+        model: Model name, part of the cache key.
+        params: Generation parameters, part of the cache key.
+        cache: Cache to use. Defaults to the process-wide response_cache.
+    """
+
+    def __init__(
+        self,
+        llm: Any,
+        model: str,
+        params: dict,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        self.llm = llm
+        self.model = model
+        self.params = params
+        self.cache = cache if cache is not None else response_cache
+
+    def invoke(self, prompt: str) -> AIMessage:
+        """Return the cached reply to prompt, calling the model on a miss."""
+        key = cache_key(self.model, self.params, prompt)
+        content = self.cache.get(key)
+        if content is not None:
+            return AIMessage(content=content)
+        response = self.llm.invoke(prompt)
+        if isinstance(response.content, str):
+            self.cache.set(key, response.content)
+        return response
+
+
+def _cache_from_env() -> ResponseCache:
+    """Build the response cache from the environment."""
+    maxsize = int(os.environ.get(CACHE_MAXSIZE_ENV_VAR) or DEFAULT_CACHE_MAXSIZE)
+    ttl = os.environ.get(CACHE_TTL_ENV_VAR)
+    path = os.environ.get(CACHE_PATH_ENV_VAR)
+    return ResponseCache(
+        maxsize,
+        DEFAULT_CACHE_TTL if ttl in (None, "") else float(ttl),
+        Path(path) if path else None,
+    )
+
+
+response_cache = _cache_from_env()
+
+
+def _client_limits() -> httpx.Limits:
+    """Read the HTTP connection pool limits from the environment."""
+    connections = int(
+        os.environ.get(MAX_CONNECTIONS_ENV_VAR) or DEFAULT_MAX_CONNECTIONS
+    )
+    keepalive = float(os.environ.get(KEEPALIVE_ENV_VAR) or DEFAULT_KEEPALIVE_SECONDS)
+    return httpx.Limits(
+        max_connections=connections,
+        max_keepalive_connections=connections,
+        keepalive_expiry=keepalive,
+    )
+
+
+def get_client(max_tokens: int = 500, format: Optional[Any] = None) -> ChatOllama:
+    """Return the pooled ChatOllama for these parameters, creating it once.
+
+    Safe to call from any thread and from coroutines: the lookup never
+    awaits, and the lock is held only to create a missing client.
+
+    Args:
+        max_tokens: Maximum tokens for response.
+        format: Optional output constraint passed to Ollama.
+
+    Returns:
+        ChatOllama instance shared by every caller with the same parameters.
+    """
+    key = (MODEL_NAME, max_tokens, json.dumps(format, sort_keys=True))
+    client = _clients.get(key)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            limits = _client_limits()
+            transports = (
+                httpx.HTTPTransport(limits=limits),
+                httpx.AsyncHTTPTransport(limits=limits),
+            )
+            client = ChatOllama(
+                model=MODEL_NAME,
+                num_predict=max_tokens,
+                format=format,
+                sync_client_kwargs={"transport": transports[0]},
+                async_client_kwargs={"transport": transports[1]},
+            )
+            _clients[key] = client
+            _transports[key] = transports
+            logger.debug("Created LLM client: %s", key)
+        return client
+
+
+def _drop_clients() -> list[tuple[httpx.HTTPTransport, httpx.AsyncHTTPTransport]]:
+    """Forget every pooled client, returning the transports to close."""
+    with _clients_lock:
+        transports = list(_transports.values())
+        _clients.clear()
+        _transports.clear()
+    return transports
+
+
+def reset_clients() -> None:
+    """Close and drop every pooled client, sync and async. Used for testing.
+
+    Runs the async close in its own event loop, so call it from synchronous
+    code; coroutines await reset_async_clients() instead.
+    """
+    for sync_transport, async_transport in _drop_clients():
+        sync_transport.close()
+        asyncio.run(async_transport.aclose())
+
+
+async def reset_async_clients() -> None:
+    """Close and drop every pooled client from a coroutine. Used for testing."""
+    for sync_transport, async_transport in _drop_clients():
+        sync_transport.close()
+        await async_transport.aclose()
+
 
-def get_llm(max_tokens: int = 500) -> ChatOllama:
+def get_llm(
+    max_tokens: int = 500, format: Optional[Any] = None, cache: bool = False
+) -> Any:
     """Get the LLM instance for agent nodes.
 
     Args:
         max_tokens: Maximum tokens for response.
+        format: Optional output constraint passed to Ollama: "json", or a
+                JSON schema dict the response must validate against.
+        cache: Answer repeated prompts from response_cache. Only for
+               classification and extraction prompts, whose reply should
+               not change between calls.
 
     Returns:
-        ChatOllama instance.
+        The pooled ChatOllama from get_client(), wrapped in a CachedLLM if
+        cache is set.
     """
-    return ChatOllama(model=MODEL_NAME, num_predict=max_tokens)
+    llm = get_client(max_tokens, format)
+    if cache:
+        return CachedLLM(
+            llm, MODEL_NAME, {"num_predict": max_tokens, "format": format}
+        )
+    return llm
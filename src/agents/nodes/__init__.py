@@ -6,6 +6,7 @@ from .intent_router import intent_router, route_by_intent
 from .language_detect import language_detect
 from .policy_rag import policy_rag
 from .response_format import response_format
+from .tool_router import tool_router
 
 __all__ = [
     "ewa_agent",
@@ -15,4 +16,5 @@ __all__ = [
     "policy_rag",
     "response_format",
     "route_by_intent",
+    "tool_router",
 ]
@@ -1,13 +1,50 @@
 """EWA agent node for LangGraph."""
 
 import logging
+from typing import Optional
 
 from src.agents.llm import get_llm
 from src.agents.state import AgentState
 from src.mcp_server.tools.ewa_tools import check_ewa_eligibility, request_ewa_advance
 
+from .slot_filler import fill_tool_args
+
 logger = logging.getLogger(__name__)
 
+EWA_TOOLS = ("check_ewa_eligibility", "request_ewa_advance")
+
+# Advance requested when the message names no amount
+DEFAULT_ADVANCE_CAP = 1500
+
+
+def _run_ewa_tool(
+    tool_name: str, employee_id: str, amount: Optional[float] = None
+) -> dict:
+    """Call an EWA tool by name.
+
+    Args:
+        tool_name: "request_ewa_advance" requests an advance; anything else
+                   checks eligibility.
+        employee_id: Employee ID.
+        amount: Requested amount in Rands. Defaults to the available amount,
+                capped at DEFAULT_ADVANCE_CAP.
+
+    Returns:
+        Tool result dict.
+    """
+    if tool_name != "request_ewa_advance":
+        return check_ewa_eligibility(employee_id)
+
+    if amount is not None:
+        return request_ewa_advance(employee_id, amount)
+
+    # Check eligibility first to get available amount
+    eligibility = check_ewa_eligibility(employee_id)
+    if eligibility["success"] and eligibility["data"].get("eligible"):
+        available = eligibility["data"]["available"]
+        return request_ewa_advance(employee_id, min(available, DEFAULT_ADVANCE_CAP))
+    return eligibility
+
 
 def _call_ewa_tool(message: str, employee_id: str) -> dict:
     """Determine and call the appropriate EWA tool.
@@ -19,29 +56,26 @@ def _call_ewa_tool(message: str, employee_id: str) -> dict:
     Returns:
         Tool result dict.
     """
-    llm = get_llm(max_tokens=20)
+    llm = get_llm(max_tokens=20, cache=True)
     response = llm.invoke(
         f"Does this message request an EWA advance or just check eligibility? "
         f"Respond with ONLY: 'check' or 'request'\n"
         f"Message: \"{message}\""
     )
     action = response.content.strip().lower()
-
     if "request" in action:
-        # Check eligibility first to get available amount
-        eligibility = check_ewa_eligibility(employee_id)
-        if eligibility["success"] and eligibility["data"].get("eligible"):
-            available = eligibility["data"]["available"]
-            # Default to available amount if no specific amount mentioned
-            return request_ewa_advance(employee_id, min(available, 1500))
-        return eligibility
-    else:
-        return check_ewa_eligibility(employee_id)
+        args = fill_tool_args("request_ewa_advance", message)
+        return _run_ewa_tool("request_ewa_advance", employee_id, args.get("amount"))
+    return _run_ewa_tool("check_ewa_eligibility", employee_id)
 
 
 def ewa_agent(state: AgentState) -> dict:
     """Process EWA requests by calling appropriate tools.
 
+    Uses the tool call chosen by tool_router or the keyword fast path when
+    present, otherwise asks the LLM which tool to call. The advance amount
+    is extracted from the message.
+
     Args:
         state: Current agent state.
 
@@ -51,7 +85,13 @@ def ewa_agent(state: AgentState) -> dict:
     try:
         message = state["messages"][-1].content
         employee_id = state["employee_id"]
-        result = _call_ewa_tool(message, employee_id)
+        tool_call = state.get("tool_call")
+        if tool_call and tool_call["name"] in EWA_TOOLS:
+            tool_name = tool_call["name"]
+            args = fill_tool_args(tool_name, message, tool_call["args"])
+            result = _run_ewa_tool(tool_name, employee_id, args.get("amount"))
+        else:
+            result = _call_ewa_tool(message, employee_id)
         return {"tool_results": result}
     except Exception:
         logger.exception("EWA agent error")
@@ -1,6 +1,7 @@
 """HR agent node for LangGraph."""
 
 import logging
+from typing import Optional
 
 from src.agents.llm import get_llm
 from src.agents.state import AgentState
@@ -11,8 +12,59 @@ from src.mcp_server.tools.hr_tools import (
     submit_leave_request,
 )
 
+from .slot_filler import fill_tool_args
+
 logger = logging.getLogger(__name__)
 
+HR_TOOLS = ("get_employee", "get_leave_balance", "get_payslip", "submit_leave_request")
+
+# Arguments used when the message does not supply them. Leave dates have
+# no default: a booking without them asks the employee instead.
+DEFAULT_LEAVE_TYPE = "annual"
+DEFAULT_PAYSLIP_MONTH = "2026-02"
+
+MISSING_DATES_RESPONSE = {
+    "success": False,
+    "error": (
+        "Which dates would you like to take leave? Please give the first day, "
+        "and the last day if it is more than one."
+    ),
+    "code": "MISSING_DATES",
+}
+
+
+def _run_hr_tool(tool_name: str, employee_id: str, args: Optional[dict] = None) -> dict:
+    """Call an HR tool by name, filling missing arguments with defaults.
+
+    A leave request without a start date is not submitted; the result asks
+    for the dates instead.
+
+    Args:
+        tool_name: One of HR_TOOLS; anything else reads the leave balance.
+        employee_id: Employee ID.
+        args: Optional extracted arguments: start_date, end_date,
+              leave_type, month.
+
+    Returns:
+        Tool result dict.
+    """
+    args = args or {}
+    if tool_name == "submit_leave_request":
+        if not args.get("start_date"):
+            return dict(MISSING_DATES_RESPONSE)
+        return submit_leave_request(
+            employee_id,
+            args["start_date"],
+            args.get("end_date") or args["start_date"],
+            args.get("leave_type") or DEFAULT_LEAVE_TYPE,
+        )
+    elif tool_name == "get_payslip":
+        return get_payslip(employee_id, args.get("month") or DEFAULT_PAYSLIP_MONTH)
+    elif tool_name == "get_employee":
+        return get_employee(employee_id)
+    else:
+        return get_leave_balance(employee_id)
+
 
 def _call_hr_tool(message: str, employee_id: str) -> dict:
     """Determine and call the appropriate HR tool.
@@ -24,29 +76,23 @@ def _call_hr_tool(message: str, employee_id: str) -> dict:
     Returns:
         Tool result dict.
     """
-    llm = get_llm(max_tokens=20)
+    llm = get_llm(max_tokens=20, cache=True)
     response = llm.invoke(
         f"Which HR tool should be called? Respond with ONLY the tool name.\n"
         f"Tools: get_employee, get_leave_balance, get_payslip, submit_leave_request\n"
         f"Message: \"{message}\""
     )
     tool_name = response.content.strip().lower()
-
-    if tool_name == "submit_leave_request":
-        return submit_leave_request(employee_id, "annual", "2026-03-01", "2026-03-03")
-    elif tool_name == "get_leave_balance":
-        return get_leave_balance(employee_id)
-    elif tool_name == "get_payslip":
-        return get_payslip(employee_id, "2026-02")
-    elif tool_name == "get_employee":
-        return get_employee(employee_id)
-    else:
-        return get_leave_balance(employee_id)
+    return _run_hr_tool(tool_name, employee_id, fill_tool_args(tool_name, message))
 
 
 def hr_agent(state: AgentState) -> dict:
     """Process HR queries by calling appropriate tools.
 
+    Uses the tool call chosen by tool_router or the keyword fast path when
+    present, otherwise asks the LLM which tool to call. Arguments are
+    extracted from the message.
+
     Args:
         state: Current agent state.
 
@@ -56,7 +102,13 @@ def hr_agent(state: AgentState) -> dict:
     try:
         message = state["messages"][-1].content
         employee_id = state["employee_id"]
-        result = _call_hr_tool(message, employee_id)
+        tool_call = state.get("tool_call")
+        if tool_call and tool_call["name"] in HR_TOOLS:
+            tool_name = tool_call["name"]
+            args = fill_tool_args(tool_name, message, tool_call["args"])
+            result = _run_hr_tool(tool_name, employee_id, args)
+        else:
+            result = _call_hr_tool(message, employee_id)
         return {"tool_results": result}
     except Exception:
         logger.exception("HR agent error")
@@ -1,14 +1,59 @@
 """Intent classification and routing node for LangGraph."""
 
 import logging
+import os
+from typing import Optional
 
 from src.agents.llm import get_llm
 from src.agents.state import AgentState
+from src.i18n.intents import match_intent
+from src.i18n.slots import extract_slots
+from src.mcp_server.tools.ewa_tools import DEMO_TODAY
 
 logger = logging.getLogger(__name__)
 
 VALID_INTENTS = {"hr_query", "ewa_request", "policy_question"}
 
+# Keyword matches at least this confident skip the LLM; 1 disables the
+# fast path
+FAST_ROUTE_ENV_VAR = "JEM_FAST_ROUTE_CONFIDENCE"
+DEFAULT_FAST_ROUTE_CONFIDENCE = 0.6
+
+# Tools that move money or book leave, and the arguments the message must
+# state before keywords alone may call them. Otherwise the fast path sets
+# only the intent and the LLM chooses the tool.
+WRITE_TOOL_ARGS = {
+    "request_ewa_advance": ("amount",),
+    "submit_leave_request": ("start_date",),
+}
+
+
+def fast_route(text: str) -> Optional[dict]:
+    """Route a message from keyword matches alone, when they are confident.
+
+    Args:
+        text: User message text.
+
+    Returns:
+        State update with intent and tool_call (None when the keywords
+        settle the intent but not the tool, or pick a write tool whose
+        arguments the message does not state), or None to ask the LLM.
+    """
+    threshold = float(
+        os.environ.get(FAST_ROUTE_ENV_VAR) or DEFAULT_FAST_ROUTE_CONFIDENCE
+    )
+    match = match_intent(text)
+    if match["intent"] is None or match["confidence"] < threshold:
+        return None
+    tool_call = None
+    if match["tool"] and match["tool_confidence"] >= threshold:
+        tool_call = {"name": match["tool"], "args": {}}
+    if tool_call and tool_call["name"] in WRITE_TOOL_ARGS:
+        slots = extract_slots(text, DEMO_TODAY)
+        if not all(name in slots for name in WRITE_TOOL_ARGS[tool_call["name"]]):
+            tool_call = None
+    return {"intent": match["intent"], "tool_call": tool_call}
+
 
 def _classify_intent(text: str) -> str:
     """Classify user intent using Claude API.
@@ -19,7 +64,7 @@ def _classify_intent(text: str) -> str:
     Returns:
         One of: hr_query, ewa_request, policy_question.
     """
-    llm = get_llm(max_tokens=20)
+    llm = get_llm(max_tokens=20, cache=True)
     response = llm.invoke(
         f"Classify this HR employee message into exactly one category. "
         f"Respond with ONLY the category name.\n"
@@ -38,14 +83,22 @@ def _classify_intent(text: str) -> str:
 def intent_router(state: AgentState) -> dict:
     """Classify intent from the latest user message.
 
+    Confident keyword matches are routed without an LLM call, and also
+    select the tool when they single one out.
+
     Args:
         state: Current agent state.
 
     Returns:
-        State update with classified intent.
+        State update with classified intent, and tool_call if the fast
+        path chose one.
     """
     try:
         last_message = state["messages"][-1].content
+        route = fast_route(last_message)
+        if route is not None:
+            logger.info("Fast-routed: %s %s", route["intent"], route["tool_call"])
+            return route
         intent = _classify_intent(last_message)
         logger.info("Classified intent: %s", intent)
         return {"intent": intent}
@@ -26,7 +26,7 @@ def _detect_language(text: str) -> str:
         return detected
 
     # Fall back to LLM for ambiguous cases
-    llm = get_llm(max_tokens=10)
+    llm = get_llm(max_tokens=10, cache=True)
     response = llm.invoke(
         f"Detect the language of this text and respond with ONLY the ISO 639-1 "
         f"code (en, zu, xh, af, nso, st): \"{text}\""
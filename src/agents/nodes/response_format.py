@@ -1,7 +1,18 @@
-"""Response formatting node for LangGraph."""
+"""Response formatting node for LangGraph.
+
+The response is generated with llm.stream() and each piece is sent to
+LangGraph's "custom" stream as {"token": text}, so callers of
+graph.stream() can show it as it is written (see stream_turn()). Replies
+in other languages are translated one finished sentence at a time and
+streamed per sentence.
+"""
 
 import json
 import logging
+import re
+from typing import Callable, Optional
+
+from langgraph.config import get_stream_writer
 
 from src.agents.llm import get_llm
 from src.agents.state import AgentState
@@ -10,20 +21,77 @@ from src.i18n.translator import translate
 
 logger = logging.getLogger(__name__)
 
+# Whitespace after a sentence's closing punctuation, kept when splitting
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])(\s+)")
+
+
+def _token_writer() -> Callable[[str], None]:
+    """Return a function sending a token to the graph's custom stream.
+
+    A no-op when the graph is not streamed or the node runs outside a graph.
+    """
+    try:
+        writer = get_stream_writer()
+    except RuntimeError:
+        return lambda token: None
+    return lambda token: writer({"token": token})
+
+
+class _SentenceTranslator:
+    """Translate streamed English text one finished sentence at a time.
+
+    Args:
+        target: NLLB code of the language to translate into.
+        on_text: Called with each translated sentence and the whitespace
+                 that followed it.
+    """
+
+    def __init__(self, target: str, on_text: Callable[[str], None]) -> None:
+        self.target = target
+        self.on_text = on_text
+        self.parts: list[str] = []
+        self._pending = ""
+
+    def feed(self, token: str) -> None:
+        """Add generated text, translating every sentence it completes."""
+        pieces = _SENTENCE_BREAK.split(self._pending + token)
+        self._pending = pieces.pop()
+        for sentence, space in zip(pieces[::2], pieces[1::2]):
+            self._emit(sentence, space)
+
+    def finish(self) -> str:
+        """Translate the last sentence and return the whole translation."""
+        if self._pending.strip():
+            self._emit(self._pending.strip(), "")
+        self._pending = ""
+        return "".join(self.parts).strip()
+
+    def _emit(self, sentence: str, space: str) -> None:
+        """Translate one sentence and pass it on."""
+        text = translate(sentence, "eng_Latn", self.target) + space
+        self.parts.append(text)
+        self.on_text(text)
+
 
-def _format_response(tool_results: dict, language: str, query: str) -> str:
+def _format_response(
+    tool_results: dict,
+    language: str,
+    query: str,
+    on_token: Optional[Callable[[str], None]] = None,
+) -> str:
     """Format tool results into a natural language response.
 
     Args:
         tool_results: Results from tool execution.
         language: Detected language code.
         query: Original user query.
+        on_token: Called with each piece of the response as it is generated.
 
     Returns:
         Formatted natural language response.
     """
     llm = get_llm(max_tokens=500)
-    response = llm.invoke(
+    chunks = llm.stream(
         f"Generate a helpful, concise response to the employee's question "
         f"based on these tool results. Respond in English.\n\n"
         f"Rules:\n"
@@ -34,7 +102,16 @@ def _format_response(tool_results: dict, language: str, query: str) -> str:
         f"Tool results: {json.dumps(tool_results)}\n\n"
         f"Response:"
     )
-    return response.content.strip()
+    parts = []
+    for chunk in chunks:
+        token = chunk.content
+        if not parts:
+            token = token.lstrip()
+        if token:
+            parts.append(token)
+            if on_token is not None:
+                on_token(token)
+    return "".join(parts).strip()
 
 
 def response_format(state: AgentState) -> dict:
@@ -54,12 +131,15 @@ def response_format(state: AgentState) -> dict:
         language = state.get("language", "en")
         query = state["messages"][-1].content
 
-        formatted = _format_response(tool_results, language, query)
+        write = _token_writer()
 
-        # Translate to user's language if not English
-        if language != "en":
-            nllb_target = iso_to_nllb(language)
-            formatted = translate(formatted, "eng_Latn", nllb_target)
+        if language == "en":
+            formatted = _format_response(tool_results, language, query, write)
+        else:
+            # Translate to user's language sentence by sentence as it streams
+            translator = _SentenceTranslator(iso_to_nllb(language), write)
+            _format_response(tool_results, language, query, translator.feed)
+            formatted = translator.finish()
 
         return {"response": formatted}
     except Exception:
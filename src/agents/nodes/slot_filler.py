@@ -0,0 +1,108 @@
+"""Tool argument filling for the HR and EWA agent nodes.
+
+Arguments come from the local slot extractor first; the LLM is asked only
+when extraction fails, so most tool calls cost no extra model call.
+"""
+
+import json
+import logging
+from typing import Optional
+
+from src.agents.llm import get_llm
+from src.i18n.slots import clean_slots, extract_slots
+from src.mcp_server.tools.ewa_tools import DEMO_TODAY
+
+logger = logging.getLogger(__name__)
+
+# Arguments each tool takes from the message
+TOOL_ARGS = {
+    "submit_leave_request": ("start_date", "end_date", "leave_type"),
+    "get_payslip": ("month",),
+    "request_ewa_advance": ("amount",),
+}
+
+# Arguments a tool cannot do without; other arguments have defaults
+REQUIRED_ARGS = {"submit_leave_request": ("start_date",)}
+
+_ARG_SCHEMAS = {
+    "start_date": {"type": "string"},
+    "end_date": {"type": "string"},
+    "leave_type": {"type": "string", "enum": ["annual", "sick", "family"]},
+    "month": {"type": "string"},
+    "amount": {"type": "number"},
+}
+
+
+def _extract_with_llm(message: str, names: tuple[str, ...]) -> dict:
+    """Ask the LLM for tool arguments the extractor could not find.
+
+    Args:
+        message: User message.
+        names: Arguments to extract.
+
+    Returns:
+        The valid arguments found.
+    """
+    schema = {
+        "type": "object",
+        "properties": {name: _ARG_SCHEMAS[name] for name in names},
+    }
+    llm = get_llm(max_tokens=60, format=schema, cache=True)
+    response = llm.invoke(
+        f"Extract these values from the message if it states them: "
+        f"{', '.join(names)}. Dates as YYYY-MM-DD, month as YYYY-MM, amount "
+        f"in Rands. Today is {DEMO_TODAY.isoformat()}. Respond with JSON "
+        f"only.\n\n"
+        f"Message: \"{message}\""
+    )
+    try:
+        payload = json.loads(response.content)
+    except (TypeError, ValueError):
+        return {}
+    return clean_slots(payload) if isinstance(payload, dict) else {}
+
+
+def _needs_llm(tool_name: str, message: str, args: dict) -> bool:
+    """Return whether extraction failed for a tool call.
+
+    It failed if a required argument is missing, or if the message has
+    digits but none of them became an argument.
+    """
+    if any(name not in args for name in REQUIRED_ARGS.get(tool_name, ())):
+        return True
+    return not args and any(char.isdigit() for char in message)
+
+
+def fill_tool_args(tool_name: str, message: str, args: Optional[dict] = None) -> dict:
+    """Fill a tool call's arguments from the message.
+
+    Extracted values override args, which may come from the routing LLM
+    call. The LLM is asked only when extraction fails; arguments still
+    missing after that are left to the tool's defaults. Relative dates
+    count from DEMO_TODAY, the date the tools work from.
+
+    Args:
+        tool_name: Tool to be called.
+        message: User message.
+        args: Arguments already chosen for the call.
+
+    Returns:
+        Arguments for the tool, limited to the ones it takes.
+    """
+    names = TOOL_ARGS.get(tool_name, ())
+    if not names:
+        return {}
+    filled = {
+        name: value
+        for name, value in {
+            **(args or {}),
+            **extract_slots(message, DEMO_TODAY),
+        }.items()
+        if name in names
+    }
+    if _needs_llm(tool_name, message, filled):
+        missing = tuple(name for name in names if name not in filled)
+        found = _extract_with_llm(message, missing)
+        logger.info("Slot extraction fell back to LLM for %s: %s", tool_name, found)
+        filled.update({name: found[name] for name in missing if name in found})
+    return filled
@@ -0,0 +1,140 @@
+"""Combined intent classification and tool selection node for LangGraph.
+
+One schema-constrained LLM call names the tool to call and its arguments,
+replacing the separate intent_router call and the agent's own
+tool-selection call. The intent is the one the chosen tool belongs to.
+"""
+
+import json
+import logging
+
+from src.agents.llm import get_llm
+from src.agents.state import AgentState
+from src.i18n.slots import clean_slots
+
+from .ewa_agent import EWA_TOOLS
+from .hr_agent import HR_TOOLS
+from .intent_router import VALID_INTENTS, fast_route
+
+logger = logging.getLogger(__name__)
+
+POLICY_TOOL = "search_policies"
+
+# Tools each intent may call, default first. Every tool belongs to exactly
+# one intent, so the model only names the tool and the intent follows.
+INTENT_TOOLS = {
+    "hr_query": ("get_leave_balance",)
+    + tuple(tool for tool in HR_TOOLS if tool != "get_leave_balance"),
+    "ewa_request": EWA_TOOLS,
+    "policy_question": (POLICY_TOOL,),
+}
+TOOL_INTENTS = {
+    tool: intent for intent, tools in INTENT_TOOLS.items() for tool in tools
+}
+
+ROUTER_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "tool": {"type": "string", "enum": sorted(TOOL_INTENTS)},
+        "args": {
+            "type": "object",
+            "properties": {
+                "start_date": {"type": "string"},
+                "end_date": {"type": "string"},
+                "leave_type": {"type": "string"},
+                "month": {"type": "string"},
+                "amount": {"type": "number"},
+            },
+        },
+    },
+    "required": ["tool", "args"],
+}
+
+
+def _route_and_select(text: str) -> dict:
+    """Classify intent and choose a tool and its arguments in one LLM call.
+
+    Args:
+        text: User message text.
+
+    Returns:
+        Dict with "intent" (one of VALID_INTENTS) and "tool_call"
+        ({"name", "args"}).
+    """
+    llm = get_llm(max_tokens=80, format=ROUTER_SCHEMA, cache=True)
+    response = llm.invoke(
+        f"Route this HR employee message to one tool. Respond with JSON only.\n"
+        f"tool:\n"
+        f"- get_leave_balance, get_payslip, get_employee: leave, pay, profile\n"
+        f"- submit_leave_request: booking time off\n"
+        f"- check_ewa_eligibility, request_ewa_advance: earned wage access, "
+        f"salary advance, early pay\n"
+        f"- search_policies: company policy, rules, regulations, entitlements\n"
+        f"args: only values stated in the message - start_date and end_date "
+        f"(YYYY-MM-DD), leave_type (annual, sick, family), month (YYYY-MM), "
+        f"amount (Rands)\n\n"
+        f"Message: \"{text}\""
+    )
+    return parse_route(response.content)
+
+
+def parse_route(content: str) -> dict:
+    """Validate the router's JSON, falling back to safe defaults.
+
+    Args:
+        content: Raw model output.
+
+    Returns:
+        Dict with "intent" and "tool_call" ({"name", "args"}).
+    """
+    try:
+        payload = json.loads(content)
+    except (TypeError, ValueError):
+        payload = {}
+    if not isinstance(payload, dict):
+        payload = {}
+
+    tool = str(payload.get("tool", "")).strip()
+    if tool in TOOL_INTENTS:
+        intent = TOOL_INTENTS[tool]
+    else:
+        # Unknown tool: honour an explicit intent if the model gave one
+        intent = str(payload.get("intent", "")).strip().lower()
+        if intent not in VALID_INTENTS:
+            intent = "hr_query"
+        tool = INTENT_TOOLS[intent][0]
+
+    raw_args = payload.get("args")
+    args = clean_slots(raw_args if isinstance(raw_args, dict) else {})
+    return {"intent": intent, "tool_call": {"name": tool, "args": args}}
+
+
+def tool_router(state: AgentState) -> dict:
+    """Classify intent and select the tool call from the latest user message.
+
+    Confident keyword matches are routed without an LLM call; if they
+    settle the intent but not the tool, the agent node picks the tool.
+
+    Args:
+        state: Current agent state.
+
+    Returns:
+        State update with intent and tool_call.
+    """
+    try:
+        last_message = state["messages"][-1].content
+        route = fast_route(last_message)
+        if route is not None:
+            logger.info("Fast-routed: %s %s", route["intent"], route["tool_call"])
+            return route
+        route = _route_and_select(last_message)
+        logger.info(
+            "Routed: %s -> %s %s",
+            route["intent"],
+            route["tool_call"]["name"],
+            route["tool_call"]["args"],
+        )
+        return route
+    except Exception:
+        logger.exception("Tool routing failed, defaulting to hr_query")
+        return {"intent": "hr_query", "tool_call": None}
@@ -14,6 +14,7 @@ class AgentState(TypedDict):
     employee_id: Optional[str]
     employee: Optional[dict]
     intent: str
+    tool_call: Optional[dict]
     tool_results: dict
     response: str
     error: Optional[str]
@@ -35,6 +36,7 @@ def create_initial_state(employee_id: str, message: str) -> AgentState:
         employee_id=employee_id,
         employee=None,
         intent="",
+        tool_call=None,
         tool_results={},
         response="",
         error=None,
@@ -0,0 +1,197 @@
+"""Deterministic local stand-in for the Ollama model, for benchmarks and tests.
+
+StubChatModel answers every prompt the agent nodes send with a fixed rule
+of thumb and sleeps to mimic model latency (a prefill delay plus a delay
+per generated token), so graph topologies can be compared without a
+running model.
+
+Example:
+    with use_llm(StubLLMFactory(prefill_ms=100)) as factory:
+        invoke_turn(build_graph(), state)
+    factory.calls  # prompts sent, in order
+"""
+
+import json
+import re
+import time
+from contextlib import ExitStack, contextmanager
+from typing import Any, Callable, Iterator, Optional
+from unittest.mock import patch
+
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from src.agents.llm import CachedLLM, ResponseCache
+
+# Node modules that import get_llm
+NODE_MODULES = (
+    "language_detect",
+    "intent_router",
+    "tool_router",
+    "hr_agent",
+    "ewa_agent",
+    "slot_filler",
+    "response_format",
+)
+
+_QUOTED = re.compile(r'"([^"]*)"\s*$')
+
+
+def _message(prompt: str) -> str:
+    """Extract the quoted user message at the end of a node's prompt."""
+    match = _QUOTED.search(prompt)
+    return (match.group(1) if match else prompt).lower()
+
+
+def _intent(message: str) -> str:
+    """Classify a message the way the model is expected to."""
+    if any(word in message for word in ("advance", "ewa", "early pay", "borrow")):
+        return "ewa_request"
+    if any(word in message for word in ("policy", "rule", "allowed", "entitle")):
+        return "policy_question"
+    return "hr_query"
+
+
+def _hr_tool(message: str) -> str:
+    """Pick the HR tool the model is expected to choose."""
+    if "payslip" in message or "salary" in message:
+        return "get_payslip"
+    if any(word in message for word in ("book", "take", "apply", "submit")):
+        return "submit_leave_request"
+    if "profile" in message or "details" in message:
+        return "get_employee"
+    return "get_leave_balance"
+
+
+def _ewa_action(message: str) -> str:
+    """Answer the EWA check-or-request question."""
+    if any(word in message for word in ("eligible", "can i", "how much")):
+        return "check"
+    return "request"
+
+
+def stub_reply(prompt: str) -> str:
+    """Return the reply StubChatModel gives to one of the nodes' prompts."""
+    if prompt.startswith("Detect the language"):
+        return "en"
+    message = _message(prompt)
+    if prompt.startswith("Classify this HR"):
+        return _intent(message)
+    if prompt.startswith("Which HR tool"):
+        return _hr_tool(message)
+    if prompt.startswith("Does this message request an EWA"):
+        return _ewa_action(message)
+    if prompt.startswith("Route this HR"):
+        intent = _intent(message)
+        if intent == "ewa_request" and _ewa_action(message) == "request":
+            tool = "request_ewa_advance"
+        elif intent == "ewa_request":
+            tool = "check_ewa_eligibility"
+        elif intent == "policy_question":
+            tool = "search_policies"
+        else:
+            tool = _hr_tool(message)
+        return json.dumps({"tool": tool, "args": {}})
+    if prompt.startswith("Extract these values"):
+        return "{}"
+    return "Here is the information you asked for, based on your HR records."
+
+
+class StubChatModel:
+    """ChatOllama look-alike with deterministic replies and simulated latency.
+
+    Args:
+        prefill_ms: Delay before the first token.
+        ms_per_token: Delay per generated token (about four characters).
+        max_tokens: Generation cap, as get_llm() passes it.
+        format: Accepted for signature compatibility; ignored.
+        calls: Shared list every prompt is appended to.
+    """
+
+    def __init__(
+        self,
+        prefill_ms: float = 0.0,
+        ms_per_token: float = 0.0,
+        max_tokens: int = 500,
+        format: Optional[Any] = None,
+        calls: Optional[list[str]] = None,
+    ) -> None:
+        self.prefill_ms = prefill_ms
+        self.ms_per_token = ms_per_token
+        self.max_tokens = max_tokens
+        self.format = format
+        self.calls = calls if calls is not None else []
+
+    def _tokens(self, prompt: str) -> list[str]:
+        """Split the reply into roughly four-character tokens."""
+        self.calls.append(prompt)
+        reply = stub_reply(prompt)
+        tokens = [reply[i : i + 4] for i in range(0, len(reply), 4)]
+        return tokens[: self.max_tokens]
+
+    def invoke(self, prompt: str) -> AIMessage:
+        """Return the whole reply after prefill and generation delays."""
+        tokens = self._tokens(prompt)
+        time.sleep((self.prefill_ms + self.ms_per_token * len(tokens)) / 1000)
+        return AIMessage(content="".join(tokens))
+
+    def stream(self, prompt: str) -> Iterator[AIMessageChunk]:
+        """Yield the reply token by token, each after its generation delay."""
+        tokens = self._tokens(prompt)
+        time.sleep(self.prefill_ms / 1000)
+        for token in tokens:
+            time.sleep(self.ms_per_token / 1000)
+            yield AIMessageChunk(content=token)
+
+
+class StubLLMFactory:
+    """get_llm() replacement returning StubChatModels that share a call log.
+
+    Models requested with cache=True are wrapped like get_llm() wraps them,
+    but in the factory's own ResponseCache, so replies cached under one
+    factory never leak into another.
+
+    Args:
+        prefill_ms: Delay before the first token of every call.
+        ms_per_token: Delay per generated token.
+        cache: Response cache for cache=True models. Defaults to a new
+               in-memory cache.
+    """
+
+    def __init__(
+        self,
+        prefill_ms: float = 0.0,
+        ms_per_token: float = 0.0,
+        cache: Optional[ResponseCache] = None,
+    ) -> None:
+        self.prefill_ms = prefill_ms
+        self.ms_per_token = ms_per_token
+        self.cache = cache if cache is not None else ResponseCache()
+        self.calls: list[str] = []
+
+    def __call__(
+        self, max_tokens: int = 500, format: Optional[Any] = None, cache: bool = False
+    ) -> Any:
+        """Return a model configured like get_llm(max_tokens, format, cache)."""
+        llm = StubChatModel(
+            self.prefill_ms, self.ms_per_token, max_tokens, format, self.calls
+        )
+        if cache:
+            params = {"num_predict": max_tokens, "format": format}
+            return CachedLLM(llm, "stub", params, self.cache)
+        return llm
+
+
+@contextmanager
+def use_llm(factory: Callable[..., Any]) -> Iterator[Callable[..., Any]]:
+    """Make every agent node obtain its model from factory.
+
+    Args:
+        factory: Replacement for get_llm().
+
+    Yields:
+        factory.
+    """
+    with ExitStack() as stack:
+        for module in NODE_MODULES:
+            stack.enter_context(patch(f"src.agents.nodes.{module}.get_llm", factory))
+        yield factory
@@ -3,6 +3,9 @@
 import logging
 import os
 import sys
+import time
+
+_IMPORTS_STARTED = time.perf_counter()
 
 logging.basicConfig(
     level=os.environ.get("LOG_LEVEL", "INFO").upper(),
@@ -10,9 +13,11 @@ logging.basicConfig(
 )
 
 from rich.console import Console
+from rich.live import Live
 from rich.prompt import IntPrompt, Prompt
+from sqlalchemy import select
 
-from src.agents.graph import build_graph
+from src.agents.graph import build_graph, stream_turn
 from src.agents.state import create_initial_state
 from src.cli.display import (
     display_employee_info,
@@ -21,8 +26,9 @@ from src.cli.display import (
     display_routing_info,
     display_welcome_banner,
     get_console,
+    response_panel,
 )
-from src.db import Employee, get_session
+from src.db import Employee, EmployeeRecord, get_session
 from src.db.seed import seed_database
 
 logger = logging.getLogger(__name__)
@@ -38,15 +44,14 @@ def is_exit_command(text: str) -> bool:
 def load_all_employees() -> list[dict]:
     """Load all employees from the database."""
     with get_session() as session:
-        employees = session.query(Employee).all()
-        return [emp.to_dict() for emp in employees]
+        rows = session.execute(EmployeeRecord.select())
+        return [EmployeeRecord(*row).to_dict() for row in rows]
 
 
 def ensure_database_ready() -> None:
     """Ensure database is seeded on first run."""
     with get_session() as session:
-        count = session.query(Employee).count()
-        if count == 0:
+        if session.scalar(select(Employee.id).limit(1)) is None:
             seed_database(session)
 
 
@@ -67,6 +72,22 @@ def select_employee(console: Console, employees: list[dict]) -> dict | None:
             return None
 
 
+def stream_response(console: Console, graph, state: dict) -> dict:
+    """Run one turn, rendering the response in a live panel as it streams.
+
+    The live panel is cleared when the turn ends, so the caller prints the
+    final response in its usual place.
+    """
+    tokens: list[str] = []
+    with Live(console=console, transient=True, refresh_per_second=15) as live:
+
+        def on_token(token: str) -> None:
+            tokens.append(token)
+            live.update(response_panel("".join(tokens), "response"))
+
+        return stream_turn(graph, state, on_token)
+
+
 def run_conversation(console: Console, employee: dict, graph) -> None:
     """Run the conversation loop."""
     display_employee_info(console, employee)
@@ -87,7 +108,7 @@ def run_conversation(console: Console, employee: dict, graph) -> None:
 
         try:
             state = create_initial_state(employee["id"], user_input)
-            result = graph.invoke(state)
+            result = stream_response(console, graph, state)
             language = result.get("language", "en")
             intent = result.get("intent", "unknown")
             response = result.get("response", "")
@@ -108,15 +129,25 @@ def run_conversation(console: Console, employee: dict, graph) -> None:
 
 def main() -> None:
     """Entry point for the demo CLI."""
+    imports_done = time.perf_counter()
     console = get_console()
     display_welcome_banner(console)
     console.print()
 
     # Ensure database is ready
+    db_started = time.perf_counter()
     ensure_database_ready()
 
     # Build LangGraph
+    graph_started = time.perf_counter()
     graph = build_graph()
+    graph_done = time.perf_counter()
+    logger.info(
+        "Startup: imports %.0f ms, database %.0f ms, graph %.0f ms",
+        (imports_done - _IMPORTS_STARTED) * 1000,
+        (graph_started - db_started) * 1000,
+        (graph_done - graph_started) * 1000,
+    )
 
     # Load employees
     employees = load_all_employees()
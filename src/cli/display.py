@@ -89,8 +89,8 @@ def display_routing_info(console: Console, language: str, intent: str) -> None:
     )
 
 
-def display_response(console: Console, response: str, intent: str) -> None:
-    """Display agent response in a Rich Panel."""
+def response_panel(response: str, intent: str) -> Panel:
+    """Build the Rich Panel an agent response is shown in."""
     if intent == "error":
         style = "red"
         title = "Error"
@@ -98,4 +98,9 @@ def display_response(console: Console, response: str, intent: str) -> None:
         style = "blue"
         title = INTENT_LABELS.get(intent, "Response")
 
-    console.print(Panel(response, title=f"[bold]{title}[/bold]", border_style=style))
+    return Panel(response, title=f"[bold]{title}[/bold]", border_style=style)
+
+
+def display_response(console: Console, response: str, intent: str) -> None:
+    """Display agent response in a Rich Panel."""
+    console.print(response_panel(response, intent))
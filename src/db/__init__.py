@@ -1,10 +1,27 @@
 """Database module for Jem HR Demo."""
 
-from .connection import get_engine, get_session, reset_engine
+from .archive import archive_closed_months, read_partition
+from .cache import cache_stats, clear_caches
+from .connection import (
+    QueryStats,
+    assert_max_queries,
+    get_async_engine,
+    get_async_session,
+    get_engine,
+    get_session,
+    request_scope,
+    reset_async_engine,
+    reset_engine,
+    reset_tool_query_stats,
+    tool_query_stats,
+    track_queries,
+)
 from .models import (
     Base,
+    EarnedToDate,
     Employee,
     EmploymentStatus,
+    EWALedger,
     EWAStatus,
     EWATransaction,
     LeaveBalance,
@@ -12,18 +29,45 @@ from .models import (
     Timesheet,
     TimesheetStatus,
 )
+from .ledger import (
+    rebuild_earned_to_date,
+    rebuild_ewa_ledger,
+    reconcile_earned_to_date,
+    reconcile_ewa_ledger,
+)
+from .records import EmployeeRecord
 
 __all__ = [
     "Base",
+    "EarnedToDate",
     "Employee",
+    "EmployeeRecord",
     "EmploymentStatus",
+    "EWALedger",
     "EWAStatus",
     "EWATransaction",
     "LeaveBalance",
     "LeaveType",
+    "QueryStats",
     "Timesheet",
     "TimesheetStatus",
+    "archive_closed_months",
+    "assert_max_queries",
+    "cache_stats",
+    "clear_caches",
+    "get_async_engine",
+    "get_async_session",
     "get_engine",
     "get_session",
+    "read_partition",
+    "rebuild_earned_to_date",
+    "rebuild_ewa_ledger",
+    "reconcile_earned_to_date",
+    "reconcile_ewa_ledger",
+    "request_scope",
+    "reset_async_engine",
     "reset_engine",
+    "reset_tool_query_stats",
+    "tool_query_stats",
+    "track_queries",
 ]
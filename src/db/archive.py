@@ -0,0 +1,330 @@
+"""Cold storage for closed months of timesheets and EWA transactions.
+
+archive_closed_months() moves every closed month older than a horizon out
+of the hot tables into one compressed columnar file per table and month:
+
+    <archive dir>/timesheets/2025-06.json.gz
+    <archive dir>/ewa_transactions/2025-06.json.gz
+
+Each file is gzip-compressed JSON holding one array per column. Timesheets
+are partitioned by pay_period_start and EWA transactions by disbursed_at
+(requested_at if never disbursed), the same months get_payslip() groups
+them by. read_partition() loads a file back for historical reads.
+"""
+
+import gzip
+import json
+import logging
+import os
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Optional
+
+from sqlalchemy import Table, and_, delete, func, or_, select
+from sqlalchemy.orm import Session
+
+from .connection import DATA_DIR
+from .models import (
+    EarnedToDate,
+    EWAStatus,
+    EWATransaction,
+    Timesheet,
+    TimesheetStatus,
+)
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_DIR_ENV_VAR = "JEM_ARCHIVE_DIR"
+DEFAULT_ARCHIVE_DIR = DATA_DIR / "archive"
+
+# Months newer than this many months before the current one stay hot
+HORIZON_ENV_VAR = "JEM_ARCHIVE_HORIZON_MONTHS"
+DEFAULT_HORIZON_MONTHS = 12
+
+ARCHIVED_TABLES = (Timesheet.__table__.name, EWATransaction.__table__.name)
+
+# Month files written but not yet moved into place, awaiting their commit
+PENDING_SUFFIX = ".pending"
+
+# Rows in these states can still change, so their month is not closed
+_OPEN_TIMESHEET_STATUSES = (TimesheetStatus.PENDING.value,)
+_OPEN_EWA_STATUSES = (EWAStatus.PENDING.value, EWAStatus.DISBURSED.value)
+
+
+def archive_dir() -> Path:
+    """Return the archive root, from $JEM_ARCHIVE_DIR or data/archive."""
+    configured = os.environ.get(ARCHIVE_DIR_ENV_VAR)
+    return Path(configured) if configured else DEFAULT_ARCHIVE_DIR
+
+
+def partition_path(table: str, month: str, root: Optional[Path] = None) -> Path:
+    """Return the archive file for one table and "YYYY-MM" month."""
+    return (root or archive_dir()) / table / f"{month}.json.gz"
+
+
+def partition_stamp(
+    table: str, month: str, root: Optional[Path] = None
+) -> Optional[int]:
+    """Return the archive file's modification time in ns, or None if absent.
+
+    Cheap enough to call per request; use it to key caches of file contents.
+    """
+    try:
+        return partition_path(table, month, root).stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+
+
+def read_partition(
+    table: str, month: str, root: Optional[Path] = None
+) -> dict[str, list]:
+    """Load one archived month as {column name: values}.
+
+    Dates and datetimes come back as ISO 8601 strings.
+
+    Args:
+        table: "timesheets" or "ewa_transactions".
+        month: Month in "YYYY-MM" format.
+        root: Archive root. Defaults to archive_dir().
+
+    Returns:
+        Column arrays, or an empty dict if the month is not archived.
+    """
+    path = partition_path(table, month, root)
+    if not path.exists():
+        return {}
+    return _read_columns(path)
+
+
+def _read_columns(path: Path) -> dict[str, list]:
+    """Load the column arrays from an archive file."""
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        return json.load(f)["columns"]
+
+
+def default_cutoff(today: Optional[date] = None) -> str:
+    """Return the first month kept hot under $JEM_ARCHIVE_HORIZON_MONTHS."""
+    today = today or date.today()
+    horizon = int(os.environ.get(HORIZON_ENV_VAR) or DEFAULT_HORIZON_MONTHS)
+    index = today.year * 12 + today.month - 1 - horizon
+    return f"{index // 12:04d}-{index % 12 + 1:02d}"
+
+
+def archive_closed_months(
+    session: Session,
+    before: Optional[str] = None,
+    root: Optional[Path] = None,
+) -> dict:
+    """Move closed months older than a cutoff from the hot tables to files.
+
+    A month is closed once payroll close has marked its advances repaid and
+    none of its timesheets or advances are still pending; open months are
+    skipped and logged. Each month is deleted from the hot tables in its
+    own commit; its files are written beside the archive first and moved
+    into place only once that commit succeeds, so no row is ever counted
+    both hot and archived. Files left behind by an interrupted run are
+    finished or discarded at the start of the next one. Rows archived into
+    a month that already has a file are merged into it.
+
+    Args:
+        session: SQLAlchemy session. Committed after every month.
+        before: First "YYYY-MM" month to keep hot. Defaults to
+                default_cutoff().
+        root: Archive root. Defaults to archive_dir().
+
+    Returns:
+        Summary with "archived" and "skipped" month lists and the number of
+        "timesheets" and "ewa_transactions" rows moved.
+    """
+    before = before or default_cutoff()
+    root = root or archive_dir()
+    cutoff = _month_start(before)
+    summary = {"archived": [], "skipped": [], "timesheets": 0, "ewa_transactions": 0}
+    _recover_pending(session, root)
+
+    timesheet_month = func.strftime("%Y-%m", Timesheet.pay_period_start)
+    ewa_month = func.strftime(
+        "%Y-%m", func.coalesce(EWATransaction.disbursed_at, EWATransaction.requested_at)
+    )
+    months = set(
+        session.scalars(
+            select(timesheet_month)
+            .where(Timesheet.pay_period_start < cutoff)
+            .distinct()
+        )
+    )
+    months.update(
+        session.scalars(select(ewa_month).where(_ewa_before(cutoff)).distinct())
+    )
+
+    for month in sorted(months):
+        start = _month_start(month)
+        end = _month_start(_next_month(month))
+        timesheets_in_month = and_(
+            Timesheet.pay_period_start >= start, Timesheet.pay_period_start < end
+        )
+        ewa_in_month = _ewa_in_month(start, end)
+
+        open_rows = session.scalar(
+            select(func.count()).select_from(Timesheet).where(
+                timesheets_in_month, Timesheet.status.in_(_OPEN_TIMESHEET_STATUSES)
+            )
+        ) + session.scalar(
+            select(func.count()).select_from(EWATransaction).where(
+                ewa_in_month, EWATransaction.status.in_(_OPEN_EWA_STATUSES)
+            )
+        )
+        if open_rows:
+            logger.warning("Not archiving %s: %d open rows", month, open_rows)
+            summary["skipped"].append(month)
+            continue
+
+        pending = []
+        try:
+            for table, condition in (
+                (Timesheet.__table__, timesheets_in_month),
+                (EWATransaction.__table__, ewa_in_month),
+            ):
+                rows = session.execute(select(table).where(condition)).all()
+                if rows:
+                    pending.append(_write_partition(table, month, rows, root))
+                    session.execute(delete(table).where(condition))
+                summary[table.name] += len(rows)
+
+            # Accumulator rows for the month are all zero once its timesheets go
+            session.execute(
+                delete(EarnedToDate).where(
+                    EarnedToDate.pay_period_start >= start,
+                    EarnedToDate.pay_period_start < end,
+                    EarnedToDate.approved_count == 0,
+                )
+            )
+            session.commit()
+        except Exception:
+            for path in pending:
+                path.unlink(missing_ok=True)
+            raise
+        for path in pending:
+            _publish(path)
+        summary["archived"].append(month)
+        logger.info("Archived %s", month)
+
+    logger.info(
+        "Archive run before %s: %d months archived (%d timesheets, "
+        "%d EWA transactions), %d skipped",
+        before,
+        len(summary["archived"]),
+        summary["timesheets"],
+        summary["ewa_transactions"],
+        len(summary["skipped"]),
+    )
+    return summary
+
+
+def _ewa_before(cutoff: date) -> Any:
+    """Filter: EWA transactions whose archive month is before cutoff."""
+    cutoff = datetime.combine(cutoff, datetime.min.time())
+    return or_(
+        EWATransaction.disbursed_at < cutoff,
+        and_(
+            EWATransaction.disbursed_at.is_(None),
+            EWATransaction.requested_at < cutoff,
+        ),
+    )
+
+
+def _ewa_in_month(start: date, end: date) -> Any:
+    """Filter: EWA transactions archived under the month [start, end)."""
+    midnight = datetime.min.time()
+    first, last = datetime.combine(start, midnight), datetime.combine(end, midnight)
+    return or_(
+        and_(EWATransaction.disbursed_at >= first, EWATransaction.disbursed_at < last),
+        and_(
+            EWATransaction.disbursed_at.is_(None),
+            EWATransaction.requested_at >= first,
+            EWATransaction.requested_at < last,
+        ),
+    )
+
+
+def _recover_pending(session: Session, root: Path) -> None:
+    """Finish or discard month files left pending by an interrupted run.
+
+    A pending file whose rows are gone from the hot table was committed
+    before the run stopped and is moved into place; one whose rows are
+    still hot was rolled back and is removed.
+    """
+    for table in (Timesheet.__table__, EWATransaction.__table__):
+        for path in sorted((root / table.name).glob(f"*{PENDING_SUFFIX}")):
+            ids = _read_columns(path).get("id", [])
+            if any(
+                session.scalar(
+                    select(func.count())
+                    .select_from(table)
+                    .where(table.c.id.in_(ids[i : i + 500]))
+                )
+                for i in range(0, len(ids), 500)
+            ):
+                logger.warning("Discarding uncommitted archive file %s", path)
+                path.unlink()
+            else:
+                logger.warning("Completing interrupted archive file %s", path)
+                _publish(path)
+
+
+def _publish(pending: Path) -> None:
+    """Move a pending month file into place, replacing the old one."""
+    os.replace(pending, pending.with_suffix(""))
+
+
+def _write_partition(table: Table, month: str, rows: list, root: Path) -> Path:
+    """Write rows to the month's pending file, merging with rows already archived.
+
+    Written to a temporary file and renamed, so a pending file is never
+    partial. _publish() moves it into place once the rows are deleted.
+
+    Returns:
+        Path of the pending file.
+    """
+    names = [column.name for column in table.columns]
+    key = table.primary_key.columns.keys()[0]
+    merged = {}
+    existing = read_partition(table.name, month, root)
+    for values in zip(*(existing.get(name, []) for name in names)):
+        merged[values[names.index(key)]] = list(values)
+    for row in rows:
+        values = [_serialise(value) for value in row]
+        merged[values[names.index(key)]] = values
+
+    ordered = [merged[k] for k in sorted(merged)]
+    columns = {name: [values[i] for values in ordered] for i, name in enumerate(names)}
+
+    path = partition_path(table.name, month, root)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(".tmp")
+    pending = path.with_name(path.name + PENDING_SUFFIX)
+    with gzip.open(tmp, "wt", encoding="utf-8") as f:
+        json.dump({"table": table.name, "month": month, "columns": columns}, f)
+    os.replace(tmp, pending)
+    return pending
+
+
+def _serialise(value: Any) -> Any:
+    """Make a column value JSON-safe (dates become ISO strings)."""
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _month_start(month: str) -> date:
+    """Return the first day of a "YYYY-MM" month."""
+    year, mon = month.split("-")
+    return date(int(year), int(mon), 1)
+
+
+def _next_month(month: str) -> str:
+    """Return the "YYYY-MM" month after month."""
+    start = _month_start(month)
+    if start.month == 12:
+        return f"{start.year + 1:04d}-01"
+    return f"{start.year:04d}-{start.month + 1:02d}"
@@ -0,0 +1,210 @@
+"""In-process read-through caches for employee profiles and leave balances.
+
+Profiles and balances are re-read on every message of a conversation but
+change rarely. Tools look them up here before querying, and every ORM flush
+that touches an Employee or LeaveBalance row invalidates the affected
+entries (again on commit or rollback, so a concurrent read cannot re-cache
+the pre-write value).
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from itertools import chain
+from typing import Any, Callable, Hashable, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from .models import Employee, LeaveBalance
+
+logger = logging.getLogger(__name__)
+
+# Cache sizing, overridable per process
+MAXSIZE_ENV_VAR = "JEM_CACHE_MAXSIZE"
+TTL_ENV_VAR = "JEM_CACHE_TTL"
+DEFAULT_MAXSIZE = 10_000
+DEFAULT_TTL = 300.0
+
+# session.info key: cache entries written by this session's open transaction
+_PENDING_KEY = "jem_cache_pending"
+
+
+class TTLCache:
+    """Thread-safe LRU cache whose entries also expire after a TTL.
+
+    Args:
+        name: Name reported in stats.
+        maxsize: Maximum entries; the least recently used is evicted first.
+        ttl: Seconds an entry stays valid after it is stored.
+        clock: Monotonic time source, injectable for testing.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        maxsize: int = DEFAULT_MAXSIZE,
+        ttl: float = DEFAULT_TTL,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._clock = clock
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= self._clock():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used if full."""
+        with self._lock:
+            self._entries[key] = (self._clock() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> None:
+        """Drop key if cached."""
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self.invalidations += 1
+
+    def clear(self) -> None:
+        """Drop every entry. Counters are kept."""
+        with self._lock:
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return counters and current size for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "ttl": self.ttl,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidations": self.invalidations,
+            }
+
+
+def _from_env() -> tuple[int, float]:
+    """Read cache size and TTL from the environment."""
+    maxsize = int(os.environ.get(MAXSIZE_ENV_VAR) or DEFAULT_MAXSIZE)
+    ttl = float(os.environ.get(TTL_ENV_VAR) or DEFAULT_TTL)
+    return maxsize, ttl
+
+
+employee_cache = TTLCache("employees", *_from_env())
+leave_balance_cache = TTLCache("leave_balances", *_from_env())
+
+_CACHES = {cache.name: cache for cache in (employee_cache, leave_balance_cache)}
+
+
+def remember(session: Session, cache: TTLCache, key: Hashable, value: Any) -> None:
+    """Cache a value read through session.
+
+    Skipped when the session has flushed but uncommitted writes to the same
+    entry, since those may still be rolled back.
+
+    Args:
+        session: Session the value was read with.
+        cache: Cache to store into.
+        key: Cache key (the employee ID).
+        value: Value to cache.
+    """
+    pending = session.info.get(_PENDING_KEY, ())
+    if (cache.name, key) in pending or (cache.name, None) in pending:
+        return
+    cache.set(key, value)
+
+
+def cache_stats() -> dict[str, dict]:
+    """Return stats for every cache, keyed by cache name."""
+    return {name: cache.stats() for name, cache in _CACHES.items()}
+
+
+def clear_caches() -> None:
+    """Drop every cached entry."""
+    for cache in _CACHES.values():
+        cache.clear()
+
+
+def _invalidate(pending: set[tuple[str, Optional[Hashable]]]) -> None:
+    """Drop each (cache name, key) entry; a key of None clears that cache."""
+    for name, key in pending:
+        if key is None:
+            _CACHES[name].clear()
+        else:
+            _CACHES[name].invalidate(key)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_flush(session: Session, flush_context: Any) -> None:
+    """Invalidate cache entries for Employee and LeaveBalance rows just flushed."""
+    pending = session.info.setdefault(_PENDING_KEY, set())
+    for obj in chain(session.new, session.dirty, session.deleted):
+        if isinstance(obj, Employee):
+            pending.add((employee_cache.name, obj.id))
+            pending.add((leave_balance_cache.name, obj.id))
+        elif isinstance(obj, LeaveBalance):
+            pending.add((leave_balance_cache.name, obj.employee_id))
+    _invalidate(pending)
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _invalidate_on_statement(orm_execute_state: Any) -> None:
+    """Clear a whole cache when an INSERT/UPDATE/DELETE statement targets its model.
+
+    Statement-level writes do not say which rows they touch.
+    """
+    state = orm_execute_state
+    if not (state.is_insert or state.is_update or state.is_delete):
+        return
+    entities = {mapper.class_ for mapper in state.all_mappers}
+    pending = state.session.info.setdefault(_PENDING_KEY, set())
+    if Employee in entities:
+        pending.add((employee_cache.name, None))
+        pending.add((leave_balance_cache.name, None))
+    if LeaveBalance in entities:
+        pending.add((leave_balance_cache.name, None))
+    _invalidate(pending)
+
+
+@event.listens_for(Session, "after_commit")
+@event.listens_for(Session, "after_rollback")
+def _invalidate_on_end(session: Session) -> None:
+    """Invalidate again once the writing transaction has ended."""
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        _invalidate(pending)
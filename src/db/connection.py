@@ -1,15 +1,28 @@
 """Database connection management for Jem HR Demo."""
 
+import functools
+import inspect
 import logging
-from contextlib import contextmanager
+import os
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
 from pathlib import Path
-from typing import Generator
+from typing import Any, AsyncGenerator, Callable, Generator
 
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
 
-from .models import Base
+from .cache import clear_caches
+from .migrations import ensure_schema
 
 logger = logging.getLogger(__name__)
 
@@ -17,15 +30,149 @@ logger = logging.getLogger(__name__)
 DATA_DIR = Path(__file__).parent.parent.parent / "data"
 DEFAULT_DB_PATH = DATA_DIR / "jem_hr.db"
 
+# Engine profile selection
+PROFILE_ENV_VAR = "JEM_DB_PROFILE"
+DEFAULT_PROFILE = "interactive"
+
+# Named engine profiles: SQLite pragmas applied to every new connection plus
+# pool sizing. WAL lets readers proceed while a writer holds the database, so
+# read tools no longer queue behind EWA writes.
+ENGINE_PROFILES: dict[str, dict[str, Any]] = {
+    "interactive": {
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": 5000,
+            "cache_size": -16000,  # negative = KiB, i.e. 16 MB
+            "mmap_size": 64 * 1024 * 1024,
+            "temp_store": "MEMORY",
+        },
+        "pool": {"pool_size": 5, "max_overflow": 5, "pool_timeout": 30},
+    },
+    "server": {
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "NORMAL",
+            "busy_timeout": 15000,
+            "cache_size": -64000,
+            "mmap_size": 256 * 1024 * 1024,
+            "temp_store": "MEMORY",
+        },
+        "pool": {"pool_size": 20, "max_overflow": 20, "pool_timeout": 30},
+    },
+    "bulk-load": {
+        "pragmas": {
+            "journal_mode": "WAL",
+            "synchronous": "OFF",
+            "busy_timeout": 60000,
+            "cache_size": -256000,
+            "mmap_size": 256 * 1024 * 1024,
+            "temp_store": "MEMORY",
+        },
+        "pool": {"pool_size": 1, "max_overflow": 0, "pool_timeout": 60},
+    },
+}
+
 _engine: Engine | None = None
 _session_factory: sessionmaker[Session] | None = None
+_async_engine: AsyncEngine | None = None
+_async_session_factory: async_sessionmaker[AsyncSession] | None = None
+
+# Session shared by every get_session() call inside request_scope()
+_request_session: ContextVar[Session | None] = ContextVar(
+    "jem_request_session", default=None
+)
+# Statements slower than this are logged with their query plan
+SLOW_QUERY_ENV_VAR = "JEM_SLOW_QUERY_MS"
+SLOW_QUERY_MS = float(os.environ.get(SLOW_QUERY_ENV_VAR) or 100)
+_EXPLAINABLE = {"SELECT", "INSERT", "UPDATE", "DELETE", "WITH"}
+
+# Tool currently executing, for slow-query log lines
+_current_tool: ContextVar[str | None] = ContextVar("jem_current_tool", default=None)
+# Per-tool totals accumulated by track_tool()
+_tool_stats: dict[str, dict] = {}
+_tool_stats_lock = threading.Lock()
+
+# Counters of every enclosing track_queries() block, innermost last
+_query_stats: ContextVar[tuple["QueryStats", ...]] = ContextVar(
+    "jem_query_stats", default=()
+)
+
+
+def resolve_profile(profile: str | None = None) -> str:
+    """Resolve the engine profile name.
+
+    Args:
+        profile: Explicit profile name. Falls back to the JEM_DB_PROFILE
+                 environment variable, then to "interactive".
+
+    Returns:
+        A key of ENGINE_PROFILES.
+
+    Raises:
+        ValueError: If the profile name is unknown.
+    """
+    name = profile or os.environ.get(PROFILE_ENV_VAR) or DEFAULT_PROFILE
+    if name not in ENGINE_PROFILES:
+        raise ValueError(
+            f"Unknown database profile '{name}'. "
+            f"Expected one of: {', '.join(sorted(ENGINE_PROFILES))}"
+        )
+    return name
+
+
+def _pragma_listener(pragmas: dict[str, Any]) -> Callable[..., None]:
+    """Build a connect-event hook that applies SQLite pragmas."""
+
+    def on_connect(dbapi_connection: Any, connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return on_connect
 
 
-def get_engine(db_path: Path | None = None) -> Engine:
+def _engine_kwargs(config: dict[str, Any]) -> dict[str, Any]:
+    """Build create_engine keyword arguments for a profile config."""
+    return {
+        "echo": False,
+        "connect_args": {
+            "check_same_thread": False,
+            "timeout": config["pragmas"]["busy_timeout"] / 1000,
+        },
+        **config["pool"],
+    }
+
+
+def create_profiled_engine(db_url: str, profile: str | None = None) -> Engine:
+    """Create a SQLite engine configured with a named profile.
+
+    Args:
+        db_url: SQLAlchemy database URL (sqlite:///...).
+        profile: Profile name (see ENGINE_PROFILES).
+
+    Returns:
+        SQLAlchemy Engine with pragmas applied on every new connection.
+    """
+    name = resolve_profile(profile)
+    config = ENGINE_PROFILES[name]
+
+    engine = create_engine(db_url, **_engine_kwargs(config))
+    event.listen(engine, "connect", _pragma_listener(config["pragmas"]))
+    logger.info("Database engine profile: %s", name)
+    return engine
+
+
+def get_engine(db_path: Path | None = None, profile: str | None = None) -> Engine:
     """Get or create the SQLAlchemy engine.
 
     Args:
         db_path: Optional path to database file. Defaults to data/jem_hr.db.
+        profile: Optional engine profile name ("interactive", "server",
+                 "bulk-load"). Defaults to $JEM_DB_PROFILE or "interactive".
 
     Returns:
         SQLAlchemy Engine instance.
@@ -44,12 +191,18 @@ def get_engine(db_path: Path | None = None) -> Engine:
     db_url = f"sqlite:///{db_path}"
     logger.info("Connecting to database: %s", db_path)
 
-    _engine = create_engine(db_url, echo=False)
-
-    # Create all tables
-    Base.metadata.create_all(_engine)
-    logger.info("Database tables initialized")
+    started = time.perf_counter()
+    engine = create_profiled_engine(db_url, profile)
+    created = time.perf_counter()
+    migrated = ensure_schema(engine)
+    logger.debug(
+        "Engine created in %.1f ms, schema %s in %.1f ms",
+        (created - started) * 1000,
+        "migrated" if migrated else "checked",
+        (time.perf_counter() - created) * 1000,
+    )
 
+    _engine = engine
     return _engine
 
 
@@ -57,6 +210,9 @@ def get_engine(db_path: Path | None = None) -> Engine:
 def get_session() -> Generator[Session, None, None]:
     """Get a database session as a context manager.
 
+    Inside request_scope() this yields the scope's shared session instead
+    of opening a new one, and leaves committing to the scope.
+
     Yields:
         SQLAlchemy Session instance.
 
@@ -66,6 +222,16 @@ def get_session() -> Generator[Session, None, None]:
     """
     global _session_factory
 
+    scoped = _request_session.get()
+    if scoped is not None:
+        # Inside request_scope(): the scope owns commit and rollback
+        try:
+            yield scoped
+        except Exception:
+            scoped.info["rollback_only"] = True
+            raise
+        return
+
     if _session_factory is None:
         engine = get_engine()
         _session_factory = sessionmaker(bind=engine, expire_on_commit=False)
@@ -81,10 +247,338 @@ def get_session() -> Generator[Session, None, None]:
         session.close()
 
 
+@contextmanager
+def request_scope() -> Generator[Session, None, None]:
+    """Share one session across every tool call in a unit of work.
+
+    All get_session() calls made while the scope is active (in this context,
+    including LangGraph node execution) reuse one session, connection and
+    identity map. The scope commits once on exit. It rolls back if the body
+    raises, or if any tool call raised through get_session() even though
+    the tool caught the error and returned an error response. Nested scopes
+    join the outer one.
+
+    Writes take SQLite's write lock until the scope ends, so keep scopes to
+    the tool calls of a single request; never hold one across an LLM call.
+
+    Yields:
+        The shared SQLAlchemy Session.
+
+    Example:
+        with request_scope():
+            result = hr_agent(state)
+    """
+    scoped = _request_session.get()
+    if scoped is not None:
+        yield scoped
+        return
+
+    with get_session() as session:
+        token = _request_session.set(session)
+        try:
+            yield session
+            if session.info.pop("rollback_only", False):
+                logger.warning("Rolling back request scope after a failed tool call")
+                session.rollback()
+        finally:
+            _request_session.reset(token)
+
+
+class QueryStats:
+    """Statements executed and sessions used inside track_queries()."""
+
+    def __init__(self) -> None:
+        self.queries = 0
+        self.seconds = 0.0
+        self.statements: list[str] = []
+        self._session_keys: set[int] = set()
+
+    @property
+    def sessions(self) -> int:
+        """Number of distinct sessions that began a transaction."""
+        return len(self._session_keys)
+
+
+def _explain(conn: Any, statement: str, parameters: Any) -> str:
+    """Return SQLite's EXPLAIN QUERY PLAN for a statement, one step per line.
+
+    Runs on a raw DBAPI cursor so the EXPLAIN itself is not instrumented.
+    """
+    cursor = conn.connection.cursor()
+    try:
+        cursor.execute(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        return "\n".join(row[-1] for row in cursor.fetchall())
+    finally:
+        cursor.close()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _start_query_timer(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Record when a statement starts."""
+    context._jem_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _record_query(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """Attribute a finished statement to track_queries() blocks; log it if slow."""
+    started = getattr(context, "_jem_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    for stats in _query_stats.get():
+        stats.queries += 1
+        stats.seconds += elapsed
+        stats.statements.append(statement)
+
+    if elapsed * 1000 < SLOW_QUERY_MS:
+        return
+    plan = ""
+    verb = statement.split(None, 1)[0].upper() if statement.strip() else ""
+    if not executemany and verb in _EXPLAINABLE:
+        try:
+            plan = _explain(conn, statement, parameters)
+        except Exception:
+            logger.debug("EXPLAIN failed for slow query", exc_info=True)
+    logger.warning(
+        "Slow query (%.1f ms) in %s: %s\n%s",
+        elapsed * 1000,
+        _current_tool.get() or "unknown caller",
+        statement,
+        plan,
+    )
+
+
+@event.listens_for(Session, "after_begin")
+def _count_session(session: Session, transaction: Any, connection: Any) -> None:
+    """Record a session beginning a transaction in track_queries()."""
+    for stats in _query_stats.get():
+        stats._session_keys.add(session.hash_key)
+
+
+@contextmanager
+def track_queries() -> Generator[QueryStats, None, None]:
+    """Count SQL statements and sessions used within the block.
+
+    Blocks nest: a statement counts towards every enclosing block.
+
+    Yields:
+        QueryStats, updated as statements run.
+
+    Example:
+        with track_queries() as stats:
+            get_employee("EMP001")
+        print(stats.queries, stats.sessions)
+    """
+    stats = QueryStats()
+    token = _query_stats.set((*_query_stats.get(), stats))
+    try:
+        yield stats
+    finally:
+        _query_stats.reset(token)
+
+
+@contextmanager
+def assert_max_queries(n: int) -> Generator[QueryStats, None, None]:
+    """Fail if the block executes more than n SQL statements.
+
+    Args:
+        n: Query budget for the block.
+
+    Yields:
+        QueryStats for the block.
+
+    Raises:
+        AssertionError: If the budget is exceeded, listing the statements.
+
+    Example:
+        with assert_max_queries(1):
+            get_employee("EMP001", session)
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.queries > n:
+        listing = "\n".join(
+            f"  {i}. {sql}" for i, sql in enumerate(stats.statements, 1)
+        )
+        raise AssertionError(
+            f"Expected at most {n} queries, executed {stats.queries}:\n{listing}"
+        )
+
+
+def track_tool(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Attribute a tool's SQL statements and time to it by name.
+
+    Works on sync and async tools. Totals accumulate in tool_query_stats();
+    slow-query log lines name the tool.
+    """
+    name = func.__name__
+
+    def record(stats: QueryStats) -> None:
+        with _tool_stats_lock:
+            totals = _tool_stats.setdefault(
+                name, {"calls": 0, "queries": 0, "seconds": 0.0}
+            )
+            totals["calls"] += 1
+            totals["queries"] += stats.queries
+            totals["seconds"] += stats.seconds
+        logger.debug(
+            "Tool %s: %d queries in %.2f ms", name, stats.queries, stats.seconds * 1000
+        )
+
+    if inspect.iscoroutinefunction(func):
+
+        @functools.wraps(func)
+        async def async_wrapper(*args: Any, **kwargs: Any) -> Any:
+            token = _current_tool.set(name)
+            try:
+                with track_queries() as stats:
+                    result = await func(*args, **kwargs)
+            finally:
+                _current_tool.reset(token)
+            record(stats)
+            return result
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(*args: Any, **kwargs: Any) -> Any:
+        token = _current_tool.set(name)
+        try:
+            with track_queries() as stats:
+                result = func(*args, **kwargs)
+        finally:
+            _current_tool.reset(token)
+        record(stats)
+        return result
+
+    return wrapper
+
+
+def tool_query_stats() -> dict[str, dict]:
+    """Return per-tool totals: calls, queries and seconds spent in SQL."""
+    with _tool_stats_lock:
+        return {name: dict(totals) for name, totals in _tool_stats.items()}
+
+
+def reset_tool_query_stats() -> None:
+    """Clear per-tool totals."""
+    with _tool_stats_lock:
+        _tool_stats.clear()
+
+
+async def get_async_engine(
+    db_path: Path | None = None, profile: str | None = None
+) -> AsyncEngine:
+    """Get or create the async (aiosqlite) SQLAlchemy engine.
+
+    Uses the same profiles and pragmas as get_engine().
+
+    Args:
+        db_path: Optional path to database file. Defaults to data/jem_hr.db.
+        profile: Optional engine profile name. Defaults to $JEM_DB_PROFILE
+                 or "interactive".
+
+    Returns:
+        SQLAlchemy AsyncEngine instance.
+    """
+    global _async_engine
+
+    if _async_engine is not None:
+        return _async_engine
+
+    if db_path is None:
+        db_path = DEFAULT_DB_PATH
+
+    db_path.parent.mkdir(parents=True, exist_ok=True)
+
+    name = resolve_profile(profile)
+    config = ENGINE_PROFILES[name]
+    logger.info("Connecting to database (async): %s", db_path)
+
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{db_path}", **_engine_kwargs(config)
+    )
+    event.listen(engine.sync_engine, "connect", _pragma_listener(config["pragmas"]))
+
+    async with engine.begin() as conn:
+        await conn.run_sync(ensure_schema)
+
+    _async_engine = engine
+    return _async_engine
+
+
+@asynccontextmanager
+async def get_async_session() -> AsyncGenerator[AsyncSession, None]:
+    """Get an async database session as a context manager.
+
+    Yields:
+        SQLAlchemy AsyncSession instance.
+
+    Example:
+        async with get_async_session() as session:
+            employee = await session.get(Employee, "EMP001")
+    """
+    global _async_session_factory
+
+    if _async_session_factory is None:
+        engine = await get_async_engine()
+        _async_session_factory = async_sessionmaker(bind=engine, expire_on_commit=False)
+
+    session = _async_session_factory()
+    try:
+        yield session
+        await session.commit()
+    except Exception:
+        await session.rollback()
+        raise
+    finally:
+        await session.close()
+
+
+def lock_for_write(session: Session) -> None:
+    """Take SQLite's write lock for the session's current transaction.
+
+    pysqlite opens transactions lazily on the first DML statement, so a
+    read-check-then-insert sequence normally runs its reads outside any lock.
+    Issuing a no-op UPDATE first starts the write transaction up front: a
+    concurrent writer waits (busy_timeout) until this one commits, then
+    reads the committed state.
+
+    Args:
+        session: SQLAlchemy session whose transaction should hold the lock.
+    """
+    session.execute(text("UPDATE employees SET id = id WHERE 0"))
+
+
 def reset_engine() -> None:
-    """Reset the engine and session factory. Used for testing."""
+    """Reset the engine, session factory and read caches. Used for testing."""
     global _engine, _session_factory
     if _engine is not None:
         _engine.dispose()
     _engine = None
     _session_factory = None
+    clear_caches()
+
+
+async def reset_async_engine() -> None:
+    """Reset the async engine, session factory and read caches. Used for testing."""
+    global _async_engine, _async_session_factory
+    if _async_engine is not None:
+        await _async_engine.dispose()
+    _async_engine = None
+    _async_session_factory = None
+    clear_caches()
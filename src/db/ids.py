@@ -0,0 +1,139 @@
+"""Time-ordered, collision-free string IDs for primary keys.
+
+An ID is a prefix followed by 16 Crockford base32 characters (80 bits):
+
+    45 bits  milliseconds since the Unix epoch (good until the year 3084)
+    22 bits  node: random bits chosen at startup, or JEM_ID_NODE if set
+    13 bits  sequence within the millisecond
+
+IDs sort by creation time, so new rows land at the right edge of the
+primary-key B-tree instead of at random positions. Uniqueness needs no
+database round trips: the node separates processes, and the sequence
+separates IDs one process makes within the same millisecond. It restarts
+at each new millisecond; after 8192 IDs in one millisecond new_id() waits
+for the next.
+
+A random node makes two processes sharing one database unlikely to
+collide, not impossible. For a guarantee, set JEM_ID_NODE to a value in
+0..4194303 that is unique per replica; PIDs are no substitute, since
+containers usually all run as PID 1.
+"""
+
+import os
+import secrets
+import threading
+import time
+from typing import Optional
+
+NODE_ENV_VAR = "JEM_ID_NODE"
+
+# Crockford base32: no I, L, O or U, and digits sort before letters
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+
+_TIME_BITS = 45
+_NODE_BITS = 22
+_SEQUENCE_BITS = 13
+ID_CHARS = (_TIME_BITS + _NODE_BITS + _SEQUENCE_BITS) // 5
+
+_MAX_SEQUENCE = (1 << _SEQUENCE_BITS) - 1
+
+# Anchor a monotonic clock to the wall clock once per process, so IDs never
+# go backwards when the system clock is stepped back
+_wall_ns = time.time_ns()
+_monotonic_ns = time.monotonic_ns()
+
+# Millisecond of the last ID and its sequence number, guarded by _lock
+_lock = threading.Lock()
+_last_millis = -1
+_sequence = 0
+_node: Optional[int] = None
+
+
+def _now_millis() -> int:
+    """Return milliseconds since the epoch from the anchored monotonic clock."""
+    return (_wall_ns + time.monotonic_ns() - _monotonic_ns) // 1_000_000
+
+
+def _node_id() -> int:
+    """Return this process's node number, from the environment or random.
+
+    Raises:
+        ValueError: If JEM_ID_NODE does not fit in the node field.
+    """
+    global _node
+    if _node is None:
+        configured = os.environ.get(NODE_ENV_VAR)
+        if not configured:
+            _node = secrets.randbits(_NODE_BITS)
+        elif 0 <= int(configured) < 1 << _NODE_BITS:
+            _node = int(configured)
+        else:
+            raise ValueError(
+                f"{NODE_ENV_VAR} must be in 0..{(1 << _NODE_BITS) - 1}, "
+                f"got {configured}"
+            )
+    return _node
+
+
+def _reset_after_fork() -> None:
+    """Give a forked child its own node, sequence and lock."""
+    global _node, _lock, _last_millis, _sequence
+    _node = None
+    _lock = threading.Lock()
+    _last_millis = -1
+    _sequence = 0
+
+
+os.register_at_fork(after_in_child=_reset_after_fork)
+
+
+def _next_timestamp() -> tuple[int, int]:
+    """Return the (millisecond, sequence) pair for the next ID."""
+    global _last_millis, _sequence
+    with _lock:
+        millis = _now_millis()
+        if millis > _last_millis:
+            _last_millis, _sequence = millis, 0
+        elif _sequence < _MAX_SEQUENCE:
+            _sequence += 1
+        else:
+            # Sequence used up for this millisecond: wait for the next one
+            while millis <= _last_millis:
+                millis = _now_millis()
+            _last_millis, _sequence = millis, 0
+        return _last_millis, _sequence
+
+
+def _encode(value: int, chars: int) -> str:
+    """Encode a non-negative integer as fixed-width Crockford base32."""
+    out = []
+    for _ in range(chars):
+        value, digit = divmod(value, 32)
+        out.append(_ALPHABET[digit])
+    return "".join(reversed(out))
+
+
+def new_id(prefix: str = "") -> str:
+    """Generate a time-ordered unique ID.
+
+    Args:
+        prefix: Prepended verbatim, e.g. "EWA-".
+
+    Returns:
+        prefix followed by ID_CHARS base32 characters.
+    """
+    millis, sequence = _next_timestamp()
+    value = (
+        (millis << (_NODE_BITS + _SEQUENCE_BITS))
+        | (_node_id() << _SEQUENCE_BITS)
+        | sequence
+    )
+    return prefix + _encode(value, ID_CHARS)
+
+
+def id_timestamp(id_: str) -> float:
+    """Return the Unix time (seconds) encoded in an ID from new_id()."""
+    value = 0
+    for char in id_[-ID_CHARS:]:
+        value = value * 32 + _ALPHABET.index(char)
+    return (value >> (_NODE_BITS + _SEQUENCE_BITS)) / 1000
@@ -0,0 +1,232 @@
+"""Rebuild and reconciliation jobs for the trigger-maintained summary tables.
+
+ewa_ledger is maintained by triggers on ewa_transactions and earned_to_date
+by triggers on timesheets (see EWA_LEDGER_TRIGGERS and EARNED_TO_DATE_TRIGGERS
+in models.py). These jobs recompute each from its raw rows: rebuild_*() for
+backfills, reconcile_*() to verify (and optionally repair) them.
+"""
+
+import logging
+
+from sqlalchemy import text
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+logger = logging.getLogger(__name__)
+
+# Differences below half a cent are rounding, not drift
+TOLERANCE = 0.005
+
+# Hours are accumulated at six decimal places
+HOURS_TOLERANCE = 1e-5
+
+# Per-employee totals recomputed from the raw transactions
+_ACTUAL_TOTALS = """
+    SELECT
+        employee_id,
+        round(coalesce(sum(
+            CASE WHEN status = 'disbursed' THEN round(amount, 2) END
+        ), 0), 2) AS outstanding_amount,
+        count(CASE WHEN status = 'disbursed' THEN 1 END) AS outstanding_count,
+        max(disbursed_at) AS last_disbursed_at
+    FROM ewa_transactions
+    GROUP BY employee_id
+"""
+
+# Per-period approved hours recomputed from the raw timesheets
+_ACTUAL_EARNED = """
+    SELECT
+        employee_id, pay_period_start, pay_period_end,
+        round(sum(hours_worked), 6) AS approved_hours,
+        count(*) AS approved_count
+    FROM timesheets
+    WHERE status = 'approved'
+    GROUP BY employee_id, pay_period_start, pay_period_end
+"""
+
+
+def rebuild_ewa_ledger(bind: Session | Connection) -> int:
+    """Replace every ledger row with totals recomputed from ewa_transactions.
+
+    Args:
+        bind: Session or connection; the caller owns the transaction.
+
+    Returns:
+        Number of ledger rows written.
+    """
+    bind.execute(text("DELETE FROM ewa_ledger"))
+    result = bind.execute(
+        text(
+            "INSERT INTO ewa_ledger (employee_id, outstanding_amount, "
+            f"outstanding_count, last_disbursed_at) {_ACTUAL_TOTALS}"
+        )
+    )
+    logger.info("Rebuilt EWA ledger: %d employees", result.rowcount)
+    return result.rowcount
+
+
+def reconcile_ewa_ledger(
+    bind: Session | Connection, repair: bool = False
+) -> list[dict]:
+    """Compare the ledger against totals recomputed from ewa_transactions.
+
+    Args:
+        bind: Session or connection to check.
+        repair: Rebuild the ledger if any discrepancy is found.
+
+    Returns:
+        One dict per mismatched employee with "employee_id", "ledger" and
+        "actual" totals (None where a row is missing). Empty if consistent.
+    """
+    rows = bind.execute(
+        text(
+            f"""
+            WITH actual AS ({_ACTUAL_TOTALS}),
+            keys AS (
+                SELECT employee_id FROM actual
+                UNION SELECT employee_id FROM ewa_ledger
+            )
+            SELECT
+                keys.employee_id,
+                l.employee_id IS NOT NULL, l.outstanding_amount,
+                l.outstanding_count, l.last_disbursed_at,
+                a.employee_id IS NOT NULL, a.outstanding_amount,
+                a.outstanding_count, a.last_disbursed_at
+            FROM keys
+            LEFT JOIN ewa_ledger AS l ON l.employee_id = keys.employee_id
+            LEFT JOIN actual AS a ON a.employee_id = keys.employee_id
+            ORDER BY keys.employee_id
+            """
+        )
+    ).all()
+
+    mismatches = []
+    for emp_id, *values in rows:
+        ledger = _totals(*values[:4])
+        actual = _totals(*values[4:])
+        if _matches(ledger, actual):
+            continue
+        mismatches.append({"employee_id": emp_id, "ledger": ledger, "actual": actual})
+
+    if mismatches:
+        logger.warning("EWA ledger mismatch for %d employees", len(mismatches))
+        if repair:
+            rebuild_ewa_ledger(bind)
+    return mismatches
+
+
+def _totals(
+    present: bool, amount: float, count: int, last_disbursed_at: str
+) -> dict | None:
+    """Shape one side of a reconciliation row."""
+    if not present:
+        return None
+    return {
+        "outstanding_amount": amount,
+        "outstanding_count": count,
+        "last_disbursed_at": last_disbursed_at,
+    }
+
+
+def _matches(ledger: dict | None, actual: dict | None) -> bool:
+    """True if a ledger row agrees with the recomputed totals.
+
+    A missing row on either side matches an all-zero row on the other.
+    """
+    empty = {
+        "outstanding_amount": 0.0,
+        "outstanding_count": 0,
+        "last_disbursed_at": None,
+    }
+    ledger = ledger or empty
+    actual = actual or empty
+    return (
+        abs(ledger["outstanding_amount"] - actual["outstanding_amount"]) < TOLERANCE
+        and ledger["outstanding_count"] == actual["outstanding_count"]
+        and ledger["last_disbursed_at"] == actual["last_disbursed_at"]
+    )
+
+
+def rebuild_earned_to_date(bind: Session | Connection) -> int:
+    """Replace every earned_to_date row with totals recomputed from timesheets.
+
+    Args:
+        bind: Session or connection; the caller owns the transaction.
+
+    Returns:
+        Number of accumulator rows written.
+    """
+    bind.execute(text("DELETE FROM earned_to_date"))
+    result = bind.execute(
+        text(
+            "INSERT INTO earned_to_date (employee_id, pay_period_start, "
+            f"pay_period_end, approved_hours, approved_count) {_ACTUAL_EARNED}"
+        )
+    )
+    logger.info("Rebuilt earned-to-date accumulator: %d periods", result.rowcount)
+    return result.rowcount
+
+
+def reconcile_earned_to_date(
+    bind: Session | Connection, repair: bool = False
+) -> list[dict]:
+    """Compare earned_to_date against approved hours summed from timesheets.
+
+    Args:
+        bind: Session or connection to check.
+        repair: Rebuild the accumulator if any discrepancy is found.
+
+    Returns:
+        One dict per mismatched (employee, pay period) with "employee_id",
+        "pay_period_start", "pay_period_end", "stored" and "actual"
+        (approved_hours, approved_count) pairs, a missing row counting as
+        (0.0, 0). Empty if consistent.
+    """
+    rows = bind.execute(
+        text(
+            f"""
+            WITH actual AS ({_ACTUAL_EARNED}),
+            keys AS (
+                SELECT employee_id, pay_period_start, pay_period_end FROM actual
+                UNION
+                SELECT employee_id, pay_period_start, pay_period_end
+                FROM earned_to_date
+            )
+            SELECT
+                k.employee_id, k.pay_period_start, k.pay_period_end,
+                coalesce(e.approved_hours, 0.0), coalesce(e.approved_count, 0),
+                coalesce(a.approved_hours, 0.0), coalesce(a.approved_count, 0)
+            FROM keys AS k
+            LEFT JOIN earned_to_date AS e
+                ON e.employee_id = k.employee_id
+                AND e.pay_period_start = k.pay_period_start
+                AND e.pay_period_end = k.pay_period_end
+            LEFT JOIN actual AS a
+                ON a.employee_id = k.employee_id
+                AND a.pay_period_start = k.pay_period_start
+                AND a.pay_period_end = k.pay_period_end
+            ORDER BY k.employee_id, k.pay_period_start, k.pay_period_end
+            """
+        )
+    ).all()
+
+    mismatches = []
+    for emp_id, start, end, *values in rows:
+        stored, actual = tuple(values[:2]), tuple(values[2:])
+        if stored[1] == actual[1] and abs(stored[0] - actual[0]) < HOURS_TOLERANCE:
+            continue
+        mismatches.append(
+            {
+                "employee_id": emp_id,
+                "pay_period_start": start,
+                "pay_period_end": end,
+                "stored": stored,
+                "actual": actual,
+            }
+        )
+
+    if mismatches:
+        logger.warning("Earned-to-date mismatch for %d periods", len(mismatches))
+        if repair:
+            rebuild_earned_to_date(bind)
+    return mismatches
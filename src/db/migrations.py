@@ -0,0 +1,156 @@
+"""Schema upgrades for existing Jem HR databases."""
+
+import logging
+from typing import Any, Callable
+
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
+
+from .ledger import rebuild_earned_to_date, rebuild_ewa_ledger
+from .models import EARNED_TO_DATE_TRIGGERS, EWA_LEDGER_TRIGGERS, Base
+
+logger = logging.getLogger(__name__)
+
+# Stored in PRAGMA user_version. Bump whenever a table, column or index is
+# added to or removed from the models so existing databases are migrated on
+# next start.
+SCHEMA_VERSION = 4
+
+# Data backfills for derived tables, run once when migrating past a version
+_BACKFILLS: dict[int, Callable[[Connection], Any]] = {
+    2: rebuild_ewa_ledger,
+    3: rebuild_earned_to_date,
+}
+
+# Indexes removed from the models, dropped once when migrating past a version
+_DROPPED_INDEXES: dict[int, tuple[str, ...]] = {
+    # Eligibility reads earned_to_date now; nothing bounds pay_period_end
+    4: ("ix_timesheets_employee_status_period_end",),
+}
+
+
+def upgrade_schema(bind: Engine | Connection) -> list[str]:
+    """Add columns and indexes declared on the models that a database lacks.
+
+    Base.metadata.create_all() skips tables that already exist, so databases
+    created before a column or index was declared never receive it. This adds
+    missing nullable columns (ALTER TABLE ... ADD COLUMN) and missing named
+    indexes in place.
+
+    Args:
+        bind: SQLAlchemy engine or connection bound to the database.
+
+    Returns:
+        Names of what was created: "table.column" for columns, the index
+        name for indexes.
+
+    Raises:
+        RuntimeError: If a missing column is NOT NULL and cannot be added.
+    """
+    if isinstance(bind, Engine):
+        with bind.begin() as conn:
+            return upgrade_schema(conn)
+
+    inspector = inspect(bind)
+    existing_tables = set(inspector.get_table_names())
+    created = []
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        existing_columns = {col["name"] for col in inspector.get_columns(table.name)}
+        for column in table.columns:
+            if column.name in existing_columns:
+                continue
+            if not column.nullable:
+                raise RuntimeError(
+                    f"Cannot add NOT NULL column {table.name}.{column.name} in place"
+                )
+            column_type = column.type.compile(dialect=bind.dialect)
+            bind.exec_driver_sql(
+                f"ALTER TABLE {table.name} ADD COLUMN {column.name} {column_type}"
+            )
+            created.append(f"{table.name}.{column.name}")
+            logger.info("Added column %s.%s", table.name, column.name)
+
+        existing_indexes = {ix["name"] for ix in inspector.get_indexes(table.name)}
+        for index in table.indexes:
+            if index.name in existing_indexes:
+                continue
+            index.create(bind)
+            created.append(index.name)
+            logger.info("Created index %s on %s", index.name, table.name)
+
+    return created
+
+
+def get_schema_version(bind: Engine | Connection) -> int:
+    """Return the schema version recorded in the database (0 if never set)."""
+    if isinstance(bind, Engine):
+        with bind.connect() as conn:
+            return get_schema_version(conn)
+    return bind.exec_driver_sql("PRAGMA user_version").scalar()
+
+
+def ensure_schema(bind: Engine | Connection) -> bool:
+    """Bring the database schema up to SCHEMA_VERSION if it is behind.
+
+    A database already at SCHEMA_VERSION costs one PRAGMA read. Otherwise
+    this creates missing tables, runs upgrade_schema(), drops indexes the
+    models no longer declare, installs triggers, runs the backfills for
+    each version passed, and records the new version.
+
+    Args:
+        bind: SQLAlchemy engine or connection bound to the database.
+
+    Returns:
+        True if the schema was created or migrated, False if it was current.
+    """
+    version = get_schema_version(bind)
+    if version == SCHEMA_VERSION:
+        return False
+    if version > SCHEMA_VERSION:
+        logger.warning(
+            "Database schema version %d is newer than this code (%d)",
+            version,
+            SCHEMA_VERSION,
+        )
+        return False
+
+    if isinstance(bind, Engine):
+        with bind.begin() as conn:
+            return _migrate(conn)
+    return _migrate(bind)
+
+
+def _migrate(conn: Connection) -> bool:
+    """Create and upgrade tables, backfill derived data, stamp SCHEMA_VERSION.
+
+    pysqlite runs DDL outside any transaction, so the migration first takes
+    SQLite's write lock with BEGIN IMMEDIATE and then re-reads the version:
+    a process that started at the same time waits for the first one to
+    commit and finds nothing left to do.
+    """
+    if not conn.connection.driver_connection.in_transaction:
+        conn.exec_driver_sql("BEGIN IMMEDIATE")
+    version = get_schema_version(conn)
+    if version >= SCHEMA_VERSION:
+        return False
+
+    Base.metadata.create_all(conn)
+    upgrade_schema(conn)
+    for target, indexes in sorted(_DROPPED_INDEXES.items()):
+        if version < target:
+            for name in indexes:
+                conn.exec_driver_sql(f"DROP INDEX IF EXISTS {name}")
+    for trigger in EWA_LEDGER_TRIGGERS + EARNED_TO_DATE_TRIGGERS:
+        conn.exec_driver_sql(trigger)
+    for target, backfill in sorted(_BACKFILLS.items()):
+        if version < target:
+            backfill(conn)
+    conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION}")
+    logger.info(
+        "Database schema migrated from version %d to %d", version, SCHEMA_VERSION
+    )
+    return True
@@ -4,7 +4,7 @@ from datetime import date, datetime
 from enum import Enum
 from typing import Optional
 
-from sqlalchemy import ForeignKey, String, Text
+from sqlalchemy import DDL, ForeignKey, Index, String, Text, event
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -94,6 +94,11 @@ class LeaveBalance(Base):
     """Leave balance tracking per employee and leave type."""
 
     __tablename__ = "leave_balances"
+    __table_args__ = (
+        Index(
+            "uq_leave_balances_employee_type", "employee_id", "leave_type", unique=True
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     employee_id: Mapped[str] = mapped_column(
@@ -122,6 +127,15 @@ class Timesheet(Base):
     """Timesheet entries for pay period tracking."""
 
     __tablename__ = "timesheets"
+    __table_args__ = (
+        Index(
+            "ix_timesheets_employee_status_period",
+            "employee_id",
+            "status",
+            "pay_period_start",
+            "pay_period_end",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     employee_id: Mapped[str] = mapped_column(
@@ -152,6 +166,20 @@ class EWATransaction(Base):
     """Earned Wage Access transaction records."""
 
     __tablename__ = "ewa_transactions"
+    __table_args__ = (
+        Index(
+            "ix_ewa_transactions_employee_status_disbursed",
+            "employee_id",
+            "status",
+            "disbursed_at",
+        ),
+        Index(
+            "uq_ewa_transactions_employee_idempotency",
+            "employee_id",
+            "idempotency_key",
+            unique=True,
+        ),
+    )
 
     id: Mapped[str] = mapped_column(String(20), primary_key=True)
     employee_id: Mapped[str] = mapped_column(
@@ -162,6 +190,7 @@ class EWATransaction(Base):
     status: Mapped[str] = mapped_column(String(20), default=EWAStatus.PENDING.value)
     requested_at: Mapped[datetime]
     disbursed_at: Mapped[Optional[datetime]] = mapped_column(default=None)
+    idempotency_key: Mapped[Optional[str]] = mapped_column(String(64), default=None)
 
     # Relationships
     employee: Mapped["Employee"] = relationship(back_populates="ewa_transactions")
@@ -177,3 +206,154 @@ class EWATransaction(Base):
             "requested_at": self.requested_at.isoformat(),
             "disbursed_at": self.disbursed_at.isoformat() if self.disbursed_at else None,
         }
+
+
+class EWALedger(Base):
+    """Running EWA totals per employee, maintained by triggers.
+
+    Triggers on ewa_transactions keep this in step with every insert,
+    status change and delete in the same transaction, whichever code path
+    writes the row. Rebuild or verify with src.db.ledger.
+    """
+
+    __tablename__ = "ewa_ledger"
+
+    employee_id: Mapped[str] = mapped_column(
+        String(10), ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True
+    )
+    outstanding_amount: Mapped[float] = mapped_column(default=0.0)
+    outstanding_count: Mapped[int] = mapped_column(default=0)
+    last_disbursed_at: Mapped[Optional[datetime]] = mapped_column(default=None)
+
+    def to_dict(self) -> dict:
+        """Convert ledger row to dictionary."""
+        return {
+            "employee_id": self.employee_id,
+            "outstanding_amount": self.outstanding_amount,
+            "outstanding_count": self.outstanding_count,
+            "last_disbursed_at": (
+                self.last_disbursed_at.isoformat() if self.last_disbursed_at else None
+            ),
+        }
+
+
+# A transaction's contribution to its employee's ledger row. Amounts are
+# rounded to cents so repeated add/subtract cannot drift.
+_LEDGER_ADD = """
+    INSERT INTO ewa_ledger
+        (employee_id, outstanding_amount, outstanding_count, last_disbursed_at)
+    VALUES (
+        NEW.employee_id,
+        CASE WHEN NEW.status = 'disbursed' THEN round(NEW.amount, 2) ELSE 0 END,
+        CASE WHEN NEW.status = 'disbursed' THEN 1 ELSE 0 END,
+        NEW.disbursed_at
+    )
+    ON CONFLICT (employee_id) DO UPDATE SET
+        outstanding_amount =
+            round(outstanding_amount + excluded.outstanding_amount, 2),
+        outstanding_count = outstanding_count + excluded.outstanding_count,
+        last_disbursed_at = CASE
+            WHEN last_disbursed_at IS NULL
+                OR excluded.last_disbursed_at > last_disbursed_at
+            THEN excluded.last_disbursed_at
+            ELSE last_disbursed_at
+        END;
+"""
+_LEDGER_SUBTRACT = """
+    UPDATE ewa_ledger SET
+        outstanding_amount = round(outstanding_amount
+            - CASE WHEN OLD.status = 'disbursed' THEN round(OLD.amount, 2) ELSE 0 END,
+            2),
+        outstanding_count = outstanding_count
+            - CASE WHEN OLD.status = 'disbursed' THEN 1 ELSE 0 END
+    WHERE employee_id = OLD.employee_id;
+"""
+
+EWA_LEDGER_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS trg_ewa_ledger_insert
+    AFTER INSERT ON ewa_transactions
+    BEGIN {_LEDGER_ADD} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_ewa_ledger_update
+    AFTER UPDATE OF employee_id, amount, status, disbursed_at ON ewa_transactions
+    BEGIN {_LEDGER_SUBTRACT} {_LEDGER_ADD} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_ewa_ledger_delete
+    AFTER DELETE ON ewa_transactions
+    BEGIN {_LEDGER_SUBTRACT}
+    UPDATE ewa_ledger SET last_disbursed_at = (
+        SELECT max(disbursed_at) FROM ewa_transactions
+        WHERE employee_id = OLD.employee_id
+    ) WHERE employee_id = OLD.employee_id;
+    END""",
+]
+
+for _trigger in EWA_LEDGER_TRIGGERS:
+    event.listen(EWALedger.__table__, "after_create", DDL(_trigger))
+
+
+class EarnedToDate(Base):
+    """Approved hours per employee and pay period, maintained by triggers.
+
+    Triggers on timesheets add a timesheet's hours when it is inserted as or
+    moves to approved, and remove them when it leaves approved, changes or
+    is deleted. Earned wages are approved_hours times the employee's current
+    hourly rate. Rebuild or verify with src.db.ledger.
+    """
+
+    __tablename__ = "earned_to_date"
+
+    employee_id: Mapped[str] = mapped_column(
+        String(10), ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True
+    )
+    pay_period_start: Mapped[date] = mapped_column(primary_key=True)
+    pay_period_end: Mapped[date] = mapped_column(primary_key=True)
+    approved_hours: Mapped[float] = mapped_column(default=0.0)
+    approved_count: Mapped[int] = mapped_column(default=0)
+
+    def to_dict(self) -> dict:
+        """Convert accumulator row to dictionary."""
+        return {
+            "employee_id": self.employee_id,
+            "pay_period_start": self.pay_period_start.isoformat(),
+            "pay_period_end": self.pay_period_end.isoformat(),
+            "approved_hours": self.approved_hours,
+            "approved_count": self.approved_count,
+        }
+
+
+# An approved timesheet's contribution to its period's accumulator row.
+# Hours are rounded so repeated add/subtract leaves no float residue.
+_EARNED_ADD = """
+    INSERT INTO earned_to_date (employee_id, pay_period_start, pay_period_end,
+        approved_hours, approved_count)
+    SELECT NEW.employee_id, NEW.pay_period_start, NEW.pay_period_end,
+        NEW.hours_worked, 1
+    WHERE NEW.status = 'approved'
+    ON CONFLICT (employee_id, pay_period_start, pay_period_end) DO UPDATE SET
+        approved_hours = round(approved_hours + excluded.approved_hours, 6),
+        approved_count = approved_count + 1;
+"""
+_EARNED_SUBTRACT = """
+    UPDATE earned_to_date SET
+        approved_hours = round(approved_hours - OLD.hours_worked, 6),
+        approved_count = approved_count - 1
+    WHERE OLD.status = 'approved'
+        AND employee_id = OLD.employee_id
+        AND pay_period_start = OLD.pay_period_start
+        AND pay_period_end = OLD.pay_period_end;
+"""
+
+EARNED_TO_DATE_TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS trg_earned_to_date_insert
+    AFTER INSERT ON timesheets
+    BEGIN {_EARNED_ADD} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_earned_to_date_update
+    AFTER UPDATE OF employee_id, pay_period_start, pay_period_end, hours_worked,
+        status ON timesheets
+    BEGIN {_EARNED_SUBTRACT} {_EARNED_ADD} END""",
+    f"""CREATE TRIGGER IF NOT EXISTS trg_earned_to_date_delete
+    AFTER DELETE ON timesheets
+    BEGIN {_EARNED_SUBTRACT} END""",
+]
+
+for _trigger in EARNED_TO_DATE_TRIGGERS:
+    event.listen(EarnedToDate.__table__, "after_create", DDL(_trigger))
@@ -0,0 +1,81 @@
+"""Lightweight read-only records built from column projections.
+
+Read paths that only need to serialise rows select the columns directly and
+wrap each Row in a __slots__ record, skipping ORM hydration and identity-map
+bookkeeping.
+"""
+
+from datetime import date
+
+from sqlalchemy import Select, select
+
+from .models import Employee
+
+
+class EmployeeRecord:
+    """Read-only employee profile, field-compatible with Employee.to_dict()."""
+
+    __slots__ = (
+        "id",
+        "name",
+        "department",
+        "role",
+        "hire_date",
+        "hourly_rate",
+        "preferred_language",
+        "bank_account_last4",
+        "employment_status",
+    )
+
+    COLUMNS = (
+        Employee.id,
+        Employee.name,
+        Employee.department,
+        Employee.role,
+        Employee.hire_date,
+        Employee.hourly_rate,
+        Employee.preferred_language,
+        Employee.bank_account_last4,
+        Employee.employment_status,
+    )
+
+    def __init__(
+        self,
+        id: str,
+        name: str,
+        department: str,
+        role: str,
+        hire_date: date,
+        hourly_rate: float,
+        preferred_language: str,
+        bank_account_last4: str,
+        employment_status: str,
+    ) -> None:
+        self.id = id
+        self.name = name
+        self.department = department
+        self.role = role
+        self.hire_date = hire_date
+        self.hourly_rate = hourly_rate
+        self.preferred_language = preferred_language
+        self.bank_account_last4 = bank_account_last4
+        self.employment_status = employment_status
+
+    @classmethod
+    def select(cls) -> Select:
+        """Return a SELECT of exactly the columns this record needs."""
+        return select(*cls.COLUMNS)
+
+    def to_dict(self) -> dict:
+        """Convert employee record to dictionary."""
+        return {
+            "id": self.id,
+            "name": self.name,
+            "department": self.department,
+            "role": self.role,
+            "hire_date": self.hire_date.isoformat(),
+            "hourly_rate": self.hourly_rate,
+            "preferred_language": self.preferred_language,
+            "bank_account_last4": self.bank_account_last4,
+            "employment_status": self.employment_status,
+        }
@@ -1,8 +1,14 @@
 """Database seeding for Jem HR Demo."""
 
+import calendar
 import logging
-from datetime import date, datetime
+import random
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+from typing import Iterable, Iterator, Optional
 
+from sqlalchemy import Table
+from sqlalchemy.engine import Connection
 from sqlalchemy.orm import Session
 
 from .models import (
@@ -253,3 +259,318 @@ def seed_database(session: Session) -> None:
 
     session.commit()
     logger.info("Database seeded successfully with 12 employees.")
+
+
+# Synthetic data generation for performance testing
+SYNTHETIC_ID_PREFIX = "EMP"
+SYNTHETIC_ID_DIGITS = 7
+
+DEFAULT_LANGUAGE_MIX = {
+    "en": 0.30,
+    "zu": 0.20,
+    "xh": 0.15,
+    "af": 0.15,
+    "nso": 0.10,
+    "st": 0.10,
+}
+
+# Name pools per language: (first names, surnames)
+_SYNTHETIC_NAMES = {
+    "en": (
+        ["David", "Sarah", "Michael", "Grace"],
+        ["Smith", "Naidoo", "Pillay", "Adams"],
+    ),
+    "zu": (
+        ["Sipho", "Precious", "Ayanda", "Nomvula"],
+        ["Dlamini", "Ndlovu", "Zulu", "Sithole"],
+    ),
+    "xh": (
+        ["Thandiwe", "Lindiwe", "Lwazi", "Siyabonga"],
+        ["Nkosi", "Khumalo", "Mbeki", "Gqola"],
+    ),
+    "af": (
+        ["Johan", "Pieter", "Maria", "Annelie"],
+        ["van der Berg", "Botha", "van Wyk", "Pretorius"],
+    ),
+    "nso": (
+        ["Lerato", "Tshepo", "Mpho", "Karabo"],
+        ["Molefe", "Mokoena", "Ramaphosa", "Sekgota"],
+    ),
+    "st": (
+        ["Thabo", "Palesa", "Lebohang", "Teboho"],
+        ["Mokoena", "Moshoeshoe", "Letsie", "Nthako"],
+    ),
+}
+
+_SYNTHETIC_JOBS = [(e["department"], e["role"]) for e in EMPLOYEES]
+
+
+def synthetic_employee_id(n: int) -> str:
+    """Return the synthetic employee ID for 1-based index n (e.g. EMP0000001)."""
+    return f"{SYNTHETIC_ID_PREFIX}{n:0{SYNTHETIC_ID_DIGITS}d}"
+
+
+def pay_periods(
+    count: int, current_start: date = PAY_PERIOD_START
+) -> list[tuple[date, date]]:
+    """Return semi-monthly pay periods ending with the current one, oldest first.
+
+    Args:
+        count: Number of periods, including the current one.
+        current_start: Start date of the current period (1st or 16th).
+
+    Returns:
+        List of (start, end) date tuples.
+    """
+    periods = []
+    start = current_start
+    for _ in range(count):
+        if start.day == 1:
+            end = start.replace(day=15)
+        else:
+            end = start.replace(day=calendar.monthrange(start.year, start.month)[1])
+        periods.append((start, end))
+        if start.day == 16:
+            start = start.replace(day=1)
+        else:
+            prev = start - timedelta(days=1)
+            start = prev.replace(day=16)
+    periods.reverse()
+    return periods
+
+
+def _sql_date(value: date) -> str:
+    """Render a date the way SQLAlchemy stores SQLite DATE values."""
+    return value.isoformat()
+
+
+def _sql_datetime(value: datetime) -> str:
+    """Render a datetime the way SQLAlchemy stores SQLite DATETIME values."""
+    return value.isoformat(sep=" ", timespec="microseconds")
+
+
+def _insert_chunked(
+    conn: Connection,
+    table: Table,
+    columns: tuple[str, ...],
+    rows: Iterable[tuple],
+    chunk_size: int,
+) -> int:
+    """Insert pre-rendered row tuples with DB-API executemany in chunks.
+
+    Rows bypass SQLAlchemy's per-value bind processing, so dates and
+    datetimes must already be rendered with _sql_date/_sql_datetime.
+    """
+    statement = (
+        f"INSERT INTO {table.name} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' for _ in columns)})"
+    )
+    total = 0
+    iterator = iter(rows)
+    while chunk := list(islice(iterator, chunk_size)):
+        conn.exec_driver_sql(statement, chunk)
+        total += len(chunk)
+    return total
+
+
+def generate_synthetic_data(
+    session: Session,
+    employees: int,
+    periods: int = 6,
+    shifts_per_period: int = 1,
+    ewa_rate: float = 0.3,
+    language_mix: Optional[dict[str, float]] = None,
+    seed: int = 42,
+    chunk_size: int = 20_000,
+) -> dict[str, int]:
+    """Stream a deterministic, production-shaped dataset into the database.
+
+    Rows are produced by generators and written with bulk inserts in chunks,
+    so at most chunk_size rows are held at once. A small profile per
+    employee (rate, probation, current-period hours) is kept for the whole
+    run, so memory still grows with the number of employees.
+
+    Employees get IDs EMP0000001..; the demo personas (EMP001-EMP012) are
+    unaffected. Idempotent: skips generation if the first synthetic
+    employee exists.
+
+    Args:
+        session: SQLAlchemy session; rows are inserted on its connection and
+                 committed at the end.
+        employees: Number of synthetic employees.
+        periods: Semi-monthly pay periods per employee, ending with the
+                 current period (PAY_PERIOD_START).
+        shifts_per_period: Timesheet rows per employee per period.
+        ewa_rate: Probability an employee takes an advance in a period.
+        language_mix: Preferred-language weights. Defaults to
+                      DEFAULT_LANGUAGE_MIX.
+        seed: Random seed; the same arguments always produce the same rows.
+        chunk_size: Rows per INSERT batch.
+
+    Returns:
+        Row counts per table.
+    """
+    if session.get(Employee, synthetic_employee_id(1)) is not None:
+        logger.info("Synthetic data already present. Skipping.")
+        return {}
+
+    mix = language_mix or DEFAULT_LANGUAGE_MIX
+    languages = list(mix)
+    cum_weights = []
+    running = 0.0
+    for lang in languages:
+        running += mix[lang]
+        cum_weights.append(running)
+    period_list = [
+        (_sql_date(start), _sql_date(end), start, end)
+        for start, end in pay_periods(periods)
+    ]
+    last = len(period_list) - 1
+    conn = session.connection()
+
+    rng = random.Random(seed)
+    rand = rng.random
+
+    # Pass 1 output reused by later passes: (id, hourly_rate, on_probation)
+    profiles: list[tuple[str, float, bool]] = []
+    # Current-period hours per employee, used to keep open advances within
+    # the 50% of earned wages rule.
+    current_hours: dict[str, float] = {}
+
+    def employee_rows() -> Iterator[tuple]:
+        for n in range(1, employees + 1):
+            lang = rng.choices(languages, cum_weights=cum_weights)[0]
+            first_names, last_names = _SYNTHETIC_NAMES.get(lang, _SYNTHETIC_NAMES["en"])
+            department, role = _SYNTHETIC_JOBS[int(rand() * len(_SYNTHETIC_JOBS))]
+            on_probation = rand() < 0.05
+            if on_probation:
+                hire_date = PAY_PERIOD_START - timedelta(days=1 + int(rand() * 80))
+            else:
+                hire_date = date(2015, 1, 1) + timedelta(days=int(rand() * 3900))
+            hourly_rate = round(32.0 + rand() * 58.0, 2)
+            emp_id = synthetic_employee_id(n)
+            profiles.append((emp_id, hourly_rate, on_probation))
+            yield (
+                emp_id,
+                f"{first_names[int(rand() * 4)]} {last_names[int(rand() * 4)]}",
+                department,
+                role,
+                _sql_date(hire_date),
+                hourly_rate,
+                lang,
+                f"{int(rand() * 10000):04d}",
+                (
+                    EmploymentStatus.PROBATION.value
+                    if on_probation
+                    else EmploymentStatus.ACTIVE.value
+                ),
+            )
+
+    def leave_rows() -> Iterator[tuple]:
+        for emp_id, _, _ in profiles:
+            for leave_type, accrued in (
+                (LeaveType.ANNUAL.value, 15),
+                (LeaveType.SICK.value, 10),
+                (LeaveType.FAMILY.value, 3),
+            ):
+                used = int(rand() * (accrued + 1))
+                yield (
+                    emp_id,
+                    leave_type,
+                    float(accrued - used),
+                    float(accrued),
+                    float(used),
+                )
+
+    def timesheet_rows() -> Iterator[tuple]:
+        approved = TimesheetStatus.APPROVED.value
+        for emp_id, _, _ in profiles:
+            for idx, (start, end, _, _) in enumerate(period_list):
+                hours = (80 + int(rand() * 121)) / 2  # 40-100 hours, half-hour steps
+                if idx == last:
+                    current_hours[emp_id] = hours
+                    status = TimesheetStatus.PENDING.value if rand() < 0.1 else approved
+                else:
+                    rejected = rand() < 0.03
+                    status = TimesheetStatus.REJECTED.value if rejected else approved
+                row = (emp_id, start, end, round(hours / shifts_per_period, 2), status)
+                for _ in range(shifts_per_period):
+                    yield row
+
+    def ewa_rows() -> Iterator[tuple]:
+        counter = 0
+        for emp_id, hourly_rate, on_probation in profiles:
+            if on_probation:
+                continue
+            for idx, (_, _, start, end) in enumerate(period_list):
+                if rand() >= ewa_rate:
+                    continue
+                counter += 1
+                hours = current_hours.get(emp_id, 80.0) if idx == last else 80.0
+                ceiling = min(hours * hourly_rate * 0.5, 5000)
+                amount = max(50, int((100 + rand() * (ceiling - 100)) // 50) * 50)
+                day = start + timedelta(days=int(rand() * ((end - start).days + 1)))
+                when = _sql_datetime(
+                    datetime.combine(day, time(7 + int(rand() * 14), int(rand() * 60)))
+                )
+                status = (
+                    EWAStatus.DISBURSED.value if idx == last else EWAStatus.REPAID.value
+                )
+                yield (
+                    f"EWA-{day:%Y%m%d}-{counter:07d}",
+                    emp_id,
+                    float(amount),
+                    10.0,
+                    status,
+                    when,
+                    when,
+                )
+
+    logger.info(
+        "Generating synthetic data: %d employees x %d periods x %d shifts",
+        employees,
+        periods,
+        shifts_per_period,
+    )
+    counts = {
+        "employees": _insert_chunked(
+            conn,
+            Employee.__table__,
+            (
+                "id", "name", "department", "role", "hire_date", "hourly_rate",
+                "preferred_language", "bank_account_last4", "employment_status",
+            ),
+            employee_rows(),
+            chunk_size,
+        ),
+        "leave_balances": _insert_chunked(
+            conn,
+            LeaveBalance.__table__,
+            ("employee_id", "leave_type", "balance_days", "accrued_ytd", "used_ytd"),
+            leave_rows(),
+            chunk_size,
+        ),
+        "timesheets": _insert_chunked(
+            conn,
+            Timesheet.__table__,
+            (
+                "employee_id", "pay_period_start", "pay_period_end",
+                "hours_worked", "status",
+            ),
+            timesheet_rows(),
+            chunk_size,
+        ),
+        "ewa_transactions": _insert_chunked(
+            conn,
+            EWATransaction.__table__,
+            (
+                "id", "employee_id", "amount", "fee", "status",
+                "requested_at", "disbursed_at",
+            ),
+            ewa_rows(),
+            chunk_size,
+        ),
+    }
+    session.commit()
+    logger.info("Synthetic data generated: %s", counts)
+    return counts
@@ -1,11 +1,16 @@
 """Internationalization module for Jem HR Demo."""
 
 from .detector import detect_language, iso_to_nllb
+from .intents import match_intent
+from .slots import clean_slots, extract_slots
 from .translator import get_translator, translate
 
 __all__ = [
+    "clean_slots",
     "detect_language",
+    "extract_slots",
     "get_translator",
     "iso_to_nllb",
+    "match_intent",
     "translate",
 ]
@@ -11,24 +11,30 @@ _LANGUAGE_KEYWORDS = {
         "sawubona", "ngicela", "ngifuna", "imali", "yami", "ukubona",
         "usuku", "amalanga", "umsebenzi", "ngiyabonga", "isikhathi",
         "ngiyanicela", "ngingathanda", "eholidini", "umholo",
+        "ikhefu", "amangaki", "ezingaki", "elisele", "kusengaphambili",
+        "ngaphambili", "ukuboleka", "isitatimende", "umthetho", "imithetho",
     ],
     "xh": [
         "molo", "ndifuna", "ndingathanda", "imali", "yam", "ukwazi",
         "ndicela", "ndibona", "umsebenzi", "enkosi", "ixesha",
-        "amalanga", "eholide", "umvuzo",
+        "amalanga", "eholide", "umvuzo", "ikhefu", "amangaphi", "ezingaphi",
+        "eseleyo", "kwangaphambili", "ukuboleka", "umgaqo", "imigaqo",
     ],
     "af": [
         "hoeveel", "verlof", "salaris", "asseblief", "dankie", "werk",
         "betaling", "geld", "voorskot", "beleid", "siekteverlof",
-        "jaarlikse", "balans", "oor",
+        "jaarlikse", "balans", "oor", "verlofbalans", "verlofdae",
+        "salarisstrokie", "betaalstrokie", "loonstrokie", "strokie",
+        "besonderhede", "profiel", "aanvra", "aansoek", "neem", "kwalifiseer",
+        "aanmerking", "salarisvoorskot", "toegelaat", "regulasie", "oortyd",
     ],
     "nso": [
         "dumela", "kgopela", "nyaka", "tshelete", "mosomo", "matšatši",
-        "leholetse", "moputso", "lebaka",
+        "leholetse", "moputso", "lebaka", "molao", "melao", "pholisi",
     ],
     "st": [
         "lumela", "kopa", "batla", "tjhelete", "mosebetsi", "matsatsi",
-        "phomolo", "moputso", "molao",
+        "phomolo", "moputso", "molao", "melao", "pholisi", "setseng",
     ],
 }
 
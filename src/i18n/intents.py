@@ -0,0 +1,280 @@
+"""Keyword intent and tool matching for South African languages.
+
+match_intent() scores a message against keyword lists, like
+detect_language() does for languages, so common requests can be routed
+without an LLM call. Each keyword points at a tool, or only at an intent
+when it says what the message is about but not which tool answers it
+("advance" is an EWA request, but is it a check or a request?).
+
+English keywords are listed here. For the other languages the vocabulary
+is the language detector's own keyword lists: _LANGUAGE_KEYWORD_TARGETS
+says what each of those words is about, and words it does not list
+(greetings, "please") only identify the language.
+
+Keywords are matched as whole words; a trailing "*" also matches longer
+words ("regulation*" matches "regulations"). A match weighs as many points
+as the keyword has words, and overlapping keywords are matched longest
+first, so "leave balance" counts once, for get_leave_balance, rather than
+also as "leave".
+
+Tool hints ("how much can I", "ngicela") choose a tool only when the
+keywords settled the intent but named none of its tools: "ngicela" asks
+for something in an EWA message, but says nothing about whether the
+message is about EWA.
+"""
+
+import re
+from typing import Optional
+
+from .detector import _LANGUAGE_KEYWORDS
+
+# Intent each matched target belongs to: tools, plus intent-only cues
+_TARGET_INTENTS = {
+    "get_leave_balance": "hr_query",
+    "get_payslip": "hr_query",
+    "get_employee": "hr_query",
+    "submit_leave_request": "hr_query",
+    "hr_query": "hr_query",
+    "check_ewa_eligibility": "ewa_request",
+    "request_ewa_advance": "ewa_request",
+    "ewa_request": "ewa_request",
+    "search_policies": "policy_question",
+}
+
+# Intents answered by a single tool, so the intent alone selects it
+_SINGLE_TOOL_INTENTS = {"policy_question": "search_policies"}
+
+_ENGLISH_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "get_leave_balance": (
+        "leave balance", "leave days", "days of leave", "leave left",
+        "days left", "how much leave", "remaining leave", "balance",
+    ),
+    "get_payslip": (
+        "payslip*", "pay slip*", "salary slip", "net pay", "deductions",
+        "tax deducted", "did i earn",
+    ),
+    "get_employee": (
+        "my profile", "my details", "personal details", "employee details",
+        "employee number", "my manager", "department", "job title",
+    ),
+    "submit_leave_request": (
+        "book*", "apply for leave", "request leave", "take leave",
+        "take off", "day off", "leave request", "submit leave",
+        "going on leave",
+    ),
+    "check_ewa_eligibility": ("eligible", "eligibility", "qualify"),
+    "request_ewa_advance": (
+        "withdraw", "borrow", "request an advance", "get an advance",
+    ),
+    "ewa_request": (
+        "advance", "ewa", "early pay", "earned wage*", "wage access",
+        "salary advance", "before payday",
+    ),
+    "search_policies": (
+        "policy", "policies", "rule*", "regulation*", "entitle*",
+        "allowed", "maternity", "paternity", "parental", "overtime",
+        "notice period", "bcea", "code of conduct", "disciplinary",
+        "dress code", "public holiday*", "work from home",
+    ),
+}
+
+_ENGLISH_HINTS: dict[str, tuple[str, ...]] = {
+    "check_ewa_eligibility": (
+        "how much can i", "available to me", "limit", "check",
+    ),
+    "request_ewa_advance": ("give me", "send me"),
+}
+
+# What words from the language detector's lists are about
+_LANGUAGE_KEYWORD_TARGETS = {
+    "get_leave_balance": (
+        "balans", "verlofbalans", "verlofdae", "amangaki", "ezingaki",
+        "elisele", "amangaphi", "ezingaphi", "eseleyo", "setseng",
+    ),
+    "get_payslip": (
+        "salarisstrokie", "betaalstrokie", "loonstrokie", "strokie",
+        "umholo", "isitatimende", "umvuzo",
+    ),
+    "get_employee": ("besonderhede", "profiel"),
+    "submit_leave_request": ("aanvra", "aansoek"),
+    "hr_query": ("verlof", "ikhefu", "leholetse", "phomolo"),
+    "check_ewa_eligibility": ("kwalifiseer", "aanmerking"),
+    "ewa_request": (
+        "voorskot", "salarisvoorskot", "imali", "kusengaphambili",
+        "ngaphambili", "kwangaphambili", "ukuboleka", "tshelete", "tjhelete",
+    ),
+    "search_policies": (
+        "beleid", "toegelaat", "regulasie", "oortyd", "umthetho", "imithetho",
+        "umgaqo", "imigaqo", "molao", "melao", "pholisi",
+    ),
+}
+
+# Detector words that hint at a tool: asking for something, or to see it
+_LANGUAGE_HINT_TARGETS = {
+    "request_ewa_advance": (
+        "ngicela", "ngifuna", "ndicela", "ndifuna", "kgopela", "nyaka",
+        "kopa", "batla",
+    ),
+    "submit_leave_request": (
+        "ngicela", "ngifuna", "ndicela", "ndifuna", "kgopela", "nyaka",
+        "kopa", "batla", "neem",
+    ),
+    "get_leave_balance": ("hoeveel",),
+    "check_ewa_eligibility": ("hoeveel", "ukubona", "ukwazi"),
+    "get_payslip": ("ukubona", "ukwazi"),
+}
+
+
+def _from_language_keywords(
+    targets: dict[str, tuple[str, ...]],
+) -> dict[str, dict[str, tuple[str, ...]]]:
+    """Select each language's detector keywords that point at a target."""
+    tables: dict[str, dict[str, tuple[str, ...]]] = {}
+    for language, keywords in _LANGUAGE_KEYWORDS.items():
+        table = {}
+        for target, words in targets.items():
+            found = tuple(word for word in words if word in keywords)
+            if found:
+                table[target] = found
+        tables[language] = table
+    return tables
+
+
+_INTENT_KEYWORDS: dict[str, dict[str, tuple[str, ...]]] = {
+    "en": _ENGLISH_KEYWORDS,
+    **_from_language_keywords(_LANGUAGE_KEYWORD_TARGETS),
+}
+
+# Words that pick a tool within an intent but do not suggest the intent
+_TOOL_HINTS: dict[str, dict[str, tuple[str, ...]]] = {
+    "en": _ENGLISH_HINTS,
+    **_from_language_keywords(_LANGUAGE_HINT_TARGETS),
+}
+
+# Pseudo-count added to the denominator: one single-word keyword scores
+# 1 / 1.5, two competing single-word keywords 1 / 2.5 each
+_PRIOR = 0.5
+
+
+# A keyword entry: its words, whether the last word is a prefix, the
+# targets it points at and whether it is a tool hint
+_Entry = tuple[tuple[str, ...], bool, frozenset[str], bool]
+
+_WORD = re.compile(r"\w+")
+
+
+def _compile(
+    keywords: dict[str, dict[str, tuple[str, ...]]],
+    hints: dict[str, dict[str, tuple[str, ...]]],
+) -> tuple[dict[str, list[_Entry]], dict[int, dict[str, list[_Entry]]]]:
+    """Index keywords and hints by their first word, longest first.
+
+    Returns:
+        Entries by exact first word, and single-word prefix entries by
+        prefix length and prefix.
+    """
+    targets: dict[tuple[str, bool], set[str]] = {}
+    for table, is_hint in ((keywords, False), (hints, True)):
+        for by_target in table.values():
+            for target, patterns in by_target.items():
+                for pattern in patterns:
+                    targets.setdefault((pattern, is_hint), set()).add(target)
+
+    by_word: dict[str, list[_Entry]] = {}
+    by_prefix: dict[int, dict[str, list[_Entry]]] = {}
+    for (pattern, is_hint), names in targets.items():
+        words = tuple(_WORD.findall(pattern))
+        entry = (words, pattern.endswith("*"), frozenset(names), is_hint)
+        if entry[1] and len(words) == 1:
+            index = by_prefix.setdefault(len(words[0]), {})
+        else:
+            index = by_word
+        index.setdefault(words[0], []).append(entry)
+    for index in (by_word, *by_prefix.values()):
+        for entries in index.values():
+            entries.sort(key=lambda entry: (-len(entry[0]), entry[3]))
+    return by_word, by_prefix
+
+
+_BY_WORD, _BY_PREFIX = _compile(_INTENT_KEYWORDS, _TOOL_HINTS)
+
+
+def _longest_match(words: list[str], start: int) -> Optional[_Entry]:
+    """Return the longest keyword starting at words[start], if any."""
+    word = words[start]
+    candidates = list(_BY_WORD.get(word, ()))
+    for length, index in _BY_PREFIX.items():
+        candidates.extend(index.get(word[:length], ()))
+
+    best = None
+    for entry in candidates:
+        pattern, is_prefix = entry[0], entry[1]
+        end = start + len(pattern)
+        if end > len(words) or (best and len(pattern) <= len(best[0])):
+            continue
+        if words[start : end - 1] != list(pattern[:-1]):
+            continue
+        last = words[end - 1]
+        if last == pattern[-1] or (is_prefix and last.startswith(pattern[-1])):
+            best = entry
+    return best
+
+
+def match_intent(text: str) -> dict:
+    """Score a message's intent and tool from keyword matches.
+
+    Args:
+        text: User message text.
+
+    Returns:
+        Dict with "intent" (or None if no keyword matched), its
+        "confidence" in [0, 1), "tool" (or None if the keywords do not
+        single one out) and "tool_confidence".
+    """
+    intent_scores: dict[str, float] = {}
+    tool_scores: dict[str, float] = {}
+    hint_scores: dict[str, float] = {}
+    words = _WORD.findall(text.lower())
+    position = 0
+    while position < len(words):
+        entry = _longest_match(words, position)
+        if entry is None:
+            position += 1
+            continue
+        pattern, _, targets, is_hint = entry
+        weight = len(pattern)
+        position += weight
+        for target in targets:
+            intent = _TARGET_INTENTS[target]
+            if not is_hint:
+                intent_scores[intent] = intent_scores.get(intent, 0) + weight
+            if target != intent:
+                scores = hint_scores if is_hint else tool_scores
+                scores[target] = scores.get(target, 0) + weight
+
+    if not intent_scores:
+        return {"intent": None, "confidence": 0.0, "tool": None, "tool_confidence": 0.0}
+
+    intent = max(intent_scores, key=intent_scores.get)
+    confidence = intent_scores[intent] / (sum(intent_scores.values()) + _PRIOR)
+
+    tool: Optional[str] = _SINGLE_TOOL_INTENTS.get(intent)
+    tool_confidence = confidence if tool else 0.0
+    candidates = {}
+    for scores in (tool_scores, hint_scores):
+        candidates = {
+            name: score
+            for name, score in scores.items()
+            if _TARGET_INTENTS[name] == intent
+        }
+        if candidates:
+            break
+    if not tool and candidates:
+        tool = max(candidates, key=candidates.get)
+        tool_confidence = candidates[tool] / (sum(candidates.values()) + _PRIOR)
+    return {
+        "intent": intent,
+        "confidence": confidence,
+        "tool": tool,
+        "tool_confidence": tool_confidence,
+    }
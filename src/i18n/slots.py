@@ -0,0 +1,459 @@
+"""Tool argument extraction for South African languages.
+
+extract_slots() fills the arguments the HR and EWA tools take straight from
+the message, with regular expressions compiled once at import:
+
+    start_date, end_date  "10 March", "1-3 Maart", "ngoMashi 3",
+                          "from the 2nd to the 5th of April", "2026-03-10",
+                          "10/03", "tomorrow", "next Friday", "next week",
+                          "3 days from 10 March" (counted in business days)
+    month                 "February", "Februarie 2026", "2026-02",
+                          "last month", "verlede maand"
+    leave_type            annual, sick or family, from words like "sick",
+                          "siekteverlof" or "lokugula"
+    amount                "R1 500", "R1,500.50", "R 800", "1.5k", "800 rand"
+
+Month and weekday names are recognised in English, Afrikaans and isiZulu
+(with the ngo-/ka-/ku-/u- prefixes isiZulu attaches), and weekdays also in
+isiXhosa, Sesotho and Sepedi. A day and month without a year fall in the
+current year unless that is more than 60 days ago, in which case they fall
+in the next: leave is booked ahead, but sick leave is often logged late. A
+month without a year is the most recent such month, since payslips look
+back.
+"""
+
+import re
+from datetime import date, timedelta
+from typing import Any, Iterable, Optional
+
+from src.workdays import count_business_days
+
+# Month names by language, January first
+_MONTH_NAMES = {
+    "en": (
+        "january", "february", "march", "april", "may", "june", "july",
+        "august", "september", "october", "november", "december",
+    ),
+    "af": (
+        "januarie", "februarie", "maart", "april", "mei", "junie", "julie",
+        "augustus", "september", "oktober", "november", "desember",
+    ),
+    "zu": (
+        "januwari", "februwari", "mashi", "ephreli", "meyi", "juni",
+        "julayi", "agasti", "septemba", "okthoba", "novemba", "disemba",
+    ),
+    # Traditional isiZulu month names
+    "zu_traditional": (
+        "masingana", "nhlolanja", "ndasa", "mbasa", "nhlaba", "nhlangulana",
+        "ntulikazi", "ncwaba", "mandulo", "mfumfu", "lwezi", "zibandlela",
+    ),
+}
+
+# Abbreviations, accepted only next to a day number ("3 Mar", "Des 12")
+_MONTH_ABBREVIATIONS = {
+    "jan": 1, "feb": 2, "mar": 3, "mrt": 3, "apr": 4, "jun": 6, "jul": 7,
+    "aug": 8, "sep": 9, "sept": 9, "oct": 10, "okt": 10, "nov": 11,
+    "dec": 12, "des": 12,
+}
+
+_MONTHS = {
+    name: number
+    for names in _MONTH_NAMES.values()
+    for number, name in enumerate(names, start=1)
+}
+
+# Weekday names by language, Monday first; None where a language's name
+# for the day is ambiguous (isiZulu "Sonto" also means "week")
+_WEEKDAY_NAMES = {
+    "en": (
+        "monday", "tuesday", "wednesday", "thursday", "friday", "saturday",
+        "sunday",
+    ),
+    "af": (
+        "maandag", "dinsdag", "woensdag", "donderdag", "vrydag", "saterdag",
+        "sondag",
+    ),
+    "zu": (
+        "msombuluko", "lwesibili", "lwesithathu", "lwesine", "lwesihlanu",
+        "mgqibelo", None,
+    ),
+    "xh": (
+        "mvulo", "lwesibini", "lwesithathu", "lwesine", "lwesihlanu",
+        "mgqibelo", "cawa",
+    ),
+    "st": (
+        "mantaha", "labobedi", "laboraro", "labone", "labohlano", "moqebelo",
+        "sontaha",
+    ),
+    "nso": (
+        "mošupologo", "labobedi", "laboraro", "labone", "labohlano",
+        "mokibelo", "lamorena",
+    ),
+}
+
+_WEEKDAYS = {
+    name: number
+    for names in _WEEKDAY_NAMES.values()
+    for number, name in enumerate(names)
+    if name
+}
+
+_TODAY_WORDS = ("today", "vandag", "namhlanje", "namuhla", "kajeno", "lehono")
+_TOMORROW_WORDS = ("tomorrow", "môre", "kusasa", "ngomso", "hosane", "gosasa")
+_NEXT_WEEK_PHRASES = (
+    "next week", "volgende week", "ngesonto elizayo", "kwiveki ezayo",
+    "bekeng e tlang", "beke ye e tlago",
+)
+_LAST_MONTH_PHRASES = (
+    "last month", "previous month", "verlede maand", "vorige maand",
+    "ngenyanga edlule", "kwinyanga ephelileyo",
+)
+_THIS_MONTH_PHRASES = ("this month", "hierdie maand", "kule nyanga")
+
+# Leave types in order of precedence, with the words naming them
+_LEAVE_TYPE_WORDS = (
+    ("sick", frozenset({"sick", "ill", "doctor", "dokter"})),
+    ("family", frozenset({"family", "funeral", "begrafnis", "umngcwabo"})),
+    ("annual", frozenset({"annual", "vacation", "jaarlikse", "vakansie"})),
+)
+# Words that start or end with these also name the type ("siekteverlof",
+# "gesinsverantwoordelikheid", "ukugula")
+_LEAVE_TYPE_AFFIXES = re.compile(r"\b(?:(?P<sick>siek|\w*gula\b)|(?P<family>gesin))")
+
+_LEAVE_TYPES = {"annual", "sick", "family"}
+
+# Days in the past a yearless date may be before it moves to next year
+_PAST_DATE_DAYS = 60
+
+
+def _alternation(names: Iterable[str]) -> str:
+    """Regex alternation of names, longest first."""
+    return "|".join(re.escape(name) for name in sorted(names, key=len, reverse=True))
+
+
+_ORDINAL = r"(?:st|nd|rd|th)?"
+_RANGE = r"\s*(?:-|–|to|until|till|through|tot|en|and|kuya|ukuya)\s*(?:the\s+)?"
+_PREFIX = r"(?:ngo|ka|ku|u|e)?-?"
+# Any word where a month name goes; _month_number() checks it is one
+_MONTH = r"\b(?:(?:ngo|ka|ku|u|e)-)?(?P<month>\w+)\b"
+_FULL_MONTH = rf"\b{_PREFIX}(?P<month>{_alternation(_MONTHS)})\b"
+
+_ISO_DATE = re.compile(r"\b(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})\b")
+_ISO_MONTH = re.compile(r"\b(?P<year>\d{4})-(?P<month>\d{2})\b(?!-\d)")
+_NUMERIC_DATE = re.compile(
+    r"\b(?P<day>\d{1,2})/(?P<month>\d{1,2})(?:/(?P<year>\d{4}|\d{2}))?\b"
+)
+_DAY_MONTH = re.compile(
+    rf"\b(?:the\s+)?(?P<day>\d{{1,2}}){_ORDINAL}"
+    rf"(?:{_RANGE}(?P<day2>\d{{1,2}}){_ORDINAL})?"
+    rf"\s+(?:of\s+|van\s+)?{_MONTH}(?:\s+(?P<year>\d{{4}}))?"
+)
+_MONTH_DAY = re.compile(
+    rf"{_MONTH}\s+(?:the\s+)?(?P<day>\d{{1,2}}){_ORDINAL}\b"
+    rf"(?:{_RANGE}(?P<day2>\d{{1,2}}){_ORDINAL}\b)?(?:,?\s+(?P<year>\d{{4}}))?"
+)
+_MONTH_ONLY = re.compile(rf"{_FULL_MONTH}(?:\s+(?P<year>\d{{4}}))?")
+_WEEKDAY = re.compile(
+    rf"\b(?:(?P<next>next|volgende)\s+)?(?:ngo|ka)?-?"
+    rf"(?P<weekday>{_alternation(_WEEKDAYS)})\b"
+)
+_RELATIVE_DAY = re.compile(
+    rf"(?<!\w)(?P<word>{_alternation([*_TODAY_WORDS, *_TOMORROW_WORDS])})(?!\w)"
+)
+_NEXT_WEEK = re.compile(rf"\b(?:{_alternation(_NEXT_WEEK_PHRASES)})\b")
+_RELATIVE_MONTH = re.compile(
+    rf"\b(?:(?P<last>{_alternation(_LAST_MONTH_PHRASES)})"
+    rf"|(?P<this>{_alternation(_THIS_MONTH_PHRASES)}))\b"
+)
+_DURATION = re.compile(
+    r"\b(?P<days>\d{1,2})\s+(?:working\s+|business\s+|werks)?(?:days?|dae)\b"
+)
+
+_DIGIT = re.compile(r"\d")
+_WORD = re.compile(r"\w+")
+_PREFIXED_WORD = re.compile(r"\b(?:ngo|ka|ku|u|e)(\w+)")
+
+# Words one of which must appear for a group of patterns to be worth
+# running; most messages skip most patterns
+_MONTH_WORDS = frozenset([*_MONTHS, *_MONTH_ABBREVIATIONS])
+_WEEKDAY_WORDS = frozenset(_WEEKDAYS)
+_RELATIVE_DAY_WORDS = frozenset([*_TODAY_WORDS, *_TOMORROW_WORDS])
+_NEXT_WEEK_WORDS = frozenset(phrase.split()[-1] for phrase in _NEXT_WEEK_PHRASES)
+_RELATIVE_MONTH_WORDS = frozenset(
+    phrase.split()[-1] for phrase in (*_LAST_MONTH_PHRASES, *_THIS_MONTH_PHRASES)
+)
+
+
+def _number(suffix: str) -> str:
+    """Regex for an amount with space or comma thousands separators."""
+    return (
+        rf"(?P<int{suffix}>\d{{1,3}}(?:[ ,]\d{{3}})+|\d+)"
+        rf"(?:[.,](?P<frac{suffix}>\d{{1,2}}))?(?!\d)"
+    )
+
+
+# "R1 500" / "ZAR 800" / "R1.5k", or "1.5k" / "800 rand" without the symbol
+_AMOUNT = re.compile(
+    rf"(?:\br\s?|\bzar\s?){_number('')}(?:\s?(?P<k>k)\b)?"
+    rf"|\b{_number('2')}\s?(?:(?P<k2>k)|rand|randi|amarandi)\b"
+)
+
+
+def extract_slots(text: str, today: Optional[date] = None) -> dict:
+    """Extract tool arguments from a message.
+
+    Args:
+        text: User message text.
+        today: Date relative expressions count from. Defaults to today.
+
+    Returns:
+        Dict with whichever of start_date and end_date (ISO dates), month
+        ("YYYY-MM"), leave_type and amount (Rands) the message states.
+    """
+    today = today or date.today()
+    lowered = text.lower()
+    words = _words(lowered)
+    has_digit = _DIGIT.search(lowered) is not None
+    slots: dict[str, Any] = {}
+
+    dates, taken = _find_dates(lowered, words, has_digit, today)
+    if dates:
+        slots["start_date"] = dates[0][0].isoformat()
+        end = dates[-1][1]
+        if len(dates) == 1 and dates[0][0] == end and has_digit:
+            duration = _DURATION.search(lowered)
+            if duration:
+                end = _add_business_days(dates[0][0], int(duration["days"]))
+        if end >= dates[0][0]:
+            slots["end_date"] = end.isoformat()
+
+    month = _find_month(lowered, words, has_digit, today, taken)
+    if month:
+        slots["month"] = month
+
+    affixes = {
+        name
+        for match in _LEAVE_TYPE_AFFIXES.finditer(lowered)
+        for name, value in match.groupdict().items()
+        if value
+    }
+    for leave_type, names in _LEAVE_TYPE_WORDS:
+        if leave_type in affixes or words & names:
+            slots["leave_type"] = leave_type
+            break
+
+    amount = _find_amount(lowered) if has_digit else None
+    if amount is not None:
+        slots["amount"] = amount
+    return slots
+
+
+def _words(text: str) -> set[str]:
+    """Return the text's words, plus each with an isiZulu prefix removed."""
+    words = set(_WORD.findall(text))
+    words.update(_PREFIXED_WORD.findall(text))
+    return words
+
+
+def clean_slots(raw: dict[str, Any]) -> dict:
+    """Keep only well-formed arguments, e.g. from an LLM's JSON output.
+
+    Args:
+        raw: Candidate arguments.
+
+    Returns:
+        The valid start_date, end_date, month, leave_type and amount values.
+    """
+    args: dict[str, Any] = {}
+    for key in ("start_date", "end_date"):
+        if isinstance(raw.get(key), str) and _ISO_DATE.fullmatch(raw[key]):
+            args[key] = raw[key]
+    if isinstance(raw.get("month"), str) and _ISO_MONTH.fullmatch(raw["month"]):
+        args["month"] = raw["month"]
+    leave_type = raw.get("leave_type")
+    if isinstance(leave_type, str) and leave_type.lower() in _LEAVE_TYPES:
+        args["leave_type"] = leave_type.lower()
+    amount = _positive_number(raw.get("amount"))
+    if amount is not None:
+        args["amount"] = amount
+    return args
+
+
+def _positive_number(value: Any) -> Optional[float]:
+    """Return value as a positive float, or None."""
+    if isinstance(value, bool) or not isinstance(value, (int, float, str)):
+        return None
+    try:
+        number = float(value)
+    except ValueError:
+        return None
+    return number if number > 0 else None
+
+
+def _find_dates(
+    text: str, words: set[str], has_digit: bool, today: date
+) -> tuple[list[tuple[date, date]], list[tuple[int, int]]]:
+    """Find date mentions as (first, last) day ranges, in text order.
+
+    Args:
+        text: Lower-cased message.
+        words: _words(text).
+        has_digit: Whether text contains a digit.
+        today: Date relative expressions count from.
+
+    Returns:
+        The ranges and the text spans they cover.
+    """
+    found: list[tuple[int, int, date, date]] = []
+
+    def add(match: re.Match, first: Optional[date], last: Optional[date]) -> None:
+        start, end = match.span()
+        if first is None or last is None or last < first:
+            return
+        if any(start < other[1] and other[0] < end for other in found):
+            return
+        found.append((start, end, first, last))
+
+    if has_digit:
+        explicit = [_ISO_DATE, _NUMERIC_DATE]
+        if words & _MONTH_WORDS:
+            explicit[1:1] = [_DAY_MONTH, _MONTH_DAY]
+        for pattern in explicit:
+            for match in pattern.finditer(text):
+                add(match, *_explicit_range(pattern, match, today))
+    # Relative days only count when the message gives no explicit date, so
+    # "Friday 20 March" is 20 March rather than this Friday
+    if not found:
+        if words & _RELATIVE_DAY_WORDS:
+            for match in _RELATIVE_DAY.finditer(text):
+                offset = 0 if match["word"] in _TODAY_WORDS else 1
+                day = today + timedelta(days=offset)
+                add(match, day, day)
+        if words & _WEEKDAY_WORDS:
+            for match in _WEEKDAY.finditer(text):
+                ahead = (_WEEKDAYS[match["weekday"]] - today.weekday() - 1) % 7 + 1
+                if match["next"] and ahead < 7 - today.weekday():
+                    ahead += 7
+                day = today + timedelta(days=ahead)
+                add(match, day, day)
+        if words & _NEXT_WEEK_WORDS:
+            for match in _NEXT_WEEK.finditer(text):
+                monday = today + timedelta(days=7 - today.weekday())
+                add(match, monday, monday + timedelta(days=4))
+
+    found.sort()
+    return (
+        [(first, last) for _, _, first, last in found],
+        [(start, end) for start, end, _, _ in found],
+    )
+
+
+def _explicit_range(
+    pattern: re.Pattern, match: re.Match, today: date
+) -> tuple[Optional[date], Optional[date]]:
+    """Return the (first, last) days of an ISO, numeric or named date match."""
+    if pattern is _ISO_DATE:
+        day = _date(int(match["year"]), int(match["month"]), int(match["day"]))
+        return day, day
+    if pattern is _NUMERIC_DATE:
+        year = match["year"]
+        if year and len(year) == 2:
+            year = f"20{year}"
+        day = _resolve_day(int(match["month"]), int(match["day"]), year, today)
+        return day, day
+    month = _month_number(match["month"])
+    if month is None:
+        return None, None
+    first = _resolve_day(month, int(match["day"]), match["year"], today)
+    if first is None or not match["day2"]:
+        return first, first
+    return first, _date(first.year, month, int(match["day2"]))
+
+
+def _find_month(
+    text: str,
+    words: set[str],
+    has_digit: bool,
+    today: date,
+    taken: list[tuple[int, int]],
+) -> Optional[str]:
+    """Find a month mention outside the spans already read as dates."""
+
+    def free(match: re.Match) -> bool:
+        start, end = match.span()
+        return not any(start < t_end and t_start < end for t_start, t_end in taken)
+
+    for match in _ISO_MONTH.finditer(text) if has_digit else ():
+        if free(match) and 1 <= int(match["month"]) <= 12:
+            return match.group()
+    if words & _RELATIVE_MONTH_WORDS:
+        for match in _RELATIVE_MONTH.finditer(text):
+            if free(match):
+                index = today.year * 12 + today.month - 1 - bool(match["last"])
+                return f"{index // 12:04d}-{index % 12 + 1:02d}"
+    if not words & _MONTH_WORDS:
+        return None
+    for match in _MONTH_ONLY.finditer(text):
+        # "may" is usually the verb unless a year follows
+        if not free(match) or (match["month"] == "may" and not match["year"]):
+            continue
+        month = _MONTHS[match["month"]]
+        if match["year"]:
+            year = int(match["year"])
+        else:
+            year = today.year if month <= today.month else today.year - 1
+        return f"{year:04d}-{month:02d}"
+    return None
+
+
+def _find_amount(text: str) -> Optional[float]:
+    """Return the first Rand amount in the text, or None."""
+    match = _AMOUNT.search(text)
+    if match is None:
+        return None
+    whole = match["int"] or match["int2"]
+    fraction = match["frac"] or match["frac2"]
+    amount = float(re.sub(r"[ ,]", "", whole) + (f".{fraction}" if fraction else ""))
+    if match["k"] or match["k2"]:
+        amount *= 1000
+    return amount if amount > 0 else None
+
+
+def _month_number(word: str) -> Optional[int]:
+    """Return the month number a word names, or None if it names none.
+
+    Accepts full and abbreviated names, with or without an isiZulu prefix.
+    """
+    number = _MONTHS.get(word) or _MONTH_ABBREVIATIONS.get(word)
+    if number is None:
+        match = _PREFIXED_WORD.fullmatch(word)
+        number = match and _MONTHS.get(match.group(1))
+    return number
+
+
+def _date(year: int, month: int, day: int) -> Optional[date]:
+    """Return the date, or None if it does not exist."""
+    try:
+        return date(year, month, day)
+    except ValueError:
+        return None
+
+
+def _resolve_day(
+    month: int, day: int, year: Optional[str], today: date
+) -> Optional[date]:
+    """Return the date for a day and month, choosing the year if not given."""
+    if year:
+        return _date(int(year), month, day)
+    resolved = _date(today.year, month, day)
+    if resolved and (today - resolved).days > _PAST_DATE_DAYS:
+        resolved = _date(today.year + 1, month, day)
+    return resolved
+
+
+def _add_business_days(start: date, days: int) -> date:
+    """Return the last day of a run of business days beginning at start."""
+    end = start
+    while count_business_days(start, end) < days:
+        end += timedelta(days=1)
+    return end
@@ -1,15 +1,41 @@
 """MCP tool exports."""
 
-from .ewa_tools import check_ewa_eligibility, request_ewa_advance
-from .hr_tools import get_employee, get_leave_balance, get_payslip, submit_leave_request
+from .ewa_tools import (
+    check_ewa_eligibility,
+    check_ewa_eligibility_batch,
+    check_ewa_eligibility_async,
+    request_ewa_advance,
+    request_ewa_advance_async,
+)
+from .hr_tools import (
+    get_employee,
+    get_employee_async,
+    get_employees_bulk,
+    get_leave_balance,
+    get_leave_balance_async,
+    get_leave_balances_bulk,
+    get_payslip,
+    get_payslip_async,
+    submit_leave_request,
+    submit_leave_request_async,
+)
 from .policy_tools import search_policies
 
 __all__ = [
     "check_ewa_eligibility",
+    "check_ewa_eligibility_async",
+    "check_ewa_eligibility_batch",
     "get_employee",
+    "get_employee_async",
+    "get_employees_bulk",
     "get_leave_balance",
+    "get_leave_balance_async",
+    "get_leave_balances_bulk",
     "get_payslip",
+    "get_payslip_async",
     "request_ewa_advance",
+    "request_ewa_advance_async",
     "search_policies",
     "submit_leave_request",
+    "submit_leave_request_async",
 ]
@@ -1,21 +1,29 @@
 """EWA (Earned Wage Access) MCP tools."""
 
 import logging
-import uuid
 from datetime import date, datetime
 from typing import Optional
 
+from sqlalchemy import ColumnElement, ScalarSelect, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
-from src.db.connection import get_session
+from src.db.connection import (
+    get_async_session,
+    get_session,
+    lock_for_write,
+    track_tool,
+)
+from src.db.ids import new_id
 from src.db.models import (
+    EarnedToDate,
     Employee,
     EmploymentStatus,
     EWAStatus,
+    EWALedger,
     EWATransaction,
-    Timesheet,
-    TimesheetStatus,
 )
+from src.mcp_server.tools.hr_tools import BULK_CHUNK_SIZE
 
 logger = logging.getLogger(__name__)
 
@@ -23,8 +31,11 @@ MAX_EWA_AMOUNT = 5000
 EWA_PERCENTAGE = 0.50
 EWA_FEE = 10.0
 PROBATION_MONTHS = 3
+DEMO_TODAY = date(2026, 2, 10)  # Demo fixed date
+EWA_ID_PREFIX = "EWA-"
 
 
+@track_tool
 def check_ewa_eligibility(
     employee_id: str, session: Optional[Session] = None
 ) -> dict:
@@ -48,106 +59,238 @@ def check_ewa_eligibility(
         return {"success": False, "error": "Internal error", "code": "INTERNAL"}
 
 
+def _probation_data(hire_date: date, employment_status: str) -> Optional[dict]:
+    """Return the ineligible payload if still in probation, else None."""
+    today = DEMO_TODAY
+
+    # Check probation (3 months from hire)
+    months_employed = (today.year - hire_date.year) * 12 + (
+        today.month - hire_date.month
+    )
+    if (
+        employment_status == EmploymentStatus.PROBATION.value
+        or months_employed < PROBATION_MONTHS
+    ):
+        weeks_remaining = max(0, (PROBATION_MONTHS * 4) - (months_employed * 4))
+        return {
+            "eligible": False,
+            "reason": "Probation not complete",
+            "weeks_remaining": weeks_remaining,
+        }
+    return None
+
+
+def _eligible_data(total_hours: float, hourly_rate: float, outstanding: float) -> dict:
+    """Return the eligible payload from period hours and outstanding EWA."""
+    earned = total_hours * hourly_rate
+
+    # Calculate available: 50% of earned, capped at R5,000, minus outstanding
+    available = min(earned * EWA_PERCENTAGE, MAX_EWA_AMOUNT) - outstanding
+    available = max(0, available)
+
+    return {
+        "eligible": True,
+        "earned": earned,
+        "available": available,
+        "outstanding": outstanding,
+    }
+
+
+def _period_hours(condition: ColumnElement[bool], today: date) -> ScalarSelect:
+    """Scalar subquery: approved hours in pay periods covering today, or 0.0.
+
+    Args:
+        condition: Filter selecting the employee's EarnedToDate rows.
+        today: Date the pay period must cover.
+    """
+    return (
+        select(func.coalesce(func.sum(EarnedToDate.approved_hours), 0.0))
+        .where(
+            condition,
+            EarnedToDate.pay_period_start <= today,
+            EarnedToDate.pay_period_end >= today,
+        )
+        .scalar_subquery()
+    )
+
+
 def _check_ewa_eligibility_impl(employee_id: str, session: Session) -> dict:
     """Internal implementation for check_ewa_eligibility."""
     try:
-        employee = session.get(Employee, employee_id)
-        if employee is None:
+        today = DEMO_TODAY
+
+        # Profile, approved hours this period and outstanding EWA from the
+        # trigger-maintained accumulators (primary-key lookups) in one trip
+        hours_subq = _period_hours(EarnedToDate.employee_id == employee_id, today)
+        outstanding_subq = (
+            select(EWALedger.outstanding_amount)
+            .where(EWALedger.employee_id == employee_id)
+            .scalar_subquery()
+        )
+        row = session.execute(
+            select(
+                Employee.hire_date,
+                Employee.employment_status,
+                Employee.hourly_rate,
+                hours_subq,
+                func.coalesce(outstanding_subq, 0.0),
+            ).where(Employee.id == employee_id)
+        ).first()
+        if row is None:
             return {
                 "success": False,
                 "error": "Employee not found",
                 "code": "NOT_FOUND",
             }
 
-        today = date(2026, 2, 10)  # Demo fixed date
-
-        # Check probation (3 months from hire)
-        months_employed = (today.year - employee.hire_date.year) * 12 + (
-            today.month - employee.hire_date.month
-        )
-        if (
-            employee.employment_status == EmploymentStatus.PROBATION.value
-            or months_employed < PROBATION_MONTHS
-        ):
-            weeks_remaining = max(0, (PROBATION_MONTHS * 4) - (months_employed * 4))
-            return {
-                "success": True,
-                "data": {
-                    "eligible": False,
-                    "reason": "Probation not complete",
-                    "weeks_remaining": weeks_remaining,
-                },
-            }
-
-        # Calculate earned from approved timesheets in current period
-        timesheets = (
-            session.query(Timesheet)
-            .filter(
-                Timesheet.employee_id == employee_id,
-                Timesheet.status == TimesheetStatus.APPROVED.value,
-                Timesheet.pay_period_start <= today,
-                Timesheet.pay_period_end >= today,
-            )
-            .all()
-        )
-        total_hours = sum(ts.hours_worked for ts in timesheets)
-        earned = total_hours * employee.hourly_rate
-
-        # Calculate outstanding EWA balance
-        outstanding_txns = (
-            session.query(EWATransaction)
-            .filter(
-                EWATransaction.employee_id == employee_id,
-                EWATransaction.status == EWAStatus.DISBURSED.value,
-            )
-            .all()
-        )
-        outstanding = sum(t.amount for t in outstanding_txns)
-
-        # Calculate available: 50% of earned, capped at R5,000, minus outstanding
-        available = min(earned * EWA_PERCENTAGE, MAX_EWA_AMOUNT) - outstanding
-        available = max(0, available)
+        hire_date, employment_status, hourly_rate, total_hours, outstanding = row
+        probation = _probation_data(hire_date, employment_status)
+        if probation is not None:
+            return {"success": True, "data": probation}
 
         return {
             "success": True,
-            "data": {
-                "eligible": True,
-                "earned": earned,
-                "available": available,
-                "outstanding": outstanding,
-            },
+            "data": _eligible_data(total_hours, hourly_rate, outstanding),
         }
     except Exception:
         logger.exception("Unexpected error in check_ewa_eligibility")
         return {"success": False, "error": "Internal error", "code": "INTERNAL"}
 
 
+@track_tool
+def check_ewa_eligibility_batch(
+    employee_ids: list[str], session: Optional[Session] = None
+) -> dict[str, dict]:
+    """Check EWA eligibility for many employees with set-based queries.
+
+    Issues one query per BULK_CHUNK_SIZE employees (profiles joined to the
+    EWA ledger and earned-to-date accumulator) instead of one per employee.
+
+    Args:
+        employee_ids: Employee IDs to check. Duplicates are collapsed.
+        session: Optional SQLAlchemy session for testing.
+
+    Returns:
+        Dict keyed by employee ID, each value the same MCP response dict
+        check_ewa_eligibility() returns for that employee.
+    """
+    if session is not None:
+        return _check_ewa_eligibility_batch_impl(employee_ids, session)
+
+    try:
+        with get_session() as s:
+            return _check_ewa_eligibility_batch_impl(employee_ids, s)
+    except Exception:
+        logger.exception("Unexpected error in check_ewa_eligibility_batch")
+        return {
+            emp_id: {"success": False, "error": "Internal error", "code": "INTERNAL"}
+            for emp_id in employee_ids
+        }
+
+
+def _check_ewa_eligibility_batch_impl(
+    employee_ids: list[str], session: Session
+) -> dict[str, dict]:
+    """Internal implementation for check_ewa_eligibility_batch."""
+    ids = list(dict.fromkeys(employee_ids))
+    try:
+        today = DEMO_TODAY
+        results: dict[str, dict] = {}
+
+        for i in range(0, len(ids), BULK_CHUNK_SIZE):
+            chunk = ids[i : i + BULK_CHUNK_SIZE]
+
+            employees = session.execute(
+                select(
+                    Employee.id,
+                    Employee.hire_date,
+                    Employee.employment_status,
+                    Employee.hourly_rate,
+                    _period_hours(EarnedToDate.employee_id == Employee.id, today),
+                    func.coalesce(EWALedger.outstanding_amount, 0.0),
+                )
+                .outerjoin(EWALedger, EWALedger.employee_id == Employee.id)
+                .where(Employee.id.in_(chunk))
+            ).all()
+
+            for emp_id, hire_date, status, rate, hours, outstanding in employees:
+                probation = _probation_data(hire_date, status)
+                if probation is not None:
+                    results[emp_id] = {"success": True, "data": probation}
+                    continue
+                results[emp_id] = {
+                    "success": True,
+                    "data": _eligible_data(hours, rate, outstanding),
+                }
+
+        return {
+            emp_id: results.get(
+                emp_id,
+                {"success": False, "error": "Employee not found", "code": "NOT_FOUND"},
+            )
+            for emp_id in ids
+        }
+    except Exception:
+        logger.exception("Unexpected error in check_ewa_eligibility_batch")
+        return {
+            emp_id: {"success": False, "error": "Internal error", "code": "INTERNAL"}
+            for emp_id in ids
+        }
+
+
+@track_tool
 def request_ewa_advance(
-    employee_id: str, amount: float, session: Optional[Session] = None
+    employee_id: str,
+    amount: float,
+    session: Optional[Session] = None,
+    idempotency_key: Optional[str] = None,
 ) -> dict:
     """Request an EWA advance for an employee.
 
+    The eligibility check and the insert run under SQLite's write lock, so
+    concurrent requests for the same employee cannot both pass the check
+    and overdraw the available amount.
+
     Args:
         employee_id: Employee ID.
         amount: Amount to advance in Rands.
         session: Optional SQLAlchemy session for testing.
+        idempotency_key: Optional client-supplied key. A retry with the same
+                         key returns the original transaction instead of
+                         creating a new one.
 
     Returns:
         MCP response dict with transaction details or error.
     """
     if session is not None:
-        return _request_ewa_advance_impl(employee_id, amount, session)
+        return _request_ewa_advance_impl(employee_id, amount, session, idempotency_key)
 
     try:
         with get_session() as s:
-            return _request_ewa_advance_impl(employee_id, amount, s)
+            return _request_ewa_advance_impl(employee_id, amount, s, idempotency_key)
     except Exception:
         logger.exception("Unexpected error in request_ewa_advance")
         return {"success": False, "error": "Internal error", "code": "INTERNAL"}
 
 
+def _advance_response(txn: EWATransaction) -> dict:
+    """Build the success envelope for an EWA transaction."""
+    return {
+        "success": True,
+        "data": {
+            "transaction_id": txn.id,
+            "amount": txn.amount,
+            "fee": txn.fee,
+            "net": txn.amount - txn.fee,
+        },
+    }
+
+
 def _request_ewa_advance_impl(
-    employee_id: str, amount: float, session: Session
+    employee_id: str,
+    amount: float,
+    session: Session,
+    idempotency_key: Optional[str] = None,
 ) -> dict:
     """Internal implementation for request_ewa_advance."""
     try:
@@ -158,6 +301,25 @@ def _request_ewa_advance_impl(
                 "code": "INVALID_AMOUNT",
             }
 
+        # Serialize check-and-insert against other writers
+        lock_for_write(session)
+
+        if idempotency_key is not None:
+            existing = session.scalars(
+                select(EWATransaction).where(
+                    EWATransaction.employee_id == employee_id,
+                    EWATransaction.idempotency_key == idempotency_key,
+                )
+            ).first()
+            if existing is not None:
+                if existing.amount != amount:
+                    return {
+                        "success": False,
+                        "error": "Idempotency key already used for a different amount",
+                        "code": "IDEMPOTENCY_CONFLICT",
+                    }
+                return _advance_response(existing)
+
         # Check eligibility first
         eligibility = _check_ewa_eligibility_impl(employee_id, session)
         if not eligibility["success"]:
@@ -180,28 +342,95 @@ def _request_ewa_advance_impl(
 
         # Create transaction
         now = datetime.now()
-        txn_id = f"EWA-{now.strftime('%Y%m%d')}-{uuid.uuid4().hex[:6].upper()}"
         txn = EWATransaction(
-            id=txn_id,
+            id=new_id(EWA_ID_PREFIX),
             employee_id=employee_id,
             amount=amount,
             fee=EWA_FEE,
             status=EWAStatus.DISBURSED.value,
             requested_at=now,
             disbursed_at=now,
+            idempotency_key=idempotency_key,
         )
         session.add(txn)
         session.flush()
 
-        return {
-            "success": True,
-            "data": {
-                "transaction_id": txn_id,
-                "amount": amount,
-                "fee": EWA_FEE,
-                "net": amount - EWA_FEE,
-            },
-        }
+        return _advance_response(txn)
     except Exception:
         logger.exception("Unexpected error in request_ewa_advance")
         return {"success": False, "error": "Internal error", "code": "INTERNAL"}
+
+
+# Async variants
+
+
+@track_tool
+async def check_ewa_eligibility_async(
+    employee_id: str,
+    session: Optional[AsyncSession] = None,
+) -> dict:
+    """Check EWA eligibility without blocking the event loop.
+
+    Async counterpart of check_ewa_eligibility(), sharing its implementation via
+    AsyncSession.run_sync.
+
+    Args:
+        employee_id: Employee ID.
+        session: Optional AsyncSession for testing.
+
+    Returns:
+        Same MCP response dict as check_ewa_eligibility().
+    """
+    if session is not None:
+        return await session.run_sync(
+            lambda sync_s: _check_ewa_eligibility_impl(employee_id, sync_s)
+        )
+
+    try:
+        async with get_async_session() as s:
+            return await s.run_sync(
+                lambda sync_s: _check_ewa_eligibility_impl(employee_id, sync_s)
+            )
+    except Exception:
+        logger.exception("Unexpected error in check_ewa_eligibility_async")
+        return {"success": False, "error": "Internal error", "code": "INTERNAL"}
+
+
+@track_tool
+async def request_ewa_advance_async(
+    employee_id: str,
+    amount: float,
+    session: Optional[AsyncSession] = None,
+    idempotency_key: Optional[str] = None,
+) -> dict:
+    """Request an EWA advance without blocking the event loop.
+
+    Async counterpart of request_ewa_advance(), sharing its implementation via
+    AsyncSession.run_sync.
+
+    Args:
+        employee_id: Employee ID.
+        amount: Amount to advance in Rands.
+        session: Optional AsyncSession for testing.
+        idempotency_key: Optional client-supplied retry key.
+
+    Returns:
+        Same MCP response dict as request_ewa_advance().
+    """
+    if session is not None:
+        return await session.run_sync(
+            lambda sync_s: _request_ewa_advance_impl(
+                employee_id, amount, sync_s, idempotency_key
+            )
+        )
+
+    try:
+        async with get_async_session() as s:
+            return await s.run_sync(
+                lambda sync_s: _request_ewa_advance_impl(
+                    employee_id, amount, sync_s, idempotency_key
+                )
+            )
+    except Exception:
+        logger.exception("Unexpected error in request_ewa_advance_async")
+        return {"success": False, "error": "Internal error", "code": "INTERNAL"}
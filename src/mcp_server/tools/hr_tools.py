@@ -2,12 +2,19 @@
 
 import logging
 import uuid
-from datetime import date, timedelta
-from typing import Optional
+from datetime import date, datetime, time
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, Optional
 
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
+from sqlalchemy.sql.selectable import ScalarSelect
 
-from src.db.connection import get_session
+from src.db.archive import archive_dir, partition_stamp, read_partition
+from src.db.cache import TTLCache, employee_cache, leave_balance_cache, remember
+from src.db.connection import get_async_session, get_session, track_tool
 from src.db.models import (
     Employee,
     EWAStatus,
@@ -16,13 +23,45 @@ from src.db.models import (
     Timesheet,
     TimesheetStatus,
 )
+from src.db.records import EmployeeRecord
+from src.workdays import count_business_days
 
 logger = logging.getLogger(__name__)
 
+# Employees per IN (...) batch; keeps bound parameters under SQLite's limit
+BULK_CHUNK_SIZE = 5000
 
+# Advances deducted on the payslip for the month they were disbursed in
+DEDUCTED_EWA_STATUSES = (EWAStatus.DISBURSED.value, EWAStatus.REPAID.value)
+
+
+def _cached_read(
+    cache: TTLCache,
+    employee_id: str,
+    session: Session,
+    impl: Callable[[str, Session], dict],
+) -> dict:
+    """Serve a per-employee read from cache, falling back to impl.
+
+    Only successful responses are cached, so a NOT_FOUND never outlives the
+    employee being created.
+    """
+    cached = cache.get(employee_id)
+    if cached is not None:
+        return {"success": True, "data": dict(cached)}
+    result = impl(employee_id, session)
+    if result["success"]:
+        remember(session, cache, employee_id, dict(result["data"]))
+    return result
+
+
+@track_tool
 def get_employee(employee_id: str, session: Optional[Session] = None) -> dict:
     """Retrieve employee profile by ID.
 
+    Without an explicit session, reads go through the in-process profile
+    cache (src.db.cache).
+
     Args:
         employee_id: Employee ID (e.g. "EMP001").
         session: Optional SQLAlchemy session. If not provided, creates one
@@ -36,7 +75,7 @@ def get_employee(employee_id: str, session: Optional[Session] = None) -> dict:
 
     try:
         with get_session() as s:
-            return _get_employee_impl(employee_id, s)
+            return _cached_read(employee_cache, employee_id, s, _get_employee_impl)
     except Exception:
         logger.exception("Unexpected error in get_employee")
         return {"success": False, "error": "Internal error", "code": "INTERNAL"}
@@ -45,22 +84,86 @@ def get_employee(employee_id: str, session: Optional[Session] = None) -> dict:
 def _get_employee_impl(employee_id: str, session: Session) -> dict:
     """Internal implementation for get_employee."""
     try:
-        employee = session.get(Employee, employee_id)
-        if employee is None:
+        row = session.execute(
+            EmployeeRecord.select().where(Employee.id == employee_id)
+        ).first()
+        if row is None:
             return {
                 "success": False,
                 "error": "Employee not found",
                 "code": "NOT_FOUND",
             }
-        return {"success": True, "data": employee.to_dict()}
+        return {"success": True, "data": EmployeeRecord(*row).to_dict()}
     except Exception:
         logger.exception("Unexpected error in get_employee")
         return {"success": False, "error": "Internal error", "code": "INTERNAL"}
 
 
+@track_tool
+def get_employees_bulk(
+    employee_ids: list[str], session: Optional[Session] = None
+) -> dict[str, dict]:
+    """Retrieve many employee profiles with one query per chunk.
+
+    Args:
+        employee_ids: Employee IDs to fetch. Duplicates are collapsed.
+        session: Optional SQLAlchemy session for testing.
+
+    Returns:
+        Dict keyed by employee ID, each value the same MCP response dict
+        get_employee() returns for that employee.
+    """
+    if session is not None:
+        return _get_employees_bulk_impl(employee_ids, session)
+
+    try:
+        with get_session() as s:
+            return _get_employees_bulk_impl(employee_ids, s)
+    except Exception:
+        logger.exception("Unexpected error in get_employees_bulk")
+        return {
+            emp_id: {"success": False, "error": "Internal error", "code": "INTERNAL"}
+            for emp_id in employee_ids
+        }
+
+
+def _get_employees_bulk_impl(
+    employee_ids: list[str], session: Session
+) -> dict[str, dict]:
+    """Internal implementation for get_employees_bulk."""
+    ids = list(dict.fromkeys(employee_ids))
+    try:
+        found: dict[str, dict] = {}
+        for i in range(0, len(ids), BULK_CHUNK_SIZE):
+            chunk = ids[i : i + BULK_CHUNK_SIZE]
+            rows = session.execute(
+                EmployeeRecord.select().where(Employee.id.in_(chunk))
+            )
+            for row in rows:
+                record = EmployeeRecord(*row)
+                found[record.id] = {"success": True, "data": record.to_dict()}
+        return {
+            emp_id: found.get(
+                emp_id,
+                {"success": False, "error": "Employee not found", "code": "NOT_FOUND"},
+            )
+            for emp_id in ids
+        }
+    except Exception:
+        logger.exception("Unexpected error in get_employees_bulk")
+        return {
+            emp_id: {"success": False, "error": "Internal error", "code": "INTERNAL"}
+            for emp_id in ids
+        }
+
+
+@track_tool
 def get_leave_balance(employee_id: str, session: Optional[Session] = None) -> dict:
     """Retrieve leave balances for an employee.
 
+    Without an explicit session, reads go through the in-process balance
+    cache, which submit_leave_request() invalidates on write.
+
     Args:
         employee_id: Employee ID (e.g. "EMP005").
         session: Optional SQLAlchemy session for testing.
@@ -73,7 +176,9 @@ def get_leave_balance(employee_id: str, session: Optional[Session] = None) -> di
 
     try:
         with get_session() as s:
-            return _get_leave_balance_impl(employee_id, s)
+            return _cached_read(
+                leave_balance_cache, employee_id, s, _get_leave_balance_impl
+            )
     except Exception:
         logger.exception("Unexpected error in get_leave_balance")
         return {"success": False, "error": "Internal error", "code": "INTERNAL"}
@@ -82,36 +187,205 @@ def get_leave_balance(employee_id: str, session: Optional[Session] = None) -> di
 def _get_leave_balance_impl(employee_id: str, session: Session) -> dict:
     """Internal implementation for get_leave_balance."""
     try:
-        employee = session.get(Employee, employee_id)
-        if employee is None:
+        # Employee existence and balances in one projected query
+        rows = session.execute(
+            select(LeaveBalance.leave_type, LeaveBalance.balance_days)
+            .select_from(Employee)
+            .outerjoin(LeaveBalance, LeaveBalance.employee_id == Employee.id)
+            .where(Employee.id == employee_id)
+        ).all()
+        if not rows:
             return {
                 "success": False,
                 "error": "Employee not found",
                 "code": "NOT_FOUND",
             }
-        balances = (
-            session.query(LeaveBalance)
-            .filter_by(employee_id=employee_id)
-            .all()
-        )
-        data = {b.leave_type: b.balance_days for b in balances}
+        data = {
+            leave_type: balance_days
+            for leave_type, balance_days in rows
+            if leave_type is not None
+        }
         return {"success": True, "data": data}
     except Exception:
         logger.exception("Unexpected error in get_leave_balance")
         return {"success": False, "error": "Internal error", "code": "INTERNAL"}
 
 
-def _count_business_days(start: date, end: date) -> int:
-    """Count business days between start and end (inclusive)."""
-    days = 0
-    current = start
-    while current <= end:
-        if current.weekday() < 5:  # Mon-Fri
-            days += 1
-        current += timedelta(days=1)
-    return days
+@track_tool
+def get_leave_balances_bulk(
+    employee_ids: list[str], session: Optional[Session] = None
+) -> dict[str, dict]:
+    """Retrieve leave balances for many employees with set-based queries.
 
+    Args:
+        employee_ids: Employee IDs to fetch. Duplicates are collapsed.
+        session: Optional SQLAlchemy session for testing.
+
+    Returns:
+        Dict keyed by employee ID, each value the same MCP response dict
+        get_leave_balance() returns for that employee.
+    """
+    if session is not None:
+        return _get_leave_balances_bulk_impl(employee_ids, session)
+
+    try:
+        with get_session() as s:
+            return _get_leave_balances_bulk_impl(employee_ids, s)
+    except Exception:
+        logger.exception("Unexpected error in get_leave_balances_bulk")
+        return {
+            emp_id: {"success": False, "error": "Internal error", "code": "INTERNAL"}
+            for emp_id in employee_ids
+        }
+
+
+def _get_leave_balances_bulk_impl(
+    employee_ids: list[str], session: Session
+) -> dict[str, dict]:
+    """Internal implementation for get_leave_balances_bulk."""
+    ids = list(dict.fromkeys(employee_ids))
+    try:
+        balances: dict[str, dict] = {}
+        for i in range(0, len(ids), BULK_CHUNK_SIZE):
+            chunk = ids[i : i + BULK_CHUNK_SIZE]
+            existing = select(Employee.id).where(Employee.id.in_(chunk))
+            for emp_id in session.scalars(existing):
+                balances[emp_id] = {}
+            rows = session.execute(
+                select(
+                    LeaveBalance.employee_id,
+                    LeaveBalance.leave_type,
+                    LeaveBalance.balance_days,
+                ).where(LeaveBalance.employee_id.in_(chunk))
+            )
+            for emp_id, leave_type, balance_days in rows:
+                balances[emp_id][leave_type] = balance_days
+        not_found = {
+            "success": False,
+            "error": "Employee not found",
+            "code": "NOT_FOUND",
+        }
+        return {
+            emp_id: (
+                {"success": True, "data": balances[emp_id]}
+                if emp_id in balances
+                else dict(not_found)
+            )
+            for emp_id in ids
+        }
+    except Exception:
+        logger.exception("Unexpected error in get_leave_balances_bulk")
+        return {
+            emp_id: {"success": False, "error": "Internal error", "code": "INTERNAL"}
+            for emp_id in ids
+        }
+
+
+def month_bounds(month: str) -> tuple[date, date]:
+    """Return [first day of month, first day of next month) for "YYYY-MM"."""
+    year, mon = int(month.split("-")[0]), int(month.split("-")[1])
+    period_start = date(year, mon, 1)
+    if mon < 12:
+        period_end = date(year, mon + 1, 1)
+    else:
+        period_end = date(year + 1, 1, 1)
+    return period_start, period_end
+
+
+def payslip_aggregates(
+    employee_id: Any, period_start: date, period_end: date
+) -> tuple[ScalarSelect, ScalarSelect]:
+    """Build scalar subqueries for a payslip's approved hours and EWA deductions.
+
+    Args:
+        employee_id: Employee ID value, or a column (e.g. Employee.id) to
+                     correlate against an outer query.
+        period_start: First day of the month.
+        period_end: First day of the following month.
+
+    Returns:
+        (hours_worked, ewa_deductions) scalar subqueries, each 0.0 when empty.
+        Deductions count advances disbursed in the month whether or not
+        payroll close has since marked them repaid.
+    """
+    hours_subq = (
+        select(func.coalesce(func.sum(Timesheet.hours_worked), 0.0))
+        .where(
+            Timesheet.employee_id == employee_id,
+            Timesheet.status == TimesheetStatus.APPROVED.value,
+            Timesheet.pay_period_start >= period_start,
+            Timesheet.pay_period_start < period_end,
+        )
+        .scalar_subquery()
+    )
+    ewa_subq = (
+        select(func.coalesce(func.sum(EWATransaction.amount), 0.0))
+        .where(
+            EWATransaction.employee_id == employee_id,
+            EWATransaction.status.in_(DEDUCTED_EWA_STATUSES),
+            EWATransaction.disbursed_at >= datetime.combine(period_start, time.min),
+            EWATransaction.disbursed_at < datetime.combine(period_end, time.min),
+        )
+        .scalar_subquery()
+    )
+    return hours_subq, ewa_subq
+
+
+def archived_payslip_totals(month: str) -> dict[str, tuple[float, float]]:
+    """Return (hours_worked, ewa_deductions) per employee from archived rows.
 
+    Applies the same rules as payslip_aggregates() to the month's archive
+    files. Each month is read once and kept in memory until its files change.
+
+    Args:
+        month: Month in "YYYY-MM" format.
+
+    Returns:
+        Totals keyed by employee ID; empty if the month is not archived.
+    """
+    root = archive_dir()
+    stamps = (
+        partition_stamp(Timesheet.__tablename__, month, root),
+        partition_stamp(EWATransaction.__tablename__, month, root),
+    )
+    if stamps == (None, None):
+        return {}
+    return _archived_payslip_totals(root, month, stamps)
+
+
+@lru_cache(maxsize=24)
+def _archived_payslip_totals(
+    root: Path, month: str, stamps: tuple[Optional[int], Optional[int]]
+) -> dict[str, tuple[float, float]]:
+    """Aggregate one archived month; stamps only key the cache."""
+    hours: dict[str, float] = {}
+    timesheets = read_partition(Timesheet.__tablename__, month, root)
+    for emp_id, worked, status in zip(
+        timesheets.get("employee_id", []),
+        timesheets.get("hours_worked", []),
+        timesheets.get("status", []),
+    ):
+        if status == TimesheetStatus.APPROVED.value:
+            hours[emp_id] = hours.get(emp_id, 0.0) + worked
+
+    deductions: dict[str, float] = {}
+    transactions = read_partition(EWATransaction.__tablename__, month, root)
+    for emp_id, amount, status, disbursed_at in zip(
+        transactions.get("employee_id", []),
+        transactions.get("amount", []),
+        transactions.get("status", []),
+        transactions.get("disbursed_at", []),
+    ):
+        if status in DEDUCTED_EWA_STATUSES and disbursed_at is not None:
+            deductions[emp_id] = deductions.get(emp_id, 0.0) + amount
+
+    return {
+        emp_id: (hours.get(emp_id, 0.0), deductions.get(emp_id, 0.0))
+        for emp_id in hours.keys() | deductions.keys()
+    }
+
+
+@track_tool
 def submit_leave_request(
     employee_id: str,
     start_date: str,
@@ -173,7 +447,7 @@ def _submit_leave_request_impl(
                 "code": "INVALID_DATES",
             }
 
-        days = _count_business_days(start, end)
+        days = count_business_days(start, end)
         if days <= 0:
             return {
                 "success": False,
@@ -212,6 +486,7 @@ def _submit_leave_request_impl(
         return {"success": False, "error": "Internal error", "code": "INTERNAL"}
 
 
+@track_tool
 def get_payslip(
     employee_id: str, month: str, session: Optional[Session] = None
 ) -> dict:
@@ -247,44 +522,23 @@ def _get_payslip_impl(employee_id: str, month: str, session: Session) -> dict:
                 "code": "NOT_FOUND",
             }
 
-        # Parse month to get date range
-        year, mon = int(month.split("-")[0]), int(month.split("-")[1])
-        period_start = date(year, mon, 1)
-        if mon < 12:
-            period_end = date(year, mon + 1, 1)
-        else:
-            period_end = date(year + 1, 1, 1)
-
-        # Get approved timesheets for the month
-        timesheets = (
-            session.query(Timesheet)
-            .filter(
-                Timesheet.employee_id == employee_id,
-                Timesheet.pay_period_start >= period_start,
-                Timesheet.pay_period_start < period_end,
-                Timesheet.status == TimesheetStatus.APPROVED.value,
-            )
-            .all()
-        )
-
-        total_hours = sum(ts.hours_worked for ts in timesheets)
-        gross_earnings = total_hours * employee.hourly_rate
+        period_start, period_end = month_bounds(month)
 
-        # Get EWA deductions for the month
-        ewa_txns = (
-            session.query(EWATransaction)
-            .filter(
-                EWATransaction.employee_id == employee_id,
-                EWATransaction.status == EWAStatus.DISBURSED.value,
-            )
-            .all()
-        )
-        ewa_deductions = sum(
-            t.amount
-            for t in ewa_txns
-            if t.disbursed_at and t.disbursed_at.strftime("%Y-%m") == month
+        # Approved hours and EWA deductions for the month in one round trip
+        hours_subq, ewa_subq = payslip_aggregates(
+            employee_id, period_start, period_end
         )
+        total_hours, ewa_deductions = session.execute(
+            select(hours_subq, ewa_subq)
+        ).one()
+
+        # Closed months moved to cold storage
+        archived = archived_payslip_totals(month).get(employee_id)
+        if archived is not None:
+            total_hours += archived[0]
+            ewa_deductions += archived[1]
 
+        gross_earnings = total_hours * employee.hourly_rate
         net_pay = gross_earnings - ewa_deductions
 
         return {
@@ -302,3 +556,150 @@ def _get_payslip_impl(employee_id: str, month: str, session: Session) -> dict:
     except Exception:
         logger.exception("Unexpected error in get_payslip")
         return {"success": False, "error": "Internal error", "code": "INTERNAL"}
+
+
+# Async variants
+
+
+@track_tool
+async def get_employee_async(
+    employee_id: str,
+    session: Optional[AsyncSession] = None,
+) -> dict:
+    """Retrieve employee profile by ID without blocking the event loop.
+
+    Async counterpart of get_employee(), sharing its implementation via
+    AsyncSession.run_sync.
+
+    Args:
+        employee_id: Employee ID (e.g. "EMP001").
+        session: Optional AsyncSession for testing.
+
+    Returns:
+        Same MCP response dict as get_employee().
+    """
+    if session is not None:
+        return await session.run_sync(
+            lambda sync_s: _get_employee_impl(employee_id, sync_s)
+        )
+
+    try:
+        async with get_async_session() as s:
+            return await s.run_sync(
+                lambda sync_s: _cached_read(
+                    employee_cache, employee_id, sync_s, _get_employee_impl
+                )
+            )
+    except Exception:
+        logger.exception("Unexpected error in get_employee_async")
+        return {"success": False, "error": "Internal error", "code": "INTERNAL"}
+
+
+@track_tool
+async def get_leave_balance_async(
+    employee_id: str,
+    session: Optional[AsyncSession] = None,
+) -> dict:
+    """Retrieve leave balances without blocking the event loop.
+
+    Async counterpart of get_leave_balance(), sharing its implementation via
+    AsyncSession.run_sync.
+
+    Args:
+        employee_id: Employee ID (e.g. "EMP005").
+        session: Optional AsyncSession for testing.
+
+    Returns:
+        Same MCP response dict as get_leave_balance().
+    """
+    if session is not None:
+        return await session.run_sync(
+            lambda sync_s: _get_leave_balance_impl(employee_id, sync_s)
+        )
+
+    try:
+        async with get_async_session() as s:
+            return await s.run_sync(
+                lambda sync_s: _cached_read(
+                    leave_balance_cache, employee_id, sync_s, _get_leave_balance_impl
+                )
+            )
+    except Exception:
+        logger.exception("Unexpected error in get_leave_balance_async")
+        return {"success": False, "error": "Internal error", "code": "INTERNAL"}
+
+
+@track_tool
+async def submit_leave_request_async(
+    employee_id: str,
+    start_date: str,
+    end_date: str,
+    leave_type: str,
+    session: Optional[AsyncSession] = None,
+) -> dict:
+    """Submit a leave request without blocking the event loop.
+
+    Async counterpart of submit_leave_request(), sharing its implementation via
+    AsyncSession.run_sync.
+
+    Args:
+        employee_id: Employee ID.
+        start_date: Start date in ISO format (YYYY-MM-DD).
+        end_date: End date in ISO format (YYYY-MM-DD).
+        leave_type: Type of leave (annual, sick, family).
+        session: Optional AsyncSession for testing.
+
+    Returns:
+        Same MCP response dict as submit_leave_request().
+    """
+    if session is not None:
+        return await session.run_sync(
+            lambda sync_s: _submit_leave_request_impl(
+                employee_id, start_date, end_date, leave_type, sync_s
+            )
+        )
+
+    try:
+        async with get_async_session() as s:
+            return await s.run_sync(
+                lambda sync_s: _submit_leave_request_impl(
+                    employee_id, start_date, end_date, leave_type, sync_s
+                )
+            )
+    except Exception:
+        logger.exception("Unexpected error in submit_leave_request_async")
+        return {"success": False, "error": "Internal error", "code": "INTERNAL"}
+
+
+@track_tool
+async def get_payslip_async(
+    employee_id: str,
+    month: str,
+    session: Optional[AsyncSession] = None,
+) -> dict:
+    """Retrieve a payslip without blocking the event loop.
+
+    Async counterpart of get_payslip(), sharing its implementation via
+    AsyncSession.run_sync.
+
+    Args:
+        employee_id: Employee ID.
+        month: Month in "YYYY-MM" format.
+        session: Optional AsyncSession for testing.
+
+    Returns:
+        Same MCP response dict as get_payslip().
+    """
+    if session is not None:
+        return await session.run_sync(
+            lambda sync_s: _get_payslip_impl(employee_id, month, sync_s)
+        )
+
+    try:
+        async with get_async_session() as s:
+            return await s.run_sync(
+                lambda sync_s: _get_payslip_impl(employee_id, month, sync_s)
+            )
+    except Exception:
+        logger.exception("Unexpected error in get_payslip_async")
+        return {"success": False, "error": "Internal error", "code": "INTERNAL"}
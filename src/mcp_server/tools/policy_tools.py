@@ -1,19 +1,20 @@
 """Policy Q&A MCP tools."""
 
 import logging
-from typing import Optional
-
-import chromadb
+from typing import TYPE_CHECKING, Optional
 
 from src.rag.vectorstore import get_collection, index_policies
 
+if TYPE_CHECKING:
+    import chromadb
+
 logger = logging.getLogger(__name__)
 
 TOP_K = 3
 
 
 def search_policies(
-    query: str, collection: Optional[chromadb.Collection] = None
+    query: str, collection: Optional["chromadb.Collection"] = None
 ) -> dict:
     """Search HR policies for relevant information.
 
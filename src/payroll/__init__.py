@@ -0,0 +1,6 @@
+"""Whole-company payroll runs for Jem HR Demo."""
+
+from .repayments import reconcile_ewa_repayments
+from .run import iter_payslips, run_payroll
+
+__all__ = ["iter_payslips", "reconcile_ewa_repayments", "run_payroll"]
@@ -0,0 +1,128 @@
+"""Payroll close: mark the month's deducted EWA advances as repaid."""
+
+import logging
+import time
+from datetime import datetime
+from typing import Optional
+
+from sqlalchemy import func, select, update
+from sqlalchemy.orm import Session
+
+from src.db.connection import get_session
+from src.db.models import EWAStatus, EWATransaction
+from src.mcp_server.tools.hr_tools import (
+    BULK_CHUNK_SIZE,
+    DEDUCTED_EWA_STATUSES,
+    month_bounds,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def reconcile_ewa_repayments(
+    month: str,
+    session: Optional[Session] = None,
+    chunk_size: int = BULK_CHUNK_SIZE,
+    start_after: Optional[str] = None,
+) -> dict:
+    """Mark every advance deducted in a month's payslips as repaid.
+
+    Works through employees in ID order, chunk_size at a time. Each chunk is
+    one UPDATE flipping its DISBURSED advances for the month to REPAID, one
+    grouped SELECT of the chunk's repaid totals, and a commit. The EWA
+    ledger triggers drop the repaid amounts from outstanding balances.
+
+    An interrupted run can simply be started again: committed chunks have no
+    DISBURSED rows left to update and only cost the totals read. Pass the
+    last logged employee ID as start_after to skip them entirely.
+
+    Args:
+        month: Payroll month in "YYYY-MM" format.
+        session: Optional SQLAlchemy session. If not provided, creates one
+                 via get_session(). Committed after every chunk.
+        chunk_size: Employees per UPDATE.
+        start_after: Only reconcile employees with IDs after this one.
+
+    Returns:
+        Run summary with the number of employees and transactions repaid,
+        the total, elapsed seconds, and "totals": repaid amount per employee
+        ID, equal to get_payslip()'s ewa_deductions for the month.
+    """
+    if session is None:
+        with get_session() as s:
+            return reconcile_ewa_repayments(month, s, chunk_size, start_after)
+
+    started = time.perf_counter()
+    period_start, period_end = month_bounds(month)
+    midnight = datetime.min.time()
+    in_month = (
+        EWATransaction.disbursed_at >= datetime.combine(period_start, midnight),
+        EWATransaction.disbursed_at < datetime.combine(period_end, midnight),
+    )
+
+    totals: dict[str, float] = {}
+    transactions = 0
+    last_id = start_after
+    while True:
+        ids_stmt = (
+            select(EWATransaction.employee_id)
+            .where(EWATransaction.status.in_(DEDUCTED_EWA_STATUSES), *in_month)
+            .group_by(EWATransaction.employee_id)
+            .order_by(EWATransaction.employee_id)
+            .limit(chunk_size)
+        )
+        if last_id is not None:
+            ids_stmt = ids_stmt.where(EWATransaction.employee_id > last_id)
+        ids = session.scalars(ids_stmt).all()
+        if not ids:
+            break
+
+        result = session.execute(
+            update(EWATransaction)
+            .where(
+                EWATransaction.employee_id.in_(ids),
+                EWATransaction.status == EWAStatus.DISBURSED.value,
+                *in_month,
+            )
+            .values(status=EWAStatus.REPAID.value)
+        )
+        transactions += result.rowcount
+        totals.update(
+            session.execute(
+                select(EWATransaction.employee_id, func.sum(EWATransaction.amount))
+                .where(
+                    EWATransaction.employee_id.in_(ids),
+                    EWATransaction.status == EWAStatus.REPAID.value,
+                    *in_month,
+                )
+                .group_by(EWATransaction.employee_id)
+            ).all()
+        )
+        session.commit()
+
+        last_id = ids[-1]
+        logger.info(
+            "EWA repayments %s: repaid %d transactions through %s",
+            month,
+            result.rowcount,
+            last_id,
+        )
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "month": month,
+        "employees": len(totals),
+        "transactions": transactions,
+        "repaid_total": sum(totals.values()),
+        "seconds": elapsed,
+        "totals": totals,
+    }
+    logger.info(
+        "EWA repayments %s: %d transactions for %d employees (R%.2f) in %.2fs",
+        month,
+        transactions,
+        len(totals),
+        summary["repaid_total"],
+        elapsed,
+    )
+    return summary
@@ -0,0 +1,197 @@
+"""Month-end payroll run: every employee's payslip in one streamed pass."""
+
+import csv
+import json
+import logging
+import time
+from pathlib import Path
+from typing import Iterator, Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from src.db.connection import get_session
+from src.db.models import Employee
+from src.mcp_server.tools.hr_tools import (
+    archived_payslip_totals,
+    month_bounds,
+    payslip_aggregates,
+)
+
+logger = logging.getLogger(__name__)
+
+PAYSLIP_FIELDS = [
+    "employee_id",
+    "month",
+    "hours_worked",
+    "hourly_rate",
+    "gross_earnings",
+    "ewa_deductions",
+    "net_pay",
+]
+OUTPUT_FORMATS = {"csv", "jsonl"}
+DEFAULT_CHUNK_SIZE = 5000
+
+
+def _payslip_rows(
+    session: Session, month: str, chunk_size: int
+) -> Iterator[list[tuple[str, float, float, float]]]:
+    """Yield chunks of (employee_id, hourly_rate, hours_worked, ewa_deductions).
+
+    Uses the same aggregate subqueries as get_payslip, correlated to each
+    employee row, and adds archived totals the same way, so the figures are
+    computed identically.
+    """
+    period_start, period_end = month_bounds(month)
+    hours_subq, ewa_subq = payslip_aggregates(Employee.id, period_start, period_end)
+    stmt = (
+        select(Employee.id, Employee.hourly_rate, hours_subq, ewa_subq)
+        .order_by(Employee.id)
+        .execution_options(yield_per=chunk_size)
+    )
+    archived = archived_payslip_totals(month)
+    for partition in session.execute(stmt).partitions():
+        if archived:
+            partition = [
+                _with_archived(row, archived.get(row[0])) for row in partition
+            ]
+        yield partition
+
+
+def _with_archived(
+    row: tuple[str, float, float, float], archived: Optional[tuple[float, float]]
+) -> tuple[str, float, float, float]:
+    """Add an employee's archived (hours, deductions) to a payslip row."""
+    if archived is None:
+        return row
+    emp_id, rate, hours, ewa = row
+    return emp_id, rate, hours + archived[0], ewa + archived[1]
+
+
+def iter_payslips(
+    session: Session,
+    month: str,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    vectorize: bool = False,
+) -> Iterator[dict]:
+    """Stream payslip records for every employee for a month.
+
+    Each record has the same fields and figures as get_payslip()'s data.
+
+    Args:
+        session: SQLAlchemy session.
+        month: Month in "YYYY-MM" format.
+        chunk_size: Rows fetched per partition.
+        vectorize: Compute gross/net per partition with NumPy (optional
+                   dependency). Produces the same float results.
+
+    Yields:
+        Payslip dicts ordered by employee ID.
+    """
+    np = None
+    if vectorize:
+        import numpy as np
+
+    for chunk in _payslip_rows(session, month, chunk_size):
+        if np is not None:
+            _, rates, hours, ewa = zip(*chunk)
+            gross = np.asarray(hours, dtype=np.float64) * np.asarray(
+                rates, dtype=np.float64
+            )
+            net = gross - np.asarray(ewa, dtype=np.float64)
+            gross_list, net_list = gross.tolist(), net.tolist()
+        else:
+            gross_list = [row[2] * row[1] for row in chunk]
+            net_list = [g - row[3] for g, row in zip(gross_list, chunk)]
+
+        for row, gross_earnings, net_pay in zip(chunk, gross_list, net_list):
+            emp_id, rate, hours_worked, ewa_deductions = row
+            yield {
+                "employee_id": emp_id,
+                "month": month,
+                "hours_worked": hours_worked,
+                "hourly_rate": rate,
+                "gross_earnings": gross_earnings,
+                "ewa_deductions": ewa_deductions,
+                "net_pay": net_pay,
+            }
+
+
+def run_payroll(
+    month: str,
+    output_path: Path,
+    output_format: str = "jsonl",
+    session: Optional[Session] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    vectorize: bool = False,
+) -> dict:
+    """Compute every employee's payslip for a month and stream it to a file.
+
+    Records are written as they are computed; nothing is held in memory
+    beyond one partition.
+
+    Args:
+        month: Month in "YYYY-MM" format.
+        output_path: Destination file.
+        output_format: "jsonl" or "csv".
+        session: Optional SQLAlchemy session. If not provided, creates one
+                 via get_session().
+        chunk_size: Rows fetched per partition.
+        vectorize: Use NumPy for gross/net math.
+
+    Returns:
+        Run summary with employee count, totals, elapsed seconds and
+        throughput (payslips per second).
+
+    Raises:
+        ValueError: If output_format is not supported.
+    """
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unsupported output format '{output_format}'. "
+            f"Expected one of: {', '.join(sorted(OUTPUT_FORMATS))}"
+        )
+
+    if session is None:
+        with get_session() as s:
+            return run_payroll(
+                month, output_path, output_format, s, chunk_size, vectorize
+            )
+
+    started = time.perf_counter()
+    count = 0
+    total_gross = 0.0
+    total_deductions = 0.0
+
+    with open(output_path, "w", newline="", encoding="utf-8") as f:
+        writer = None
+        if output_format == "csv":
+            writer = csv.DictWriter(f, fieldnames=PAYSLIP_FIELDS)
+            writer.writeheader()
+
+        for payslip in iter_payslips(session, month, chunk_size, vectorize):
+            if writer is not None:
+                writer.writerow(payslip)
+            else:
+                f.write(json.dumps(payslip) + "\n")
+            count += 1
+            total_gross += payslip["gross_earnings"]
+            total_deductions += payslip["ewa_deductions"]
+
+    elapsed = time.perf_counter() - started
+    summary = {
+        "month": month,
+        "employees": count,
+        "gross_earnings": total_gross,
+        "ewa_deductions": total_deductions,
+        "seconds": elapsed,
+        "payslips_per_second": count / elapsed if elapsed > 0 else float(count),
+    }
+    logger.info(
+        "Payroll %s: %d payslips in %.2fs (%.0f/s)",
+        month,
+        count,
+        elapsed,
+        summary["payslips_per_second"],
+    )
+    return summary
@@ -3,9 +3,10 @@
 import logging
 import re
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-import chromadb
+if TYPE_CHECKING:
+    import chromadb
 
 logger = logging.getLogger(__name__)
 
@@ -17,7 +18,7 @@ COLLECTION_NAME = "hr_policies"
 
 def get_collection(
     persist_dir: Optional[str] = None,
-) -> chromadb.Collection:
+) -> "chromadb.Collection":
     """Get or create the ChromaDB collection.
 
     Args:
@@ -26,6 +27,9 @@ def get_collection(
     Returns:
         ChromaDB Collection instance.
     """
+    # Imported lazily: chromadb adds ~0.6s to every process start
+    import chromadb
+
     if persist_dir is None:
         persist_dir = DEFAULT_PERSIST_DIR
 
@@ -67,7 +71,7 @@ def _split_by_sections(content: str, source: str) -> list[dict]:
     return chunks
 
 
-def index_policies(collection: chromadb.Collection) -> None:
+def index_policies(collection: "chromadb.Collection") -> None:
     """Index policy documents into ChromaDB.
 
     Idempotent: skips if documents already indexed.
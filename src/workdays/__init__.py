@@ -0,0 +1,17 @@
+"""Business-day calendar utilities for Jem HR Demo."""
+
+from .business_days import (
+    count_business_days,
+    count_business_days_batch,
+    easter_sunday,
+    holidays_in_years,
+    public_holidays,
+)
+
+__all__ = [
+    "count_business_days",
+    "count_business_days_batch",
+    "easter_sunday",
+    "holidays_in_years",
+    "public_holidays",
+]
@@ -2,6 +2,8 @@
 
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 
 class TestAgentState:
     """Tests for AgentState TypedDict (Story 5.1)."""
@@ -53,6 +55,377 @@ class TestGraphStructure:
         # LangGraph compiled graph has nodes accessible
         assert graph is not None
 
+    def test_unknown_topology_rejected(self):
+        """An unknown topology name is a configuration error."""
+        from src.agents.graph import build_graph
+
+        with pytest.raises(ValueError):
+            build_graph("parallel")
+
+
+class TestInvokeTurn:
+    """Tests for running a graph turn as one unit of work."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self, tmp_path):
+        from src.db.connection import get_engine, get_session, reset_engine
+        from src.db.seed import seed_database
+
+        reset_engine()
+        get_engine(tmp_path / "hr.db")
+        with get_session() as session:
+            seed_database(session)
+        yield
+        reset_engine()
+
+    @patch("src.agents.nodes.response_format._format_response")
+    @patch("src.agents.nodes.ewa_agent.get_llm")
+    @patch("src.agents.nodes.intent_router._classify_intent")
+    @patch("src.agents.nodes.language_detect._detect_language")
+    def test_ewa_request_uses_one_session(
+        self, mock_detect, mock_classify, mock_llm, mock_format
+    ):
+        """Eligibility check and advance share one session and commit once."""
+        from src.agents.graph import build_graph, invoke_turn
+        from src.agents.state import create_initial_state
+        from src.db.connection import get_session, track_queries
+        from src.db.models import EWATransaction
+
+        mock_detect.return_value = "en"
+        mock_classify.return_value = "ewa_request"
+        mock_llm.return_value.invoke.return_value = MagicMock(content="request")
+        mock_format.return_value = "Advance approved."
+
+        graph = build_graph()
+        state = create_initial_state("EMP001", "I need an advance please")
+        with track_queries() as unscoped:
+            graph.invoke(state)
+        with track_queries() as stats:
+            result = invoke_turn(graph, state)
+
+        assert result["tool_results"]["success"] is True
+        assert unscoped.sessions == 1
+        assert stats.sessions == 1
+        with get_session() as session:
+            assert session.query(EWATransaction).filter_by(
+                id=result["tool_results"]["data"]["transaction_id"]
+            ).one()
+
+    @patch("src.agents.nodes.response_format._format_response")
+    @patch("src.agents.nodes.ewa_agent.get_llm")
+    @patch("src.agents.nodes.intent_router._classify_intent")
+    @patch("src.agents.nodes.language_detect._detect_language")
+    def test_write_lock_released_before_response(
+        self, mock_detect, mock_classify, mock_llm, mock_format, tmp_path
+    ):
+        """The advance is committed before the response is generated."""
+        import sqlite3
+
+        from src.agents.graph import build_graph, invoke_turn
+        from src.agents.state import create_initial_state
+
+        def other_writer(*args, **kwargs):
+            # Fails at once with "database is locked" if the turn holds it
+            conn = sqlite3.connect(tmp_path / "hr.db", timeout=0)
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                committed = conn.execute(
+                    "SELECT COUNT(*) FROM ewa_transactions WHERE employee_id = ?",
+                    ("EMP001",),
+                ).fetchone()[0]
+                conn.rollback()
+            finally:
+                conn.close()
+            return f"{committed} advances saved."
+
+        mock_detect.return_value = "en"
+        mock_classify.return_value = "ewa_request"
+        mock_llm.return_value.invoke.return_value = MagicMock(content="request")
+        mock_format.side_effect = other_writer
+
+        before = other_writer().split()[0]
+        state = create_initial_state("EMP001", "I need an advance please")
+        result = invoke_turn(build_graph(), state)
+
+        assert result["tool_results"]["success"] is True
+        assert result["response"] == f"{int(before) + 1} advances saved."
+
+    @patch("src.agents.nodes.response_format._format_response")
+    @patch("src.agents.nodes.ewa_agent.get_llm")
+    @patch("src.agents.nodes.intent_router._classify_intent")
+    @patch("src.agents.nodes.language_detect._detect_language")
+    def test_failed_commit_reported_as_error(
+        self, mock_detect, mock_classify, mock_llm, mock_format
+    ):
+        """A tool write that cannot be committed is not reported as done."""
+        from sqlalchemy.exc import OperationalError
+        from sqlalchemy.orm import Session
+
+        from src.agents.graph import SAVE_FAILED_MESSAGE, build_graph, invoke_turn
+        from src.agents.state import create_initial_state
+
+        mock_detect.return_value = "en"
+        mock_classify.return_value = "ewa_request"
+        mock_llm.return_value.invoke.return_value = MagicMock(content="request")
+        mock_format.return_value = "Advance approved."
+
+        failure = OperationalError("COMMIT", {}, Exception("database is locked"))
+        state = create_initial_state("EMP001", "I need an advance please")
+        with patch.object(Session, "commit", side_effect=failure):
+            result = invoke_turn(build_graph(), state)
+
+        assert result["error"] == SAVE_FAILED_MESSAGE
+        assert SAVE_FAILED_MESSAGE in result["response"]
+        mock_format.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "message, tool",
+        [
+            ("What is my leave balance?", "get_leave_balance"),
+            ("I need an advance please", "request_ewa_advance"),
+        ],
+    )
+    def test_combined_topology_saves_one_llm_call(self, message, tool, monkeypatch):
+        """The combined router replaces the classify and tool-select calls."""
+        from src.agents.graph import build_graph, invoke_turn
+        from src.agents.nodes.intent_router import FAST_ROUTE_ENV_VAR
+        from src.agents.state import create_initial_state
+        from src.agents.testing import StubLLMFactory, use_llm
+
+        monkeypatch.setenv(FAST_ROUTE_ENV_VAR, "1")
+        calls = {}
+        results = {}
+        for topology in ("sequential", "combined"):
+            with use_llm(StubLLMFactory()) as factory:
+                state = create_initial_state("EMP001", message)
+                results[topology] = invoke_turn(build_graph(topology), state)
+            calls[topology] = len(factory.calls)
+
+        assert calls["combined"] == calls["sequential"] - 1
+        assert results["combined"]["tool_call"]["name"] == tool
+        assert results["combined"]["tool_results"]["success"] is True
+        assert results["sequential"]["tool_results"]["success"] is True
+
+    @pytest.mark.parametrize("topology", ["sequential", "combined"])
+    def test_fast_path_skips_routing_calls(self, topology):
+        """A confident keyword match leaves only the response to the LLM."""
+        from src.agents.graph import build_graph, invoke_turn
+        from src.agents.state import create_initial_state
+        from src.agents.testing import StubLLMFactory, use_llm
+
+        with use_llm(StubLLMFactory()) as factory:
+            state = create_initial_state("EMP001", "What is my leave balance?")
+            result = invoke_turn(build_graph(topology), state)
+
+        assert result["tool_results"]["success"] is True
+        assert [prompt.split()[0] for prompt in factory.calls] == ["Detect", "Generate"]
+
+    def test_stream_turn_passes_on_response_tokens(self):
+        """stream_turn() hands over the response piece by piece."""
+        from src.agents.graph import build_graph, stream_turn
+        from src.agents.state import create_initial_state
+        from src.agents.testing import StubLLMFactory, use_llm
+
+        tokens = []
+        with use_llm(StubLLMFactory()):
+            state = create_initial_state("EMP001", "What is my leave balance?")
+            result = stream_turn(build_graph(), state, tokens.append)
+
+        assert len(tokens) > 1
+        assert "".join(tokens) == result["response"]
+        assert result["tool_results"]["success"] is True
+
+    def test_stream_turn_holds_no_write_lock_while_streaming(self, tmp_path):
+        """Other sessions can write while the response streams."""
+        import sqlite3
+
+        from src.agents.graph import build_graph, stream_turn
+        from src.agents.state import create_initial_state
+        from src.agents.testing import StubLLMFactory, use_llm
+
+        def other_writer(token):
+            # Fails at once with "database is locked" if the turn holds it
+            conn = sqlite3.connect(tmp_path / "hr.db", timeout=0)
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                conn.rollback()
+            finally:
+                conn.close()
+
+        with use_llm(StubLLMFactory()):
+            state = create_initial_state("EMP001", "Send me an advance of R500")
+            result = stream_turn(build_graph(), state, other_writer)
+
+        assert result["tool_call"]["name"] == "request_ewa_advance"
+        assert result["tool_results"]["success"] is True
+
+
+class TestFastRoute:
+    """Tests for keyword routing ahead of the LLM."""
+
+    @pytest.mark.parametrize(
+        "message, intent, tool",
+        [
+            ("Show my payslip", "hr_query", "get_payslip"),
+            ("Am I eligible for an advance?", "ewa_request", "check_ewa_eligibility"),
+            ("Hoeveel verlof het ek oor?", "hr_query", "get_leave_balance"),
+            ("Ndicela ukubona umvuzo wam", "hr_query", "get_payslip"),
+            ("Send me an advance of R500", "ewa_request", "request_ewa_advance"),
+            ("What are the rules on overtime?", "policy_question", "search_policies"),
+        ],
+    )
+    def test_confident_matches_route(self, message, intent, tool):
+        """Unambiguous keywords choose both the intent and the tool."""
+        from src.agents.nodes.intent_router import fast_route
+
+        assert fast_route(message) == {
+            "intent": intent,
+            "tool_call": {"name": tool, "args": {}},
+        }
+
+    def test_intent_without_tool(self):
+        """Keywords that settle the intent but not the tool leave it unset."""
+        from src.agents.nodes.intent_router import fast_route
+
+        assert fast_route("Tell me about EWA") == {
+            "intent": "ewa_request",
+            "tool_call": None,
+        }
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "Can I get an advance?",
+            "I want to know how much advance I can get",
+            "How do I request an advance?",
+            "I need an advance please",
+            "Ngifuna imali kusengaphambili",
+        ],
+    )
+    def test_write_tool_needs_stated_amount(self, message):
+        """Keywords alone never request an advance the message gives no amount for."""
+        from src.agents.nodes.intent_router import fast_route
+
+        assert fast_route(message) == {"intent": "ewa_request", "tool_call": None}
+
+    def test_language_keywords_come_from_detector(self):
+        """Non-English keywords are words of the language detector's lists."""
+        from src.i18n.detector import _LANGUAGE_KEYWORDS
+        from src.i18n.intents import _INTENT_KEYWORDS, _TOOL_HINTS
+
+        for table in (_INTENT_KEYWORDS, _TOOL_HINTS):
+            for language, by_target in table.items():
+                if language == "en":
+                    continue
+                for words in by_target.values():
+                    assert set(words) <= set(_LANGUAGE_KEYWORDS[language])
+
+    @pytest.mark.parametrize(
+        "message",
+        ["Hi", "How many leave days am I entitled to under the policy?"],
+    )
+    def test_unmatched_or_ambiguous_falls_back(self, message):
+        """No keywords, or keywords split between intents, defer to the LLM."""
+        from src.agents.nodes.intent_router import fast_route
+
+        assert fast_route(message) is None
+
+    def test_threshold_disables_fast_path(self, monkeypatch):
+        """A threshold of 1 sends every message to the LLM."""
+        from src.agents.nodes.intent_router import FAST_ROUTE_ENV_VAR, fast_route
+
+        monkeypatch.setenv(FAST_ROUTE_ENV_VAR, "1")
+        assert fast_route("What is my leave balance?") is None
+
+    def test_corpus_accuracy(self):
+        """Fast-path answers on the labelled corpus are almost always right."""
+        import json
+        from pathlib import Path
+
+        from src.agents.nodes.intent_router import WRITE_TOOL_ARGS, fast_route
+
+        corpus = Path(__file__).parent.parent / "data" / "eval" / "routing_corpus.jsonl"
+        rows = [json.loads(line) for line in corpus.read_text().splitlines()]
+        routes = [(row, fast_route(row["text"])) for row in rows]
+        hits = [(row, route) for row, route in routes if route is not None]
+        tools = [(row, route) for row, route in hits if route["tool_call"]]
+
+        assert len(hits) >= 0.8 * len(rows)
+        assert all(row["intent"] == route["intent"] for row, route in hits)
+        correct = sum(row["tool"] == route["tool_call"]["name"] for row, route in tools)
+        assert correct >= 0.95 * len(tools)
+        assert all(
+            row["tool"] == route["tool_call"]["name"]
+            for row, route in tools
+            if route["tool_call"]["name"] in WRITE_TOOL_ARGS
+        )
+
+
+class TestToolRouterNode:
+    """Tests for the combined intent and tool selection node."""
+
+    def test_parse_route_derives_intent_from_tool(self):
+        """The intent is the one the chosen tool belongs to."""
+        from src.agents.nodes.tool_router import parse_route
+
+        route = parse_route(
+            '{"tool": "submit_leave_request", "args": {"start_date": '
+            '"2026-04-01", "end_date": "2026-04-02", "leave_type": "Sick"}}'
+        )
+        assert route == {
+            "intent": "hr_query",
+            "tool_call": {
+                "name": "submit_leave_request",
+                "args": {
+                    "start_date": "2026-04-01",
+                    "end_date": "2026-04-02",
+                    "leave_type": "sick",
+                },
+            },
+        }
+
+    def test_parse_route_drops_malformed_args(self):
+        """Badly formatted or non-positive argument values are discarded."""
+        from src.agents.nodes.tool_router import parse_route
+
+        route = parse_route(
+            '{"tool": "request_ewa_advance", '
+            '"args": {"amount": -5, "month": "Feb", "start_date": "tomorrow"}}'
+        )
+        assert route["intent"] == "ewa_request"
+        assert route["tool_call"]["args"] == {}
+        assert parse_route(
+            '{"tool": "request_ewa_advance", "args": {"amount": "800"}}'
+        )["tool_call"]["args"] == {"amount": 800.0}
+
+    def test_parse_route_falls_back_to_intent_default(self):
+        """An unknown tool falls back to the stated intent's default tool."""
+        from src.agents.nodes.tool_router import parse_route
+
+        route = parse_route('{"intent": "policy_question", "tool": "guess"}')
+        assert route["intent"] == "policy_question"
+        assert route["tool_call"]["name"] == "search_policies"
+
+    @pytest.mark.parametrize("content", ["not json", "[1, 2]", "", "{}"])
+    def test_parse_route_invalid_output(self, content):
+        """Unparseable output routes to the leave balance lookup."""
+        from src.agents.nodes.tool_router import parse_route
+
+        assert parse_route(content) == {
+            "intent": "hr_query",
+            "tool_call": {"name": "get_leave_balance", "args": {}},
+        }
+
+    @patch("src.agents.nodes.tool_router._route_and_select")
+    def test_failure_defaults_to_hr_query(self, mock_route):
+        """A model error routes to hr_query without a preselected tool."""
+        from src.agents.nodes.tool_router import tool_router
+        from src.agents.state import create_initial_state
+
+        mock_route.side_effect = RuntimeError("model down")
+        state = create_initial_state("EMP001", "hello")
+        assert tool_router(state) == {"intent": "hr_query", "tool_call": None}
+
 
 class TestLanguageDetectNode:
     """Tests for language_detect node (Story 5.2)."""
@@ -201,3 +574,27 @@ class TestResponseFormatNode:
         result = response_format(state)
         assert result["response"] != ""
         assert isinstance(result["response"], str)
+
+    @patch("src.agents.nodes.response_format.translate")
+    def test_translates_streamed_response_per_sentence(self, mock_translate):
+        """Non-English responses are translated one sentence at a time."""
+        from src.agents.nodes.response_format import response_format
+        from src.agents.state import create_initial_state
+
+        mock_translate.side_effect = lambda text, source, target: text.upper()
+        llm = MagicMock()
+        llm.stream.return_value = iter(
+            MagicMock(content=token)
+            for token in (" You have 12", " days. Enjoy", " your leave!")
+        )
+        state = create_initial_state("EMP001", "Ngicela ibhalansi yekhefu")
+        state["tool_results"] = {"success": True, "data": {"annual": 12}}
+        state["language"] = "zu"
+        with patch("src.agents.nodes.response_format.get_llm", return_value=llm):
+            result = response_format(state)
+
+        assert result["response"] == "YOU HAVE 12 DAYS. ENJOY YOUR LEAVE!"
+        assert [call.args[0] for call in mock_translate.call_args_list] == [
+            "You have 12 days.",
+            "Enjoy your leave!",
+        ]
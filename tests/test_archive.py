@@ -0,0 +1,242 @@
+"""Tests for archiving closed months to cold storage."""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine, func, select, update
+from sqlalchemy.orm import sessionmaker
+
+from src.db.models import Base, EWATransaction, Timesheet
+from src.db.seed import generate_synthetic_data, seed_database
+
+
+@contextmanager
+def history_session(tmp_path, monkeypatch):
+    """In-memory database with six months of history and a temp archive."""
+    from src.db.archive import ARCHIVE_DIR_ENV_VAR
+
+    monkeypatch.setenv(ARCHIVE_DIR_ENV_VAR, str(tmp_path / "archive"))
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    session = factory()
+    try:
+        seed_database(session)
+        generate_synthetic_data(session, 100, periods=6, shifts_per_period=2)
+        session.commit()
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _payslips(session, month):
+    """Every employee's payslip data for a month, keyed by employee ID."""
+    from src.payroll import iter_payslips
+
+    return {p["employee_id"]: p for p in iter_payslips(session, month)}
+
+
+def _all_payslips(session):
+    """Payslip data for the archivable months of the history, keyed by month."""
+    return {month: _payslips(session, month) for month in ("2025-11", "2025-12")}
+
+
+def _assert_payslips_equal(after, before):
+    """Payslips match month by month and employee by employee."""
+    assert after.keys() == before.keys()
+    for month, payslips in before.items():
+        assert after[month].keys() == payslips.keys(), month
+        for emp_id, payslip in payslips.items():
+            assert after[month][emp_id] == pytest.approx(payslip), (month, emp_id)
+
+
+def _count(session, model):
+    """Row count of a model's table."""
+    return session.scalar(select(func.count()).select_from(model))
+
+
+class TestArchiveClosedMonths:
+    """Tests for archive_closed_months() and archived payslip reads."""
+
+    def test_moves_closed_months_and_keeps_payslips(self, tmp_path, monkeypatch):
+        """Archived months leave the hot tables but payslips are unchanged."""
+        from src.db.archive import archive_closed_months, partition_path
+        from src.mcp_server.tools.hr_tools import get_payslip
+
+        with history_session(tmp_path, monkeypatch) as session:
+            before = _payslips(session, "2025-11")
+            timesheets, transactions = (
+                _count(session, Timesheet),
+                _count(session, EWATransaction),
+            )
+
+            summary = archive_closed_months(session, before="2026-01")
+
+            assert "2025-11" in summary["archived"]
+            assert partition_path("timesheets", "2025-11").exists()
+            assert _count(session, Timesheet) == timesheets - summary["timesheets"]
+            assert (
+                _count(session, EWATransaction)
+                == transactions - summary["ewa_transactions"]
+            )
+            after = _payslips(session, "2025-11")
+            assert after.keys() == before.keys()
+            for emp_id, payslip in before.items():
+                assert after[emp_id] == pytest.approx(payslip), emp_id
+                single = get_payslip(emp_id, "2025-11", session)["data"]
+                assert single == pytest.approx(payslip), emp_id
+
+    def test_hot_months_untouched(self, tmp_path, monkeypatch):
+        """Months at or after the cutoff stay in the hot tables."""
+        from src.db.archive import archive_closed_months
+
+        with history_session(tmp_path, monkeypatch) as session:
+            summary = archive_closed_months(session, before="2026-01")
+            assert all(month < "2026-01" for month in summary["archived"])
+            remaining = session.scalar(select(func.min(Timesheet.pay_period_start)))
+            assert remaining.isoformat() >= "2026-01-01"
+
+    def test_open_month_skipped(self, tmp_path, monkeypatch):
+        """A month with outstanding advances is not archived until closed."""
+        from src.db.archive import archive_closed_months
+        from src.payroll import reconcile_ewa_repayments
+
+        with history_session(tmp_path, monkeypatch) as session:
+            summary = archive_closed_months(session, before="2026-03")
+            assert "2026-02" in summary["skipped"]
+            assert "2026-02" not in summary["archived"]
+
+            # Payroll close repays the advances; pending timesheets still block
+            reconcile_ewa_repayments("2026-02", session)
+            summary = archive_closed_months(session, before="2026-03")
+            assert "2026-02" in summary["skipped"]
+
+            session.execute(
+                update(Timesheet)
+                .where(Timesheet.status == "pending")
+                .values(status="approved")
+            )
+            before = _payslips(session, "2026-02")
+            summary = archive_closed_months(session, before="2026-03")
+            assert summary["archived"] == ["2026-02"]
+            after = _payslips(session, "2026-02")
+            for emp_id, payslip in before.items():
+                assert after[emp_id] == pytest.approx(payslip), emp_id
+
+    def test_summary_tables_reconcile(self, tmp_path, monkeypatch):
+        """The EWA ledger and earned-to-date accumulator stay consistent."""
+        from src.db.archive import archive_closed_months
+        from src.db.ledger import reconcile_earned_to_date, reconcile_ewa_ledger
+
+        with history_session(tmp_path, monkeypatch) as session:
+            archive_closed_months(session, before="2026-01")
+            assert reconcile_ewa_ledger(session) == []
+            assert reconcile_earned_to_date(session) == []
+
+    def test_late_rows_merged_into_existing_file(self, tmp_path, monkeypatch):
+        """Re-archiving a month merges new rows into its file."""
+        from datetime import date
+
+        from src.db.archive import archive_closed_months, read_partition
+        from src.mcp_server.tools.hr_tools import get_payslip
+
+        with history_session(tmp_path, monkeypatch) as session:
+            archive_closed_months(session, before="2026-01")
+            archived = len(read_partition("timesheets", "2025-11")["id"])
+            hours = get_payslip("EMP001", "2025-11", session)["data"]["hours_worked"]
+
+            session.add(
+                Timesheet(
+                    employee_id="EMP001",
+                    pay_period_start=date(2025, 11, 1),
+                    pay_period_end=date(2025, 11, 30),
+                    hours_worked=4.0,
+                    status="approved",
+                )
+            )
+            session.flush()
+            archive_closed_months(session, before="2026-01")
+
+            assert len(read_partition("timesheets", "2025-11")["id"]) == archived + 1
+            assert _count(session, Timesheet) == session.scalar(
+                select(func.count())
+                .select_from(Timesheet)
+                .where(Timesheet.pay_period_start >= date(2026, 1, 1))
+            )
+            payslip = get_payslip("EMP001", "2025-11", session)["data"]
+            assert payslip["hours_worked"] == pytest.approx(hours + 4.0)
+
+    def test_failed_commit_leaves_no_file(self, tmp_path, monkeypatch):
+        """A month whose delete does not commit is not written to the archive."""
+        from src.db.archive import archive_closed_months
+
+        with history_session(tmp_path, monkeypatch) as session:
+            before = _all_payslips(session)
+
+            def fail():
+                raise RuntimeError("disk full")
+
+            monkeypatch.setattr(session, "commit", fail)
+            with pytest.raises(RuntimeError):
+                archive_closed_months(session, before="2026-01")
+            session.rollback()
+
+            assert list((tmp_path / "archive").rglob("*.gz*")) == []
+            _assert_payslips_equal(_all_payslips(session), before)
+
+    def test_interrupted_before_commit_discarded(self, tmp_path, monkeypatch):
+        """A pending file from a run stopped before its commit is discarded."""
+        from src.db.archive import archive_closed_months
+
+        with history_session(tmp_path, monkeypatch) as session:
+            before = _all_payslips(session)
+            commit = session.commit
+
+            def interrupt():
+                raise KeyboardInterrupt
+
+            monkeypatch.setattr(session, "commit", interrupt)
+            with pytest.raises(KeyboardInterrupt):
+                archive_closed_months(session, before="2026-01")
+            session.rollback()
+            assert list((tmp_path / "archive").rglob("*.pending"))
+            _assert_payslips_equal(_all_payslips(session), before)
+
+            monkeypatch.setattr(session, "commit", commit)
+            archive_closed_months(session, before="2026-01")
+            assert list((tmp_path / "archive").rglob("*.pending")) == []
+            _assert_payslips_equal(_all_payslips(session), before)
+
+    def test_interrupted_after_commit_completed(self, tmp_path, monkeypatch):
+        """A pending file whose rows were deleted is moved into place next run."""
+        from src.db import archive
+        from src.db.archive import archive_closed_months
+
+        with history_session(tmp_path, monkeypatch) as session:
+            before = _all_payslips(session)
+            publish = archive._publish
+
+            def interrupt(path):
+                raise KeyboardInterrupt
+
+            monkeypatch.setattr(archive, "_publish", interrupt)
+            with pytest.raises(KeyboardInterrupt):
+                archive_closed_months(session, before="2026-01")
+            assert list((tmp_path / "archive").rglob("*.pending"))
+
+            monkeypatch.setattr(archive, "_publish", publish)
+            archive_closed_months(session, before="2026-01")
+            assert list((tmp_path / "archive").rglob("*.pending")) == []
+            _assert_payslips_equal(_all_payslips(session), before)
+
+    def test_default_cutoff_uses_horizon(self, monkeypatch):
+        """The default cutoff is the configured number of months back."""
+        from datetime import date
+
+        from src.db.archive import HORIZON_ENV_VAR, default_cutoff
+
+        monkeypatch.setenv(HORIZON_ENV_VAR, "3")
+        assert default_cutoff(date(2026, 2, 10)) == "2025-11"
+        monkeypatch.setenv(HORIZON_ENV_VAR, "14")
+        assert default_cutoff(date(2026, 2, 10)) == "2024-12"
@@ -0,0 +1,92 @@
+"""Tests for async MCP tool variants."""
+
+import asyncio
+
+import pytest
+from sqlalchemy.orm import Session
+
+from src.db.seed import seed_database
+
+
+@pytest.fixture
+def async_db(tmp_path):
+    """Seed a temporary database and point the async engine at it."""
+    from src.db.connection import get_async_engine, reset_async_engine
+
+    async def setup():
+        await reset_async_engine()
+        engine = await get_async_engine(tmp_path / "hr.db")
+        async with engine.begin() as conn:
+            await conn.run_sync(lambda sync_conn: seed_database(Session(sync_conn)))
+
+    asyncio.run(setup())
+    yield
+    asyncio.run(reset_async_engine())
+
+
+def test_async_results_match_sync(async_db):
+    """Async tools return the same envelopes as their sync counterparts."""
+    from sqlalchemy import create_engine
+
+    from src.db.models import Base
+    from src.mcp_server import tools
+
+    calls = [
+        ("get_employee", ("EMP001",)),
+        ("get_employee", ("INVALID",)),
+        ("get_leave_balance", ("EMP005",)),
+        ("get_payslip", ("EMP002", "2026-02")),
+        ("check_ewa_eligibility", ("EMP004",)),
+        ("check_ewa_eligibility", ("EMP002",)),
+    ]
+
+    async def run_async():
+        return [await getattr(tools, f"{name}_async")(*args) for name, args in calls]
+
+    async_results = asyncio.run(run_async())
+
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        seed_database(session)
+        sync_results = [getattr(tools, name)(*args, session=session) for name, args in calls]
+    engine.dispose()
+
+    assert async_results == sync_results
+
+
+def test_async_writes_commit(async_db):
+    """submit_leave_request_async and request_ewa_advance_async persist changes."""
+    from src.mcp_server.tools import (
+        check_ewa_eligibility_async,
+        get_leave_balance_async,
+        request_ewa_advance_async,
+        submit_leave_request_async,
+    )
+
+    async def run():
+        leave = await submit_leave_request_async("EMP005", "2026-03-02", "2026-03-03", "annual")
+        balance = await get_leave_balance_async("EMP005")
+        advance = await request_ewa_advance_async("EMP001", 500)
+        eligibility = await check_ewa_eligibility_async("EMP001")
+        return leave, balance, advance, eligibility
+
+    leave, balance, advance, eligibility = asyncio.run(run())
+    assert leave["success"] is True
+    assert balance["data"]["annual"] == 7
+    assert advance["success"] is True
+    assert eligibility["data"]["outstanding"] == 500
+
+
+def test_concurrent_reads(async_db):
+    """Many concurrent async tool calls share the engine's connection pool."""
+    from src.mcp_server.tools import get_employee_async, get_leave_balance_async
+
+    async def run():
+        return await asyncio.gather(
+            *[get_employee_async(f"EMP{i % 12 + 1:03d}") for i in range(100)],
+            *[get_leave_balance_async(f"EMP{i % 12 + 1:03d}") for i in range(100)],
+        )
+
+    results = asyncio.run(run())
+    assert all(r["success"] for r in results)
@@ -0,0 +1,158 @@
+"""Tests for the employee profile and leave-balance read caches."""
+
+import pytest
+from sqlalchemy import update
+
+from src.db.cache import TTLCache, cache_stats, employee_cache, leave_balance_cache
+from src.db.models import LeaveBalance
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTTLCache:
+    """Tests for the LRU+TTL cache primitive."""
+
+    def test_hit_and_miss_counted(self):
+        """Lookups update hit and miss counters."""
+        cache = TTLCache("test", maxsize=4, ttl=60)
+        assert cache.get("a") is None
+        cache.set("a", 1)
+        assert cache.get("a") == 1
+        stats = cache.stats()
+        assert stats["hits"] == 1
+        assert stats["misses"] == 1
+        assert stats["hit_rate"] == 0.5
+
+    def test_least_recently_used_evicted(self):
+        """When full, the least recently used entry is evicted."""
+        cache = TTLCache("test", maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+        assert cache.get("b") is None
+        assert cache.get("a") == 1
+        assert cache.stats()["evictions"] == 1
+
+    def test_entries_expire_after_ttl(self):
+        """Entries older than the TTL are treated as misses."""
+        clock = FakeClock()
+        cache = TTLCache("test", maxsize=2, ttl=10, clock=clock)
+        cache.set("a", 1)
+        clock.now = 9.9
+        assert cache.get("a") == 1
+        clock.now = 10.0
+        assert cache.get("a") is None
+        assert cache.stats()["expirations"] == 1
+
+    def test_invalid_maxsize_rejected(self):
+        """maxsize must be positive."""
+        with pytest.raises(ValueError):
+            TTLCache("test", maxsize=0)
+
+
+class TestToolCaching:
+    """Tests for cached get_employee/get_leave_balance and write invalidation."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self, tmp_path):
+        from src.db.connection import get_engine, get_session, reset_engine
+        from src.db.seed import seed_database
+
+        reset_engine()
+        get_engine(tmp_path / "hr.db")
+        with get_session() as session:
+            seed_database(session)
+        yield
+        reset_engine()
+
+    def test_repeat_reads_served_from_cache(self):
+        """The second read of a profile runs no queries."""
+        from src.db.connection import track_queries
+        from src.mcp_server.tools.hr_tools import get_employee
+
+        first = get_employee("EMP001")
+        with track_queries() as stats:
+            second = get_employee("EMP001")
+        assert second == first
+        assert stats.queries == 0
+        assert cache_stats()["employees"]["hits"] >= 1
+
+    def test_cached_data_is_not_shared(self):
+        """Mutating a returned dict does not corrupt the cache."""
+        from src.mcp_server.tools.hr_tools import get_leave_balance
+
+        get_leave_balance("EMP001")["data"]["annual"] = -1
+        assert get_leave_balance("EMP001")["data"]["annual"] == 12
+
+    def test_not_found_is_not_cached(self):
+        """NOT_FOUND responses are not cached."""
+        from src.mcp_server.tools.hr_tools import get_employee
+
+        assert get_employee("EMP999")["code"] == "NOT_FOUND"
+        assert employee_cache.get("EMP999") is None
+
+    def test_balance_never_stale_after_leave_submission(self):
+        """Each submission is reflected by the very next balance read."""
+        from src.mcp_server.tools.hr_tools import (
+            get_leave_balance,
+            submit_leave_request,
+        )
+
+        expected = get_leave_balance("EMP001")["data"]["annual"]
+        for week in range(4):
+            day = 2 + week * 7
+            result = submit_leave_request(
+                "EMP001", f"2026-03-{day:02d}", f"2026-03-{day:02d}", "annual"
+            )
+            assert result["success"] is True
+            expected -= 1
+            assert get_leave_balance("EMP001")["data"]["annual"] == expected
+
+    def test_balance_fresh_within_request_scope(self):
+        """A read after a write in the same scope sees the write, uncached."""
+        from src.db.connection import request_scope
+        from src.mcp_server.tools.hr_tools import (
+            get_leave_balance,
+            submit_leave_request,
+        )
+
+        get_leave_balance("EMP001")
+        with request_scope():
+            submit_leave_request("EMP001", "2026-03-02", "2026-03-04", "annual")
+            assert get_leave_balance("EMP001")["data"]["annual"] == 9
+            assert leave_balance_cache.get("EMP001") is None
+        assert get_leave_balance("EMP001")["data"]["annual"] == 9
+
+    def test_rolled_back_write_not_cached(self):
+        """A write that is rolled back never reaches the cache."""
+        from src.db.connection import request_scope
+        from src.mcp_server.tools.hr_tools import (
+            get_leave_balance,
+            submit_leave_request,
+        )
+
+        with pytest.raises(RuntimeError):
+            with request_scope():
+                submit_leave_request("EMP001", "2026-03-02", "2026-03-04", "annual")
+                get_leave_balance("EMP001")
+                raise RuntimeError("turn failed")
+        assert get_leave_balance("EMP001")["data"]["annual"] == 12
+
+    def test_update_statement_clears_cache(self):
+        """An UPDATE statement on leave_balances drops cached balances."""
+        from src.db.connection import get_session
+        from src.mcp_server.tools.hr_tools import get_leave_balance
+
+        get_leave_balance("EMP001")
+        with get_session() as session:
+            session.execute(update(LeaveBalance).values(balance_days=0))
+        assert get_leave_balance("EMP001")["data"]["annual"] == 0
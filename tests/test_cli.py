@@ -67,6 +67,22 @@ class TestCLIModule:
         output = buf.getvalue()
         assert "something went wrong" in output
 
+    def test_import_does_not_load_chromadb(self):
+        """chromadb is only imported when policy search first runs."""
+        import subprocess
+        import sys
+
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, src.cli.demo; "
+                "sys.exit('chromadb' in sys.modules)",
+            ],
+            capture_output=True,
+        )
+        assert result.returncode == 0
+
 
 class TestEmployeeSelection:
     """Tests for employee selection flow (Story 6.2)."""
@@ -95,13 +111,26 @@ class TestEmployeeSelection:
         mock_session_ctx.return_value.__enter__ = MagicMock(return_value=mock_session)
         mock_session_ctx.return_value.__exit__ = MagicMock(return_value=False)
 
-        mock_emp = MagicMock()
-        mock_emp.to_dict.return_value = {"id": "EMP001", "name": "Sipho"}
-        mock_session.query.return_value.all.return_value = [mock_emp]
+        from datetime import date
+
+        mock_session.execute.return_value = [
+            (
+                "EMP001",
+                "Sipho",
+                "Retail",
+                "Sales Assistant",
+                date(2024, 3, 15),
+                48.5,
+                "zu",
+                "4521",
+                "active",
+            )
+        ]
 
         result = load_all_employees()
         assert len(result) == 1
         assert result[0]["id"] == "EMP001"
+        assert result[0]["hire_date"] == "2024-03-15"
 
 
 class TestConversationLoop:
@@ -125,3 +154,19 @@ class TestConversationLoop:
         display_routing_info(console, "zu", "hr_query")
         output = buf.getvalue()
         assert "hr_query" in output or "HR" in output
+
+    def test_stream_response_returns_final_state(self):
+        """Streamed tokens render live and the final state is returned."""
+        from src.cli.demo import stream_response
+
+        def fake_stream_turn(graph, state, on_token):
+            on_token("You have ")
+            on_token("12 days.")
+            return {"response": "You have 12 days.", "intent": "hr_query"}
+
+        buf = StringIO()
+        console = Console(file=buf, force_terminal=True, width=80)
+        with patch("src.cli.demo.stream_turn", side_effect=fake_stream_turn):
+            result = stream_response(console, MagicMock(), {})
+        assert result["response"] == "You have 12 days."
+        assert "12 days" in buf.getvalue()
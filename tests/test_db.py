@@ -2,6 +2,7 @@
 
 import tempfile
 from contextlib import contextmanager
+from datetime import date
 from pathlib import Path
 
 import pytest
@@ -17,6 +18,7 @@ from src.db.models import (
     LeaveBalance,
     LeaveType,
     Timesheet,
+    TimesheetStatus,
 )
 
 
@@ -184,3 +186,700 @@ class TestSeedDatabase:
             seed_database(session)
             employees = session.query(Employee).all()
             assert len(employees) == 12
+
+
+class TestEngineProfiles:
+    """Tests for named SQLite engine profiles."""
+
+    @pytest.fixture(autouse=True)
+    def _reset(self):
+        from src.db.connection import reset_engine
+
+        reset_engine()
+        yield
+        reset_engine()
+
+    def test_default_profile_enables_wal(self, tmp_path, monkeypatch):
+        """get_engine applies WAL and busy_timeout on every connection."""
+        from sqlalchemy import text
+
+        from src.db.connection import get_engine
+
+        monkeypatch.delenv("JEM_DB_PROFILE", raising=False)
+        engine = get_engine(tmp_path / "hr.db")
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+
+    def test_profile_selected_by_env_var(self, tmp_path, monkeypatch):
+        """JEM_DB_PROFILE selects the profile when no argument is given."""
+        from sqlalchemy import text
+
+        from src.db.connection import get_engine
+
+        monkeypatch.setenv("JEM_DB_PROFILE", "bulk-load")
+        engine = get_engine(tmp_path / "hr.db")
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 0  # OFF
+
+    def test_unknown_profile_rejected(self, tmp_path):
+        """Unknown profile names raise ValueError."""
+        from src.db.connection import get_engine
+
+        with pytest.raises(ValueError):
+            get_engine(tmp_path / "hr.db", profile="turbo")
+
+    def test_reader_not_blocked_by_open_writer(self, tmp_path):
+        """A reader sees committed data while another connection holds a write."""
+        from sqlalchemy import text
+
+        from src.db.connection import get_engine
+        from src.db.seed import seed_database
+
+        engine = get_engine(tmp_path / "hr.db", profile="server")
+        with Session(engine) as session:
+            seed_database(session)
+
+        writer = engine.connect()
+        try:
+            writer.execute(text("BEGIN IMMEDIATE"))
+            writer.execute(
+                text("UPDATE leave_balances SET balance_days = 0 WHERE employee_id = 'EMP001'")
+            )
+            with engine.connect() as reader:
+                count = reader.execute(text("SELECT COUNT(*) FROM employees")).scalar()
+                assert count == 12
+        finally:
+            writer.rollback()
+            writer.close()
+
+
+class TestSyntheticData:
+    """Tests for generate_synthetic_data() bulk generator."""
+
+    def test_row_counts(self):
+        """Generator returns and inserts the expected number of rows."""
+        from src.db.seed import generate_synthetic_data
+
+        with test_session() as session:
+            counts = generate_synthetic_data(session, 50, periods=4, shifts_per_period=3)
+            assert counts["employees"] == 50
+            assert counts["leave_balances"] == 150
+            assert counts["timesheets"] == 50 * 4 * 3
+            assert session.query(Timesheet).count() == counts["timesheets"]
+            assert session.query(EWATransaction).count() == counts["ewa_transactions"]
+
+    def test_deterministic_for_seed(self):
+        """Same seed produces identical rows; a different seed does not."""
+        from src.db.seed import generate_synthetic_data
+
+        def snapshot(seed):
+            with test_session() as session:
+                generate_synthetic_data(session, 30, periods=3, seed=seed)
+                return [e.to_dict() for e in session.query(Employee).order_by(Employee.id)], [
+                    t.to_dict() for t in session.query(EWATransaction).order_by(EWATransaction.id)
+                ]
+
+        assert snapshot(7) == snapshot(7)
+        assert snapshot(7) != snapshot(8)
+
+    def test_language_mix(self):
+        """Only languages in the requested mix are assigned."""
+        from src.db.seed import generate_synthetic_data
+
+        with test_session() as session:
+            generate_synthetic_data(session, 40, periods=2, language_mix={"af": 1.0})
+            langs = {e.preferred_language for e in session.query(Employee)}
+            assert langs == {"af"}
+
+    def test_idempotent(self):
+        """A second run with the same database is skipped."""
+        from src.db.seed import generate_synthetic_data
+
+        with test_session() as session:
+            generate_synthetic_data(session, 10, periods=2)
+            assert generate_synthetic_data(session, 10, periods=2) == {}
+            assert session.query(Employee).count() == 10
+
+    def test_rows_readable_by_tools(self):
+        """Synthetic dates round-trip through the ORM and tool queries."""
+        from src.db.seed import generate_synthetic_data, synthetic_employee_id
+        from src.mcp_server.tools.hr_tools import get_payslip
+
+        with test_session() as session:
+            generate_synthetic_data(session, 5, periods=2, shifts_per_period=2, seed=1)
+            emp_id = synthetic_employee_id(1)
+            txn = session.query(EWATransaction).first()
+            assert txn.disbursed_at is not None
+            result = get_payslip(emp_id, "2026-02", session)
+            assert result["success"] is True
+            hours = sum(
+                t.hours_worked
+                for t in session.query(Timesheet).filter_by(employee_id=emp_id, status="approved")
+                if t.pay_period_start.strftime("%Y-%m") == "2026-02"
+            )
+            assert result["data"]["hours_worked"] == pytest.approx(hours)
+
+
+class TestEmployeeRecord:
+    """Tests for the projection-based EmployeeRecord."""
+
+    def test_matches_orm_to_dict(self):
+        """EmployeeRecord.to_dict() equals Employee.to_dict() for every row."""
+        from src.db.records import EmployeeRecord
+        from src.db.seed import seed_database
+
+        with test_session() as session:
+            seed_database(session)
+            records = {
+                row.id: EmployeeRecord(*row).to_dict()
+                for row in session.execute(EmployeeRecord.select())
+            }
+            for employee in session.query(Employee):
+                assert records[employee.id] == employee.to_dict()
+
+    def test_slots_only(self):
+        """Records carry no per-instance __dict__."""
+        from datetime import date
+
+        from src.db.records import EmployeeRecord
+
+        record = EmployeeRecord(
+            "EMP001", "Sipho", "Retail", "Sales", date(2024, 1, 1), 1.0, "zu", "0000", "active"
+        )
+        assert not hasattr(record, "__dict__")
+
+
+class TestRequestScope:
+    """Tests for request-scoped sessions and query tracking."""
+
+    @pytest.fixture(autouse=True)
+    def _database(self, tmp_path):
+        from src.db.connection import get_engine, get_session, reset_engine
+        from src.db.seed import seed_database
+
+        reset_engine()
+        get_engine(tmp_path / "hr.db")
+        with get_session() as session:
+            seed_database(session)
+        yield
+        reset_engine()
+
+    def _annual_balance(self, employee_id: str) -> float:
+        from src.db.connection import get_session
+
+        with get_session() as session:
+            return (
+                session.query(LeaveBalance)
+                .filter_by(employee_id=employee_id, leave_type=LeaveType.ANNUAL.value)
+                .one()
+                .balance_days
+            )
+
+    def test_get_session_reuses_scope_session(self):
+        """Every get_session() inside the scope yields the same session."""
+        from src.db.connection import get_session, request_scope
+
+        with request_scope() as scoped:
+            with get_session() as first, get_session() as second:
+                assert first is scoped
+                assert second is scoped
+
+    def test_tools_share_one_session(self):
+        """Several tool calls in a scope begin a single session."""
+        from src.db.connection import request_scope, track_queries
+        from src.mcp_server.tools.ewa_tools import check_ewa_eligibility
+        from src.mcp_server.tools.hr_tools import get_employee, get_leave_balance
+
+        with track_queries() as unscoped:
+            get_employee("EMP001")
+            get_leave_balance("EMP001")
+            check_ewa_eligibility("EMP001")
+        with track_queries() as scoped, request_scope():
+            get_employee("EMP001")
+            get_leave_balance("EMP001")
+            check_ewa_eligibility("EMP001")
+
+        assert unscoped.sessions == 3
+        assert scoped.sessions == 1
+        assert scoped.queries <= unscoped.queries
+
+    def test_scope_commits_writes(self):
+        """Writes made in the scope are committed when it exits."""
+        from src.db.connection import request_scope
+        from src.mcp_server.tools.hr_tools import submit_leave_request
+
+        with request_scope():
+            result = submit_leave_request(
+                "EMP001", "2026-03-02", "2026-03-04", "annual"
+            )
+            assert result["success"] is True
+        assert self._annual_balance("EMP001") == 9
+
+    def test_failed_tool_rolls_back_whole_scope(self):
+        """An error raised through get_session() discards earlier writes."""
+        from src.db.connection import get_session, request_scope
+        from src.mcp_server.tools.hr_tools import submit_leave_request
+
+        with request_scope():
+            submit_leave_request("EMP001", "2026-03-02", "2026-03-04", "annual")
+            with pytest.raises(RuntimeError):
+                with get_session():
+                    raise RuntimeError("tool failed")
+        assert self._annual_balance("EMP001") == 12
+
+    def test_exception_in_scope_rolls_back(self):
+        """An exception escaping the scope rolls back and propagates."""
+        from src.db.connection import request_scope
+        from src.mcp_server.tools.hr_tools import submit_leave_request
+
+        with pytest.raises(RuntimeError):
+            with request_scope():
+                submit_leave_request("EMP001", "2026-03-02", "2026-03-04", "annual")
+                raise RuntimeError("graph failed")
+        assert self._annual_balance("EMP001") == 12
+
+
+class TestSchemaVersion:
+    """Tests for PRAGMA user_version schema checks at startup."""
+
+    def test_new_database_is_stamped(self, tmp_path):
+        """ensure_schema creates tables and records SCHEMA_VERSION."""
+        from sqlalchemy import inspect
+
+        from src.db.migrations import SCHEMA_VERSION, ensure_schema, get_schema_version
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'hr.db'}")
+        assert ensure_schema(engine) is True
+        assert get_schema_version(engine) == SCHEMA_VERSION
+        assert "employees" in inspect(engine).get_table_names()
+        engine.dispose()
+
+    def test_current_database_costs_one_query(self, tmp_path):
+        """A database already at SCHEMA_VERSION is checked with one PRAGMA."""
+        from src.db.connection import track_queries
+        from src.db.migrations import ensure_schema
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'hr.db'}")
+        ensure_schema(engine)
+        with track_queries() as stats:
+            assert ensure_schema(engine) is False
+        assert stats.queries == 1
+        engine.dispose()
+
+    def test_unversioned_database_is_migrated(self, tmp_path):
+        """A database created before versioning gets missing indexes."""
+        from sqlalchemy import inspect, text
+
+        from src.db.migrations import SCHEMA_VERSION, ensure_schema, get_schema_version
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'hr.db'}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX ix_timesheets_employee_status_period"))
+
+        assert ensure_schema(engine) is True
+        names = {ix["name"] for ix in inspect(engine).get_indexes("timesheets")}
+        assert "ix_timesheets_employee_status_period" in names
+        assert get_schema_version(engine) == SCHEMA_VERSION
+        engine.dispose()
+
+    def test_newer_database_left_alone(self, tmp_path):
+        """A database stamped by newer code is not migrated."""
+        from src.db.migrations import SCHEMA_VERSION, ensure_schema, get_schema_version
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'hr.db'}")
+        with engine.begin() as conn:
+            conn.exec_driver_sql(f"PRAGMA user_version = {SCHEMA_VERSION + 1}")
+        assert ensure_schema(engine) is False
+        assert get_schema_version(engine) == SCHEMA_VERSION + 1
+        engine.dispose()
+
+    def test_migration_drops_removed_index(self, tmp_path):
+        """Upgrading from schema version 3 drops the unused period-end index."""
+        from sqlalchemy import inspect
+
+        from src.db.migrations import ensure_schema
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'hr.db'}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql(
+                "CREATE INDEX ix_timesheets_employee_status_period_end ON "
+                "timesheets (employee_id, status, pay_period_end, pay_period_start)"
+            )
+            conn.exec_driver_sql("PRAGMA user_version = 3")
+
+        assert ensure_schema(engine) is True
+        names = {ix["name"] for ix in inspect(engine).get_indexes("timesheets")}
+        assert "ix_timesheets_employee_status_period_end" not in names
+        assert "ix_timesheets_employee_status_period" in names
+        engine.dispose()
+
+    def test_concurrent_migration_runs_once(self, tmp_path):
+        """A migration that waited for the write lock re-checks the version."""
+        import sqlite3
+
+        from sqlalchemy import event, inspect
+
+        from src.db.migrations import SCHEMA_VERSION, ensure_schema, get_schema_version
+
+        path = tmp_path / "hr.db"
+        other = sqlite3.connect(path, isolation_level=None)
+        other.execute("BEGIN IMMEDIATE")
+        other.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+        engine = create_engine(f"sqlite:///{path}")
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def finish_other(conn, cursor, statement, parameters, context, executemany):
+            # The other process commits while this one waits for the lock
+            if statement == "BEGIN IMMEDIATE":
+                other.execute("COMMIT")
+
+        assert ensure_schema(engine) is False
+        assert get_schema_version(engine) == SCHEMA_VERSION
+        assert "employees" not in inspect(engine).get_table_names()
+        other.close()
+        engine.dispose()
+
+
+class TestQueryInstrumentation:
+    """Tests for per-tool query attribution and slow-query logging."""
+
+    def test_tool_totals_accumulate(self):
+        """track_tool records calls and queries per tool name."""
+        from src.db.connection import reset_tool_query_stats, tool_query_stats
+        from src.db.seed import seed_database
+        from src.mcp_server.tools.hr_tools import get_employee, get_payslip
+
+        reset_tool_query_stats()
+        with test_session() as session:
+            seed_database(session)
+            get_employee("EMP001", session)
+            get_employee("EMP002", session)
+            get_payslip("EMP001", "2026-02", session)
+
+        totals = tool_query_stats()
+        assert totals["get_employee"]["calls"] == 2
+        assert totals["get_employee"]["queries"] == 2
+        assert totals["get_payslip"]["queries"] == 2
+        assert totals["get_payslip"]["seconds"] > 0
+        reset_tool_query_stats()
+
+    def test_slow_query_logged_with_plan(self, monkeypatch, caplog):
+        """Statements over the threshold are logged with tool and query plan."""
+        import logging
+
+        from src.db import connection
+        from src.db.seed import seed_database
+        from src.mcp_server.tools.hr_tools import get_employee
+
+        with test_session() as session:
+            seed_database(session)
+            monkeypatch.setattr(connection, "SLOW_QUERY_MS", 0.0)
+            with caplog.at_level(logging.WARNING, logger="src.db.connection"):
+                get_employee("EMP001", session)
+
+        messages = [r.getMessage() for r in caplog.records]
+        assert any(
+            "Slow query" in m and "get_employee" in m and "SEARCH employees" in m
+            for m in messages
+        )
+
+
+class TestEWALedger:
+    """Tests for the trigger-maintained EWA ledger and its reconciliation."""
+
+    def _ledger(self, session, employee_id):
+        from src.db.models import EWALedger
+
+        session.expire_all()
+        return session.get(EWALedger, employee_id)
+
+    def test_seed_data_reconciles(self):
+        """Seeded and synthetic transactions are reflected in the ledger."""
+        from src.db.ledger import reconcile_ewa_ledger
+        from src.db.seed import generate_synthetic_data, seed_database
+
+        with test_session() as session:
+            seed_database(session)
+            generate_synthetic_data(session, 200, periods=3, ewa_rate=0.5)
+            assert reconcile_ewa_ledger(session) == []
+
+    def test_advance_and_status_transitions(self):
+        """Disbursing adds to outstanding; repaying or cancelling removes it."""
+        from src.db.seed import seed_database
+        from src.mcp_server.tools.ewa_tools import request_ewa_advance
+
+        with test_session() as session:
+            seed_database(session)
+            ledger = self._ledger(session, "EMP002")
+            amount, count = ledger.outstanding_amount, ledger.outstanding_count
+            result = request_ewa_advance("EMP002", 150.25, session)
+            txn = session.get(EWATransaction, result["data"]["transaction_id"])
+
+            ledger = self._ledger(session, "EMP002")
+            assert ledger.outstanding_amount == amount + 150.25
+            assert ledger.outstanding_count == count + 1
+            assert ledger.last_disbursed_at == txn.disbursed_at
+
+            txn.status = EWAStatus.REPAID.value
+            session.flush()
+            ledger = self._ledger(session, "EMP002")
+            assert ledger.outstanding_amount == amount
+            assert ledger.outstanding_count == count
+
+            for txn in session.query(EWATransaction).filter_by(employee_id="EMP002"):
+                txn.status = EWAStatus.CANCELLED.value
+            session.flush()
+            ledger = self._ledger(session, "EMP002")
+            assert ledger.outstanding_amount == 0
+            assert ledger.outstanding_count == 0
+
+    def test_reconcile_detects_and_repairs_drift(self):
+        """A tampered ledger row is reported and fixed by repair=True."""
+        from sqlalchemy import text
+
+        from src.db.ledger import reconcile_ewa_ledger
+        from src.db.seed import seed_database
+
+        with test_session() as session:
+            seed_database(session)
+            session.execute(
+                text(
+                    "UPDATE ewa_ledger SET outstanding_amount = 1 "
+                    "WHERE employee_id = 'EMP002'"
+                )
+            )
+            mismatches = reconcile_ewa_ledger(session, repair=True)
+            assert [m["employee_id"] for m in mismatches] == ["EMP002"]
+            assert mismatches[0]["ledger"]["outstanding_amount"] == 1
+            assert reconcile_ewa_ledger(session) == []
+
+    def test_missing_ledger_row_reported(self):
+        """Transactions with no ledger row at all are a mismatch."""
+        from sqlalchemy import text
+
+        from src.db.ledger import reconcile_ewa_ledger
+        from src.db.seed import seed_database
+
+        with test_session() as session:
+            seed_database(session)
+            session.execute(text("DELETE FROM ewa_ledger"))
+            mismatches = reconcile_ewa_ledger(session)
+            assert mismatches[0]["ledger"] is None
+            assert mismatches[0]["actual"]["outstanding_count"] == 1
+
+    def test_migration_backfills_ledger(self, tmp_path):
+        """Upgrading a pre-ledger database creates and fills the ledger."""
+        from sqlalchemy import text
+
+        from src.db.ledger import reconcile_ewa_ledger
+        from src.db.migrations import ensure_schema
+        from src.db.seed import seed_database
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'hr.db'}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            seed_database(session)
+        with engine.begin() as conn:
+            for name in ("insert", "update", "delete"):
+                conn.execute(text(f"DROP TRIGGER trg_ewa_ledger_{name}"))
+            conn.execute(text("DROP TABLE ewa_ledger"))
+            conn.exec_driver_sql("PRAGMA user_version = 1")
+
+        assert ensure_schema(engine) is True
+        with Session(engine) as session:
+            assert self._ledger(session, "EMP002").outstanding_count == 1
+            assert reconcile_ewa_ledger(session) == []
+        engine.dispose()
+
+
+class TestEarnedToDate:
+    """Tests for the trigger-maintained earned-to-date accumulator."""
+
+    PERIODS = [
+        (date(2026, 1, 1), date(2026, 1, 31)),
+        (date(2026, 2, 1), date(2026, 2, 28)),
+        (date(2026, 2, 1), date(2026, 2, 14)),
+    ]
+
+    def _raw_hours(self, session):
+        """Approved hours per (employee, period) summed from timesheets."""
+        from sqlalchemy import func, select
+
+        rows = session.execute(
+            select(
+                Timesheet.employee_id,
+                Timesheet.pay_period_start,
+                Timesheet.pay_period_end,
+                func.sum(Timesheet.hours_worked),
+            )
+            .where(Timesheet.status == TimesheetStatus.APPROVED.value)
+            .group_by(
+                Timesheet.employee_id,
+                Timesheet.pay_period_start,
+                Timesheet.pay_period_end,
+            )
+        ).all()
+        return {tuple(row[:3]): row[3] for row in rows}
+
+    def _stored_hours(self, session):
+        """Non-empty accumulator rows keyed like _raw_hours()."""
+        from sqlalchemy import select
+
+        from src.db.models import EarnedToDate
+
+        rows = session.execute(
+            select(
+                EarnedToDate.employee_id,
+                EarnedToDate.pay_period_start,
+                EarnedToDate.pay_period_end,
+                EarnedToDate.approved_hours,
+            ).where(EarnedToDate.approved_count > 0)
+        ).all()
+        return {tuple(row[:3]): row[3] for row in rows}
+
+    def _random_step(self, rng, session, employee_ids):
+        """Apply one random insert, status change, edit, move or delete."""
+        from sqlalchemy import update
+
+        timesheets = session.query(Timesheet).all()
+        action = rng.choice(["insert", "status", "hours", "move", "delete", "bulk"])
+        if action == "insert" or not timesheets:
+            start, end = rng.choice(self.PERIODS)
+            session.add(
+                Timesheet(
+                    employee_id=rng.choice(employee_ids),
+                    pay_period_start=start,
+                    pay_period_end=end,
+                    hours_worked=round(rng.uniform(0.25, 12), 2),
+                    status=rng.choice(list(TimesheetStatus)).value,
+                )
+            )
+            return
+        timesheet = rng.choice(timesheets)
+        if action == "status":
+            timesheet.status = rng.choice(list(TimesheetStatus)).value
+        elif action == "hours":
+            timesheet.hours_worked = round(rng.uniform(0.25, 12), 2)
+        elif action == "move":
+            start, end = rng.choice(self.PERIODS)
+            timesheet.pay_period_start, timesheet.pay_period_end = start, end
+            timesheet.employee_id = rng.choice(employee_ids)
+        elif action == "delete":
+            session.delete(timesheet)
+        else:
+            session.execute(
+                update(Timesheet)
+                .where(Timesheet.employee_id == timesheet.employee_id)
+                .values(status=rng.choice(list(TimesheetStatus)).value)
+            )
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_random_operations_match_raw_aggregation(self, seed):
+        """Any sequence of timesheet writes leaves the accumulator exact."""
+        import random
+
+        from src.db.ledger import reconcile_earned_to_date
+        from src.db.seed import seed_database
+
+        rng = random.Random(seed)
+        with test_session() as session:
+            seed_database(session)
+            employee_ids = ["EMP001", "EMP002", "EMP003"]
+            for _ in range(60):
+                self._random_step(rng, session, employee_ids)
+                session.flush()
+                session.expire_all()
+
+                raw = self._raw_hours(session)
+                stored = self._stored_hours(session)
+                assert stored.keys() == raw.keys()
+                for key, hours in raw.items():
+                    assert stored[key] == pytest.approx(hours, abs=1e-6), key
+            assert reconcile_earned_to_date(session) == []
+
+    def test_eligibility_reads_accumulator(self):
+        """check_ewa_eligibility reflects approvals and rejections immediately."""
+        from src.db.seed import seed_database
+        from src.mcp_server.tools.ewa_tools import (
+            DEMO_TODAY,
+            check_ewa_eligibility,
+        )
+
+        with test_session() as session:
+            seed_database(session)
+            employee = session.get(Employee, "EMP002")
+            before = check_ewa_eligibility("EMP002", session)["data"]["earned"]
+
+            timesheet = Timesheet(
+                employee_id="EMP002",
+                pay_period_start=DEMO_TODAY.replace(day=1),
+                pay_period_end=DEMO_TODAY.replace(day=28),
+                hours_worked=6.5,
+                status=TimesheetStatus.PENDING.value,
+            )
+            session.add(timesheet)
+            session.flush()
+            assert check_ewa_eligibility("EMP002", session)["data"]["earned"] == before
+
+            timesheet.status = TimesheetStatus.APPROVED.value
+            session.flush()
+            earned = check_ewa_eligibility("EMP002", session)["data"]["earned"]
+            assert earned == pytest.approx(before + 6.5 * employee.hourly_rate)
+
+            timesheet.status = TimesheetStatus.REJECTED.value
+            session.flush()
+            earned = check_ewa_eligibility("EMP002", session)["data"]["earned"]
+            assert earned == pytest.approx(before)
+
+    def test_reconcile_detects_and_repairs_drift(self):
+        """A tampered accumulator row is reported and fixed by repair=True."""
+        from sqlalchemy import text
+
+        from src.db.ledger import reconcile_earned_to_date
+        from src.db.seed import generate_synthetic_data, seed_database
+
+        with test_session() as session:
+            seed_database(session)
+            generate_synthetic_data(session, 50, periods=3)
+            assert reconcile_earned_to_date(session) == []
+
+            session.execute(
+                text(
+                    "UPDATE earned_to_date SET approved_hours = approved_hours + 1 "
+                    "WHERE employee_id = 'EMP002'"
+                )
+            )
+            mismatches = reconcile_earned_to_date(session, repair=True)
+            assert {m["employee_id"] for m in mismatches} == {"EMP002"}
+            assert reconcile_earned_to_date(session) == []
+
+    def test_migration_backfills_accumulator(self, tmp_path):
+        """Upgrading from schema version 2 creates and fills the accumulator."""
+        from sqlalchemy import text
+
+        from src.db.ledger import reconcile_earned_to_date
+        from src.db.migrations import ensure_schema
+        from src.db.seed import seed_database
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'hr.db'}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            seed_database(session)
+        with engine.begin() as conn:
+            for name in ("insert", "update", "delete"):
+                conn.execute(text(f"DROP TRIGGER trg_earned_to_date_{name}"))
+            conn.execute(text("DROP TABLE earned_to_date"))
+            conn.exec_driver_sql("PRAGMA user_version = 2")
+
+        assert ensure_schema(engine) is True
+        with Session(engine) as session:
+            assert self._stored_hours(session) == pytest.approx(
+                self._raw_hours(session)
+            )
+            assert reconcile_earned_to_date(session) == []
+        engine.dispose()
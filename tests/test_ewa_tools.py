@@ -2,6 +2,7 @@
 
 from contextlib import contextmanager
 
+import pytest
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 
@@ -143,3 +144,137 @@ class TestRequestEwaAdvance:
             result = request_ewa_advance("INVALID", 500, session)
             assert result["success"] is False
             assert result["code"] == "NOT_FOUND"
+
+
+class TestCheckEwaEligibilityBatch:
+    """Tests for check_ewa_eligibility_batch."""
+
+    def test_matches_single_checks(self):
+        """Batch results equal per-employee check_ewa_eligibility results."""
+        from src.db.seed import generate_synthetic_data
+        from src.mcp_server.tools.ewa_tools import (
+            check_ewa_eligibility,
+            check_ewa_eligibility_batch,
+        )
+
+        with seeded_session() as session:
+            generate_synthetic_data(session, 60, periods=3)
+            ids = [f"EMP{i:03d}" for i in range(1, 13)]
+            ids += [f"EMP{i:07d}" for i in range(1, 61)] + ["INVALID"]
+            batch = check_ewa_eligibility_batch(ids, session)
+            assert list(batch) == ids
+            for emp_id in ids:
+                assert batch[emp_id] == check_ewa_eligibility(emp_id, session), emp_id
+
+    def test_constant_query_count(self):
+        """Query count does not grow with the number of employees."""
+        from sqlalchemy import event
+
+        from src.db.seed import generate_synthetic_data
+        from src.mcp_server.tools.ewa_tools import check_ewa_eligibility_batch
+
+        with seeded_session() as session:
+            generate_synthetic_data(session, 300, periods=2)
+            statements = []
+            event.listen(
+                session.get_bind(),
+                "before_cursor_execute",
+                lambda *args: statements.append(args[2]),
+            )
+            check_ewa_eligibility_batch(["EMP001", "EMP002"], session)
+            small = len(statements)
+            statements.clear()
+            check_ewa_eligibility_batch([f"EMP{i:07d}" for i in range(1, 301)], session)
+            assert len(statements) == small == 1
+
+    def test_empty_batch(self):
+        """An empty ID list returns an empty dict."""
+        from src.mcp_server.tools.ewa_tools import check_ewa_eligibility_batch
+
+        with seeded_session() as session:
+            assert check_ewa_eligibility_batch([], session) == {}
+
+
+class TestIdempotentAdvance:
+    """Tests for request_ewa_advance idempotency keys."""
+
+    def test_retry_returns_original_transaction(self):
+        """A retry with the same key returns the first transaction."""
+        from src.mcp_server.tools.ewa_tools import request_ewa_advance
+
+        with seeded_session() as session:
+            first = request_ewa_advance("EMP001", 500, session, idempotency_key="tap-1")
+            retry = request_ewa_advance("EMP001", 500, session, idempotency_key="tap-1")
+            assert first["success"] is True
+            assert retry == first
+            count = session.query(EWATransaction).filter_by(employee_id="EMP001").count()
+            assert count == 1
+
+    def test_key_reused_with_different_amount(self):
+        """Reusing a key for a different amount is rejected."""
+        from src.mcp_server.tools.ewa_tools import request_ewa_advance
+
+        with seeded_session() as session:
+            request_ewa_advance("EMP001", 500, session, idempotency_key="tap-1")
+            result = request_ewa_advance("EMP001", 700, session, idempotency_key="tap-1")
+            assert result["success"] is False
+            assert result["code"] == "IDEMPOTENCY_CONFLICT"
+
+    def test_keys_scoped_per_employee(self):
+        """The same key used by two employees creates two transactions."""
+        from src.mcp_server.tools.ewa_tools import request_ewa_advance
+
+        with seeded_session() as session:
+            a = request_ewa_advance("EMP001", 100, session, idempotency_key="k")
+            b = request_ewa_advance("EMP003", 100, session, idempotency_key="k")
+            assert a["data"]["transaction_id"] != b["data"]["transaction_id"]
+
+
+class TestConcurrentAdvances:
+    """Stress tests for concurrent request_ewa_advance calls."""
+
+    @pytest.fixture
+    def file_db(self, tmp_path):
+        from src.db.connection import get_engine, get_session, reset_engine
+
+        reset_engine()
+        get_engine(tmp_path / "hr.db", profile="server")
+        with get_session() as session:
+            seed_database(session)
+        yield
+        reset_engine()
+
+    def _fire(self, calls):
+        from concurrent.futures import ThreadPoolExecutor
+
+        from src.mcp_server.tools.ewa_tools import request_ewa_advance
+
+        with ThreadPoolExecutor(max_workers=32) as pool:
+            futures = [pool.submit(request_ewa_advance, *args, **kw) for args, kw in calls]
+            return [f.result() for f in futures]
+
+    def test_cap_never_exceeded(self, file_db):
+        """Hundreds of parallel advances never overdraw the available amount."""
+        from src.mcp_server.tools.ewa_tools import check_ewa_eligibility
+
+        results = self._fire([(("EMP001", 100), {}) for _ in range(300)])
+
+        codes = {r.get("code") for r in results if not r["success"]}
+        assert codes <= {"EXCEEDS_AVAILABLE"}
+        successes = sum(r["success"] for r in results)
+        assert successes == 21  # R2134 available / R100
+
+        eligibility = check_ewa_eligibility("EMP001")["data"]
+        assert eligibility["outstanding"] == successes * 100
+        assert eligibility["outstanding"] <= 2134
+
+    def test_parallel_retries_create_one_transaction(self, file_db):
+        """Concurrent retries sharing an idempotency key yield one transaction."""
+        from src.mcp_server.tools.ewa_tools import check_ewa_eligibility
+
+        results = self._fire(
+            [(("EMP001", 250), {"idempotency_key": "double-tap"}) for _ in range(100)]
+        )
+        assert all(r["success"] for r in results)
+        assert len({r["data"]["transaction_id"] for r in results}) == 1
+        assert check_ewa_eligibility("EMP001")["data"]["outstanding"] == 250
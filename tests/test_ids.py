@@ -0,0 +1,106 @@
+"""Tests for time-ordered primary-key IDs."""
+
+import itertools
+import multiprocessing
+import time
+
+import pytest
+
+from src.db.ids import ID_CHARS, id_timestamp, new_id
+
+
+def _sequence(id_: str) -> int:
+    """Return the sequence number encoded in an ID from new_id()."""
+    value = 0
+    for char in id_[-ID_CHARS:]:
+        value = value * 32 + "0123456789ABCDEFGHJKMNPQRSTVWXYZ".index(char)
+    return value & 0x1FFF
+
+
+def _generate(count: int) -> list[str]:
+    """Generate IDs in a worker process."""
+    return [new_id("EWA-") for _ in range(count)]
+
+
+class TestNewId:
+    """Tests for new_id()."""
+
+    def test_fits_transaction_id_column(self):
+        """Prefixed IDs fit EWATransaction.id's String(20)."""
+        txn_id = new_id("EWA-")
+        assert txn_id.startswith("EWA-")
+        assert len(txn_id) == 4 + ID_CHARS == 20
+        assert set(txn_id[4:]) <= set("0123456789ABCDEFGHJKMNPQRSTVWXYZ")
+
+    def test_ids_sort_by_creation_time(self):
+        """IDs from later milliseconds sort after earlier ones."""
+        first = new_id()
+        time.sleep(0.002)
+        second = new_id()
+        time.sleep(0.002)
+        third = new_id()
+        assert first < second < third
+
+    def test_unique_within_process(self):
+        """A tight loop never repeats an ID."""
+        ids = [new_id() for _ in range(100_000)]
+        assert len(set(ids)) == len(ids)
+
+    def test_timestamp_round_trip(self):
+        """The encoded timestamp is the generation time to the millisecond."""
+        before = time.time()
+        txn_id = new_id("EWA-")
+        after = time.time()
+        assert before - 0.001 <= id_timestamp(txn_id) <= after + 0.001
+
+    def test_unique_across_processes(self):
+        """Concurrent forked processes generate disjoint IDs."""
+        if "fork" not in multiprocessing.get_all_start_methods():
+            pytest.skip("fork start method unavailable")
+        new_id()  # Initialise the parent's node before forking
+        context = multiprocessing.get_context("fork")
+        with context.Pool(4) as pool:
+            batches = pool.map(_generate, [20_000] * 4)
+        ids = [txn_id for batch in batches for txn_id in batch]
+        assert len(set(ids)) == len(ids)
+
+    def test_node_from_environment(self, monkeypatch):
+        """JEM_ID_NODE overrides the process ID as the node."""
+        import src.db.ids as ids
+
+        monkeypatch.setattr(ids, "_node", None)
+        monkeypatch.setenv(ids.NODE_ENV_VAR, "12345")
+        assert ids._node_id() == 12345
+
+    def test_sequence_restarts_each_millisecond(self, monkeypatch):
+        """The sequence counts IDs within a millisecond and restarts after it."""
+        import src.db.ids as ids
+
+        clock = iter([1000, 1000, 1000, 1001])
+        monkeypatch.setattr(ids, "_now_millis", lambda: next(clock))
+        monkeypatch.setattr(ids, "_last_millis", -1)
+        generated = [new_id() for _ in range(4)]
+        assert [_sequence(txn_id) for txn_id in generated] == [0, 1, 2, 0]
+        assert generated == sorted(generated)
+
+    def test_full_millisecond_waits_for_the_next(self, monkeypatch):
+        """After 8192 IDs in one millisecond the next ID uses the next one."""
+        import src.db.ids as ids
+
+        clock = itertools.chain([1000] * 8195, itertools.repeat(1001))
+        monkeypatch.setattr(ids, "_now_millis", lambda: next(clock))
+        monkeypatch.setattr(ids, "_last_millis", -1)
+        generated = [new_id() for _ in range(8193)]
+        assert len(set(generated)) == len(generated)
+        assert generated == sorted(generated)
+        assert id_timestamp(generated[-1]) == 1.001
+        assert _sequence(generated[-1]) == 0
+
+    def test_node_out_of_range_rejected(self, monkeypatch):
+        """A JEM_ID_NODE that does not fit the node field is an error."""
+        import src.db.ids as ids
+
+        monkeypatch.setattr(ids, "_node", None)
+        monkeypatch.setenv(ids.NODE_ENV_VAR, str(1 << 22))
+        with pytest.raises(ValueError):
+            ids._node_id()
@@ -0,0 +1,263 @@
+"""Tests for the pooled LLM clients and the prompt-keyed response cache."""
+
+import asyncio
+import threading
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import httpx
+import pytest
+from langchain_core.messages import AIMessage, AIMessageChunk
+
+from src.agents.llm import (
+    CachedLLM,
+    ResponseCache,
+    cache_key,
+    get_client,
+    normalize_prompt,
+    reset_clients,
+)
+
+
+class FakeClock:
+    """Manually advanced wall clock."""
+
+    def __init__(self) -> None:
+        self.now = 1_000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _model(content: str = "hr_query") -> MagicMock:
+    """A chat model mock answering every prompt with content."""
+    llm = MagicMock()
+    llm.invoke.return_value = AIMessage(content=content)
+    return llm
+
+
+class TestClientPool:
+    """Tests for the long-lived client registry."""
+
+    @pytest.fixture(autouse=True)
+    def _fresh_pool(self):
+        """Start and end every test with no pooled clients."""
+        reset_clients()
+        yield
+        reset_clients()
+
+    def test_one_client_per_parameters(self):
+        """Equal parameters share a client; different ones do not."""
+        schema = {"type": "object", "properties": {"tool": {"type": "string"}}}
+        assert get_client(20) is get_client(20)
+        assert get_client(80, dict(schema)) is get_client(80, dict(schema))
+        assert get_client(20) is not get_client(80)
+        assert get_client(80) is not get_client(80, schema)
+
+    def test_concurrent_first_use_creates_one_client(self):
+        """Threads racing to create the same client all get one instance."""
+        barrier = threading.Barrier(16)
+        clients = []
+
+        def worker():
+            barrier.wait()
+            clients.append(get_client(33))
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        assert len({id(client) for client in clients}) == 1
+
+    def test_connection_limits_from_env(self, monkeypatch):
+        """The HTTP pool is sized from the environment."""
+        from src.agents.llm import KEEPALIVE_ENV_VAR, MAX_CONNECTIONS_ENV_VAR
+
+        monkeypatch.setenv(MAX_CONNECTIONS_ENV_VAR, "2")
+        monkeypatch.setenv(KEEPALIVE_ENV_VAR, "5")
+        with patch.object(httpx, "HTTPTransport") as sync_transport:
+            with patch.object(httpx, "AsyncHTTPTransport") as async_transport:
+                async_transport.return_value.aclose = AsyncMock()
+                with patch("src.agents.llm.ChatOllama") as chat_ollama:
+                    get_client(20)
+        kwargs = chat_ollama.call_args.kwargs
+        assert kwargs["sync_client_kwargs"] == {
+            "transport": sync_transport.return_value
+        }
+        assert kwargs["async_client_kwargs"] == {
+            "transport": async_transport.return_value
+        }
+        for transport in (sync_transport, async_transport):
+            limits = transport.call_args.kwargs["limits"]
+            assert limits.max_connections == limits.max_keepalive_connections == 2
+            assert limits.keepalive_expiry == 5.0
+
+    def test_reset_closes_sync_and_async_connections(self):
+        """Resetting closes both connection pools of every pooled client."""
+        from src.agents.llm import _transports
+
+        get_client(20)
+        get_client(80)
+        transports = list(_transports.values())
+        closes = [patch.object(t, "close", wraps=t.close) for t, _ in transports]
+        acloses = [patch.object(t, "aclose", wraps=t.aclose) for _, t in transports]
+        spies = [p.start() for p in closes + acloses]
+        try:
+            reset_clients()
+        finally:
+            patch.stopall()
+        assert not _transports
+        for close in spies[: len(closes)]:
+            close.assert_called_once_with()
+        for aclose in spies[len(closes) :]:
+            aclose.assert_awaited_once_with()
+
+    def test_async_reset_closes_both_pools(self):
+        """The coroutine variant closes the same pools as reset_clients."""
+        from src.agents.llm import _transports, reset_async_clients
+
+        get_client(20)
+        [(sync_transport, async_transport)] = _transports.values()
+        with patch.object(async_transport, "aclose") as aclose:
+            with patch.object(sync_transport, "close") as close:
+                asyncio.run(reset_async_clients())
+        close.assert_called_once_with()
+        aclose.assert_awaited_once_with()
+        assert not _transports
+
+
+class TestCacheKey:
+    """Tests for prompt normalization and keys."""
+
+    def test_case_whitespace_and_final_punctuation_ignored(self):
+        """Trivially different phrasings of a message share a key."""
+        a = 'Classify:\nMessage: "How many leave days do I have?"'
+        b = 'classify: message:  "how many leave days do i have"'
+        assert normalize_prompt(a) == normalize_prompt(b)
+        assert cache_key("m", {}, a) == cache_key("m", {}, b)
+
+    def test_model_and_params_are_part_of_the_key(self):
+        """The same prompt to another model or with other params is a miss."""
+        key = cache_key("m", {"num_predict": 20}, "prompt")
+        assert key != cache_key("other", {"num_predict": 20}, "prompt")
+        assert key != cache_key("m", {"num_predict": 80}, "prompt")
+        assert key != cache_key("m", {"num_predict": 20}, "another prompt")
+
+
+class TestResponseCache:
+    """Tests for the memory and SQLite tiers."""
+
+    def test_expired_reply_is_a_miss(self):
+        """Replies expire after the TTL."""
+        clock = FakeClock()
+        cache = ResponseCache(maxsize=4, ttl=60, clock=clock)
+        cache.set("k", "hr_query")
+        assert cache.get("k") == "hr_query"
+        clock.now += 61
+        assert cache.get("k") is None
+        assert cache.stats()["hits"] == 1
+        assert cache.stats()["misses"] == 1
+
+    def test_zero_ttl_disables(self):
+        """A TTL of 0 stores nothing."""
+        cache = ResponseCache(ttl=0)
+        cache.set("k", "hr_query")
+        assert cache.get("k") is None
+
+    def test_replies_survive_restart_on_disk(self, tmp_path):
+        """A new cache on the same file answers from disk, then memory."""
+        path = tmp_path / "llm.db"
+        ResponseCache(path=path).set("k", "ewa_request")
+
+        cache = ResponseCache(path=path)
+        assert cache.get("k") == "ewa_request"
+        assert cache.get("k") == "ewa_request"
+        stats = cache.stats()
+        assert (stats["hits"], stats["disk_hits"], stats["hit_rate"]) == (2, 1, 1.0)
+
+    def test_disk_entry_keeps_its_expiry(self, tmp_path):
+        """A reply promoted from disk expires when it would have on disk."""
+        clock = FakeClock()
+        path = tmp_path / "llm.db"
+        ResponseCache(ttl=60, path=path, clock=clock).set("k", "hr_query")
+        clock.now += 50
+        cache = ResponseCache(ttl=60, path=path, clock=clock)
+        assert cache.get("k") == "hr_query"
+        clock.now += 11
+        assert cache.get("k") is None
+
+    def test_disk_holds_at_most_maxsize(self, tmp_path):
+        """The least recently used replies are pruned from the file."""
+        clock = FakeClock()
+        path = tmp_path / "llm.db"
+        cache = ResponseCache(maxsize=2, path=path, clock=clock)
+        for key in ("a", "b", "c"):
+            clock.now += 1
+            cache.set(key, key)
+
+        reopened = ResponseCache(maxsize=2, path=path, clock=clock)
+        assert reopened.get("a") is None
+        assert reopened.get("c") == "c"
+
+
+class TestCachedLLM:
+    """Tests for the get_llm() wrapper and the nodes using it."""
+
+    def test_repeat_prompt_skips_model(self):
+        """Only the first of two equivalent prompts reaches the model."""
+        llm = _model()
+        cached = CachedLLM(llm, "m", {"num_predict": 20}, ResponseCache())
+        first = cached.invoke('Message: "leave balance?"')
+        second = cached.invoke('Message: "Leave balance"')
+        assert first.content == second.content == "hr_query"
+        assert llm.invoke.call_count == 1
+
+    def test_get_llm_wraps_only_when_asked(self):
+        """get_llm() returns the bare model unless cache is set."""
+        from src.agents.llm import get_llm
+
+        assert not isinstance(get_llm(max_tokens=500), CachedLLM)
+        assert isinstance(get_llm(max_tokens=20, cache=True), CachedLLM)
+
+    @pytest.fixture
+    def database(self, tmp_path):
+        """A seeded database in tmp_path for graph turns."""
+        from src.db.connection import get_engine, get_session, reset_engine
+        from src.db.seed import seed_database
+
+        reset_engine()
+        get_engine(tmp_path / "hr.db")
+        with get_session() as session:
+            seed_database(session)
+        yield
+        reset_engine()
+
+    def test_classification_cached_but_response_not(self, database):
+        """A repeated turn re-sends only the free-form response prompt."""
+        from src.agents.graph import build_graph, invoke_turn
+        from src.agents.state import create_initial_state
+        from src.agents.testing import StubLLMFactory, use_llm
+
+        # Too vague for the keyword fast path, so it is classified by the LLM
+        message = "Could you help me with something about work"
+        graph = build_graph("sequential")
+        with use_llm(StubLLMFactory()) as factory:
+            invoke_turn(graph, create_initial_state("EMP001", message))
+            first = len(factory.calls)
+            invoke_turn(graph, create_initial_state("EMP001", message))
+
+        repeated = factory.calls[first:]
+        assert first > 2
+        assert [prompt.split()[0] for prompt in repeated] == ["Generate"]
+        assert factory.cache.stats()["hits"] == first - 1
+
+    def test_format_response_never_cached(self):
+        """response_format asks for an uncached model."""
+        from src.agents.nodes.response_format import _format_response
+
+        with patch("src.agents.nodes.response_format.get_llm") as get_llm:
+            get_llm.return_value.stream.return_value = iter(
+                [AIMessageChunk(content="Hel"), AIMessageChunk(content="lo")]
+            )
+            assert _format_response({"success": True}, "en", "hi") == "Hello"
+        assert get_llm.call_args.kwargs.get("cache", False) is False
@@ -173,6 +173,30 @@ class TestSubmitLeaveRequest:
             )
             assert balance.balance_days == 9  # 12 - 3
 
+    def test_public_holidays_not_deducted(self):
+        """Freedom Day and Workers' Day inside the range are not charged."""
+        from src.mcp_server.tools.hr_tools import submit_leave_request
+
+        with seeded_session() as session:
+            # Mon 27 Apr - Fri 1 May 2026: two public holidays
+            result = submit_leave_request(
+                "EMP001", "2026-04-27", "2026-05-01", "annual", session
+            )
+            assert result["success"] is True
+            assert result["data"]["days"] == 3
+
+    def test_holiday_only_range_rejected(self):
+        """A range covering only public holidays has no business days."""
+        from src.mcp_server.tools.hr_tools import submit_leave_request
+
+        with seeded_session() as session:
+            # Good Friday 3 Apr through Family Day 6 Apr 2026
+            result = submit_leave_request(
+                "EMP001", "2026-04-03", "2026-04-06", "annual", session
+            )
+            assert result["success"] is False
+            assert result["code"] == "INVALID_DATES"
+
     def test_insufficient_balance_returns_error(self):
         """AC #2: Insufficient balance returns error."""
         from src.mcp_server.tools.hr_tools import submit_leave_request
@@ -249,3 +273,171 @@ class TestGetPayslip:
             result = get_payslip("INVALID", "2026-02", session)
             assert result["success"] is False
             assert result["code"] == "NOT_FOUND"
+
+    def test_ewa_deductions_limited_to_month(self):
+        """Advances disbursed in other months are not deducted."""
+        from datetime import datetime
+
+        from src.db.models import EWATransaction
+        from src.mcp_server.tools.hr_tools import get_payslip
+
+        with seeded_session() as session:
+            for txn_id, when in [
+                ("EWA-20260131-X", datetime(2026, 1, 31, 23, 59)),
+                ("EWA-20260301-X", datetime(2026, 3, 1, 0, 0)),
+                ("EWA-20260228-X", datetime(2026, 2, 28, 23, 59)),
+            ]:
+                session.add(
+                    EWATransaction(
+                        id=txn_id,
+                        employee_id="EMP002",
+                        amount=100,
+                        status="disbursed",
+                        requested_at=when,
+                        disbursed_at=when,
+                    )
+                )
+            session.flush()
+            result = get_payslip("EMP002", "2026-02", session)
+            assert result["data"]["ewa_deductions"] == 900
+
+    def test_december_payslip(self):
+        """Month bounds roll over the year for December."""
+        from src.mcp_server.tools.hr_tools import get_payslip
+
+        with seeded_session() as session:
+            result = get_payslip("EMP001", "2025-12", session)
+            assert result["success"] is True
+            assert result["data"]["hours_worked"] == 0
+            assert result["data"]["net_pay"] == 0
+
+
+class TestBulkLookups:
+    """Tests for get_employees_bulk and get_leave_balances_bulk."""
+
+    def test_employees_bulk_matches_single(self):
+        """Bulk profiles equal get_employee results, including NOT_FOUND."""
+        from src.mcp_server.tools.hr_tools import get_employee, get_employees_bulk
+
+        with seeded_session() as session:
+            ids = ["EMP003", "INVALID", "EMP001", "EMP003"]
+            result = get_employees_bulk(ids, session)
+            assert list(result) == ["EMP003", "INVALID", "EMP001"]
+            for emp_id in result:
+                assert result[emp_id] == get_employee(emp_id, session)
+
+    def test_leave_balances_bulk_matches_single(self):
+        """Bulk balances equal get_leave_balance results for every employee."""
+        from src.mcp_server.tools.hr_tools import (
+            get_leave_balance,
+            get_leave_balances_bulk,
+        )
+
+        with seeded_session() as session:
+            ids = [f"EMP{i:03d}" for i in range(1, 13)] + ["INVALID"]
+            result = get_leave_balances_bulk(ids, session)
+            for emp_id in ids:
+                assert result[emp_id] == get_leave_balance(emp_id, session)
+
+    def test_bulk_chunks_large_id_lists(self, monkeypatch):
+        """ID lists larger than the chunk size are split across queries."""
+        from src.mcp_server.tools import hr_tools
+
+        monkeypatch.setattr(hr_tools, "BULK_CHUNK_SIZE", 5)
+        with seeded_session() as session:
+            ids = [f"EMP{i:03d}" for i in range(1, 13)]
+            result = hr_tools.get_leave_balances_bulk(ids, session)
+            assert all(result[emp_id]["success"] for emp_id in ids)
+            assert result["EMP005"]["data"]["annual"] == 9
+
+
+class TestQueryBudgets:
+    """Pin each tool to its SQL statement budget to catch N+1 regressions."""
+
+    def test_get_employee_budget(self):
+        """get_employee runs one projected SELECT."""
+        from src.db.connection import assert_max_queries
+        from src.mcp_server.tools.hr_tools import get_employee
+
+        with seeded_session() as session:
+            with assert_max_queries(1):
+                get_employee("EMP001", session)
+
+    def test_get_leave_balance_budget(self):
+        """get_leave_balance checks existence and balances in one SELECT."""
+        from src.db.connection import assert_max_queries
+        from src.mcp_server.tools.hr_tools import get_leave_balance
+
+        with seeded_session() as session:
+            with assert_max_queries(1):
+                get_leave_balance("EMP001", session)
+
+    def test_submit_leave_request_budget(self):
+        """submit_leave_request: employee, balance, then one UPDATE."""
+        from src.db.connection import assert_max_queries
+        from src.mcp_server.tools.hr_tools import submit_leave_request
+
+        with seeded_session() as session:
+            with assert_max_queries(3):
+                submit_leave_request(
+                    "EMP001", "2026-03-02", "2026-03-04", "annual", session
+                )
+
+    def test_get_payslip_budget(self):
+        """get_payslip: employee, then both aggregates in one SELECT."""
+        from src.db.connection import assert_max_queries
+        from src.mcp_server.tools.hr_tools import get_payslip
+
+        with seeded_session() as session:
+            with assert_max_queries(2):
+                get_payslip("EMP001", "2026-02", session)
+
+    def test_check_ewa_eligibility_budget(self):
+        """check_ewa_eligibility: profile and both accumulators in one SELECT."""
+        from src.db.connection import assert_max_queries
+        from src.mcp_server.tools.ewa_tools import check_ewa_eligibility
+
+        with seeded_session() as session:
+            with assert_max_queries(1):
+                check_ewa_eligibility("EMP002", session)
+
+    def test_request_ewa_advance_budget(self):
+        """request_ewa_advance: write lock, eligibility, INSERT."""
+        from src.db.connection import assert_max_queries
+        from src.mcp_server.tools.ewa_tools import request_ewa_advance
+
+        with seeded_session() as session:
+            with assert_max_queries(3):
+                result = request_ewa_advance("EMP002", 100, session)
+            assert result["success"] is True
+
+    def test_bulk_budgets_independent_of_employee_count(self):
+        """Bulk tools issue a fixed number of queries per chunk, not per employee."""
+        from src.db.connection import assert_max_queries
+        from src.mcp_server.tools.ewa_tools import check_ewa_eligibility_batch
+        from src.mcp_server.tools.hr_tools import (
+            get_employees_bulk,
+            get_leave_balances_bulk,
+        )
+
+        ids = [f"EMP{n:03d}" for n in range(1, 13)]
+        with seeded_session() as session:
+            with assert_max_queries(1):
+                get_employees_bulk(ids, session)
+            with assert_max_queries(2):
+                get_leave_balances_bulk(ids, session)
+            with assert_max_queries(1):
+                check_ewa_eligibility_batch(ids, session)
+
+    def test_budget_exceeded_lists_statements(self):
+        """assert_max_queries fails with the offending statements."""
+        import pytest
+
+        from src.db.connection import assert_max_queries
+        from src.mcp_server.tools.hr_tools import get_employee
+
+        with seeded_session() as session:
+            with pytest.raises(AssertionError, match="FROM employees"):
+                with assert_max_queries(1):
+                    get_employee("EMP001", session)
+                    get_employee("EMP002", session)
@@ -0,0 +1,190 @@
+"""Tests for the whole-company payroll run."""
+
+import csv
+import json
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from src.db.models import Base
+from src.db.seed import generate_synthetic_data, seed_database
+
+
+@contextmanager
+def payroll_session():
+    """Create an in-memory database with demo and synthetic employees."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    session = factory()
+    try:
+        seed_database(session)
+        generate_synthetic_data(session, 200, periods=6, shifts_per_period=3)
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+@pytest.mark.parametrize("month", ["2026-02", "2026-01", "2025-12"])
+def test_matches_get_payslip_for_every_employee(month):
+    """Every payroll record is identical to get_payslip's data."""
+    from src.mcp_server.tools.hr_tools import get_payslip
+    from src.payroll import iter_payslips
+
+    with payroll_session() as session:
+        records = list(iter_payslips(session, month, chunk_size=37))
+        assert len(records) == 212
+        for record in records:
+            expected = get_payslip(record["employee_id"], month, session)["data"]
+            assert json.dumps(record) == json.dumps(expected)
+
+
+def test_vectorized_matches_python():
+    """NumPy path produces byte-identical figures."""
+    pytest.importorskip("numpy")
+    from src.payroll import iter_payslips
+
+    with payroll_session() as session:
+        plain = list(iter_payslips(session, "2026-02"))
+        vectorized = list(iter_payslips(session, "2026-02", vectorize=True))
+        assert json.dumps(plain) == json.dumps(vectorized)
+
+
+def test_run_payroll_jsonl(tmp_path):
+    """JSONL output has one record per employee and a throughput summary."""
+    from src.payroll import run_payroll
+
+    output = tmp_path / "payroll.jsonl"
+    with payroll_session() as session:
+        summary = run_payroll("2026-02", output, "jsonl", session=session)
+    lines = output.read_text().splitlines()
+    assert summary["employees"] == len(lines) == 212
+    assert summary["payslips_per_second"] > 0
+    sipho = next(json.loads(line) for line in lines if '"EMP001"' in line)
+    assert sipho["gross_earnings"] == 4268.0
+
+
+def test_run_payroll_csv(tmp_path):
+    """CSV output has a header row and round-trips figures."""
+    from src.payroll import run_payroll
+
+    output = tmp_path / "payroll.csv"
+    with payroll_session() as session:
+        run_payroll("2026-02", output, "csv", session=session)
+    with open(output, newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert len(rows) == 212
+    thandiwe = next(r for r in rows if r["employee_id"] == "EMP002")
+    assert float(thandiwe["net_pay"]) == 2560.0
+
+
+def test_unsupported_format(tmp_path):
+    """Unknown output formats raise ValueError."""
+    from src.payroll import run_payroll
+
+    with pytest.raises(ValueError):
+        run_payroll("2026-02", tmp_path / "out.xml", "xml")
+
+
+class TestEWARepayments:
+    """Tests for the payroll-close EWA repayment reconciliation."""
+
+    def _disbursed_in(self, session, month):
+        from datetime import datetime
+
+        from sqlalchemy import func, select
+
+        from src.db.models import EWAStatus, EWATransaction
+        from src.mcp_server.tools.hr_tools import month_bounds
+
+        start, end = month_bounds(month)
+        midnight = datetime.min.time()
+        return session.scalar(
+            select(func.count()).where(
+                EWATransaction.status == EWAStatus.DISBURSED.value,
+                EWATransaction.disbursed_at >= datetime.combine(start, midnight),
+                EWATransaction.disbursed_at < datetime.combine(end, midnight),
+            )
+        )
+
+    def test_totals_match_payslip_deductions(self):
+        """Every employee's repaid total equals get_payslip's ewa_deductions."""
+        from src.db.ledger import reconcile_ewa_ledger
+        from src.payroll import iter_payslips, reconcile_ewa_repayments
+
+        with payroll_session() as session:
+            before = {
+                p["employee_id"]: p["ewa_deductions"]
+                for p in iter_payslips(session, "2026-02")
+            }
+            summary = reconcile_ewa_repayments("2026-02", session, chunk_size=17)
+
+            assert summary["transactions"] > 0
+            assert self._disbursed_in(session, "2026-02") == 0
+            for emp_id, deductions in before.items():
+                assert summary["totals"].get(emp_id, 0.0) == pytest.approx(
+                    deductions
+                ), emp_id
+            # Payslips for a closed month are unchanged
+            after = {
+                p["employee_id"]: p["ewa_deductions"]
+                for p in iter_payslips(session, "2026-02")
+            }
+            assert after == before
+            assert reconcile_ewa_ledger(session) == []
+
+    def test_outstanding_balance_cleared(self):
+        """Repaid advances no longer count against EWA availability."""
+        from src.mcp_server.tools.ewa_tools import check_ewa_eligibility
+        from src.payroll import reconcile_ewa_repayments
+
+        with payroll_session() as session:
+            assert check_ewa_eligibility("EMP002", session)["data"]["outstanding"] > 0
+            reconcile_ewa_repayments("2026-02", session)
+            assert check_ewa_eligibility("EMP002", session)["data"]["outstanding"] == 0
+
+    def test_rerun_after_interruption(self, monkeypatch):
+        """A run killed mid-way completes on rerun with the same totals."""
+        from sqlalchemy.orm import Session
+
+        from src.payroll import reconcile_ewa_repayments
+
+        with payroll_session() as session:
+            expected = reconcile_ewa_repayments("2026-02", session, chunk_size=10)
+            session.rollback()
+
+        with payroll_session() as session:
+            commits = []
+            original = Session.commit
+
+            def failing_commit(self):
+                if len(commits) == 2:
+                    raise RuntimeError("interrupted")
+                commits.append(1)
+                original(self)
+
+            monkeypatch.setattr(Session, "commit", failing_commit)
+            with pytest.raises(RuntimeError):
+                reconcile_ewa_repayments("2026-02", session, chunk_size=10)
+            session.rollback()
+            monkeypatch.undo()
+
+            resumed = reconcile_ewa_repayments("2026-02", session, chunk_size=10)
+            assert 0 < resumed["transactions"] < expected["transactions"]
+            assert resumed["totals"] == pytest.approx(expected["totals"])
+            assert self._disbursed_in(session, "2026-02") == 0
+
+    def test_start_after_skips_completed_employees(self):
+        """start_after resumes from the logged checkpoint."""
+        from src.payroll import reconcile_ewa_repayments
+
+        with payroll_session() as session:
+            summary = reconcile_ewa_repayments(
+                "2026-02", session, start_after="EMP0000100"
+            )
+            assert summary["totals"]
+            assert min(summary["totals"]) > "EMP0000100"
+            assert self._disbursed_in(session, "2026-02") > 0
@@ -0,0 +1,128 @@
+"""Query plan regression tests for the MCP tool queries."""
+
+from contextlib import contextmanager
+
+import pytest
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.orm import sessionmaker
+
+from src.db.models import Base, LeaveBalance
+from src.db.seed import seed_database
+
+HOT_TABLES = ("timesheets", "ewa_transactions", "leave_balances")
+
+
+@contextmanager
+def captured_queries():
+    """Yield (session, statements) where statements records every SELECT issued."""
+    engine = create_engine("sqlite:///:memory:")
+    Base.metadata.create_all(engine)
+    statements: list[tuple[str, tuple]] = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    factory = sessionmaker(bind=engine, expire_on_commit=False)
+    session = factory()
+    try:
+        seed_database(session)
+        statements.clear()
+        yield session, statements
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _full_scans(session, statements) -> list[str]:
+    """Return EXPLAIN QUERY PLAN lines that full-scan a hot table."""
+    scans = []
+    conn = session.connection()
+    for statement, parameters in statements:
+        plan = conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)
+        for row in plan:
+            detail = row[-1]
+            if detail.startswith("SCAN") and any(t in detail for t in HOT_TABLES):
+                scans.append(f"{detail} :: {statement}")
+    return scans
+
+
+@pytest.mark.parametrize(
+    "tool, args",
+    [
+        ("get_leave_balance", ("EMP005",)),
+        ("submit_leave_request", ("EMP005", "2026-03-02", "2026-03-03", "annual")),
+        ("get_payslip", ("EMP002", "2026-02")),
+        ("check_ewa_eligibility", ("EMP002",)),
+        ("request_ewa_advance", ("EMP001", 100)),
+    ],
+)
+def test_tool_queries_use_indexes(tool, args):
+    """Every query a tool issues against a hot table is an index search."""
+    from src.mcp_server import tools
+
+    with captured_queries() as (session, statements):
+        result = getattr(tools, tool)(*args, session=session)
+        assert result["success"] is True
+        assert statements, f"{tool} issued no SELECT statements"
+        assert _full_scans(session, statements) == []
+
+
+class TestIndexes:
+    """Tests for declared indexes and the schema upgrade path."""
+
+    def test_leave_balance_unique_per_type(self):
+        """A second balance row for the same employee and leave type is rejected."""
+        from sqlalchemy.exc import IntegrityError
+
+        with captured_queries() as (session, _):
+            session.add(
+                LeaveBalance(
+                    employee_id="EMP001", leave_type="annual", balance_days=1
+                )
+            )
+            with pytest.raises(IntegrityError):
+                session.flush()
+
+    def test_upgrade_schema_adds_missing_indexes(self, tmp_path):
+        """upgrade_schema creates indexes on a database that predates them."""
+        from src.db.migrations import upgrade_schema
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            for table in Base.metadata.sorted_tables:
+                for index in table.indexes:
+                    conn.execute(text(f"DROP INDEX {index.name}"))
+
+        created = upgrade_schema(engine)
+        assert set(created) == {
+            "uq_leave_balances_employee_type",
+            "ix_timesheets_employee_status_period",
+            "ix_ewa_transactions_employee_status_disbursed",
+            "uq_ewa_transactions_employee_idempotency",
+        }
+        names = {ix["name"] for ix in inspect(engine).get_indexes("timesheets")}
+        assert "ix_timesheets_employee_status_period" in names
+        assert upgrade_schema(engine) == []
+        engine.dispose()
+
+    def test_upgrade_schema_adds_missing_columns(self, tmp_path):
+        """upgrade_schema adds nullable columns to tables that predate them."""
+        from src.db.migrations import upgrade_schema
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'old.db'}")
+        Base.metadata.create_all(engine)
+        with engine.begin() as conn:
+            conn.execute(text("DROP INDEX uq_ewa_transactions_employee_idempotency"))
+            conn.execute(text("ALTER TABLE ewa_transactions DROP COLUMN idempotency_key"))
+
+        created = upgrade_schema(engine)
+        assert created == [
+            "ewa_transactions.idempotency_key",
+            "uq_ewa_transactions_employee_idempotency",
+        ]
+        columns = {c["name"] for c in inspect(engine).get_columns("ewa_transactions")}
+        assert "idempotency_key" in columns
+        engine.dispose()
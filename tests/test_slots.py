@@ -0,0 +1,264 @@
+"""Tests for tool argument extraction and filling."""
+
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.i18n.slots import clean_slots, extract_slots
+
+# A Wednesday
+TODAY = date(2026, 2, 18)
+
+
+class TestExtractDates:
+    """Tests for start_date and end_date extraction."""
+
+    @pytest.mark.parametrize(
+        "message, start, end",
+        [
+            ("Submit leave for 1-3 March", "2026-03-01", "2026-03-03"),
+            (
+                "I'd like to apply for leave from the 2nd to the 5th of April",
+                "2026-04-02",
+                "2026-04-05",
+            ),
+            ("Leave on March 10th please", "2026-03-10", "2026-03-10"),
+            ("sick leave 2026-02-16 to 2026-02-17", "2026-02-16", "2026-02-17"),
+            ("leave 10/03 - 12/03", "2026-03-10", "2026-03-12"),
+            ("Ek wil verlof van 28 Feb tot 3 Maart", "2026-02-28", "2026-03-03"),
+            ("Ngicela ikhefu ngomhla ka-3 Mashi", "2026-03-03", "2026-03-03"),
+            ("ikhefu ngo-5 uNdasa", "2026-03-05", "2026-03-05"),
+        ],
+    )
+    def test_explicit_dates(self, message, start, end):
+        """Day-month, month-day, ISO and numeric dates in three languages."""
+        slots = extract_slots(message, TODAY)
+        assert (slots["start_date"], slots["end_date"]) == (start, end)
+
+    @pytest.mark.parametrize(
+        "message, start, end",
+        [
+            ("I need a day off tomorrow", "2026-02-19", "2026-02-19"),
+            ("Can I take leave on Friday?", "2026-02-20", "2026-02-20"),
+            ("next Friday", "2026-02-27", "2026-02-27"),
+            ("I want to book leave next week", "2026-02-23", "2026-02-27"),
+            ("Ngifuna ikhefu ngoLwesihlanu", "2026-02-20", "2026-02-20"),
+            ("Ndicela ikhefu ngoMvulo", "2026-02-23", "2026-02-23"),
+        ],
+    )
+    def test_relative_dates(self, message, start, end):
+        """Relative days and weekdays count from today."""
+        slots = extract_slots(message, TODAY)
+        assert (slots["start_date"], slots["end_date"]) == (start, end)
+
+    def test_duration_counts_business_days(self):
+        """A day count after a start date ends on the Nth business day."""
+        slots = extract_slots("Book 2 days off from Thursday 2 April", TODAY)
+        # Good Friday, the weekend and Family Day come between
+        assert slots["start_date"] == "2026-04-02"
+        assert slots["end_date"] == "2026-04-07"
+
+    def test_yearless_date_long_past_moves_to_next_year(self):
+        """A day and month well before today is read as next year's."""
+        slots = extract_slots("leave on 5 December", TODAY)
+        assert slots["start_date"] == "2026-12-05"
+        slots = extract_slots("I was sick on 2 January", TODAY)
+        assert slots["start_date"] == "2026-01-02"
+
+    def test_invalid_date_ignored(self):
+        """Dates that do not exist are not extracted."""
+        assert "start_date" not in extract_slots("leave on 31 February", TODAY)
+
+
+class TestExtractMonth:
+    """Tests for payslip month extraction."""
+
+    @pytest.mark.parametrize(
+        "message, month",
+        [
+            ("Show my payslip for January", "2026-01"),
+            ("payslip for Desember", "2025-12"),
+            ("payslip May 2025", "2025-05"),
+            ("payslip for 2025-11", "2025-11"),
+            ("last month's payslip", "2026-01"),
+            ("verlede maand se salarisstrokie", "2026-01"),
+            ("ngicela umholo kaJanuwari", "2026-01"),
+        ],
+    )
+    def test_months(self, message, month):
+        """Month names resolve to the most recent such month."""
+        assert extract_slots(message, TODAY)["month"] == month
+
+    def test_may_as_verb_is_not_a_month(self):
+        """'May I' is not read as the month of May."""
+        assert "month" not in extract_slots("May I see my payslip?", TODAY)
+
+
+class TestExtractAmount:
+    """Tests for Rand amount extraction."""
+
+    @pytest.mark.parametrize(
+        "message, amount",
+        [
+            ("I want R1 500", 1500.0),
+            ("Withdraw R1,500.50 now", 1500.5),
+            ("R1 500,50 please", 1500.5),
+            ("give me 1.5k", 1500.0),
+            ("R2k", 2000.0),
+            ("800 rand please", 800.0),
+            ("ZAR 750", 750.0),
+            ("Ngicela imali engu-R500", 500.0),
+        ],
+    )
+    def test_amounts(self, message, amount):
+        """Symbols, thousands separators, decimal commas and k suffixes."""
+        assert extract_slots(message, TODAY)["amount"] == amount
+
+    def test_plain_numbers_are_not_amounts(self):
+        """Numbers without a currency marker are not amounts."""
+        assert "amount" not in extract_slots("I need 3 days off", TODAY)
+
+
+class TestExtractLeaveType:
+    """Tests for leave type extraction."""
+
+    @pytest.mark.parametrize(
+        "message, leave_type",
+        [
+            ("I was sick yesterday", "sick"),
+            ("Ek wil siekteverlof neem", "sick"),
+            ("ikhefu lokugula", "sick"),
+            ("family responsibility leave for a funeral", "family"),
+            ("annual leave in April", "annual"),
+        ],
+    )
+    def test_leave_types(self, message, leave_type):
+        """Leave type words in English, Afrikaans and isiZulu."""
+        assert extract_slots(message, TODAY)["leave_type"] == leave_type
+
+
+class TestCleanSlots:
+    """Tests for validating model-supplied arguments."""
+
+    def test_keeps_only_valid_values(self):
+        """Malformed dates, months, leave types and amounts are dropped."""
+        assert clean_slots(
+            {
+                "start_date": "2026-04-01",
+                "end_date": "tomorrow",
+                "month": "Feb",
+                "leave_type": "Sick",
+                "amount": "800",
+            }
+        ) == {"start_date": "2026-04-01", "leave_type": "sick", "amount": 800.0}
+        assert clean_slots({"amount": -5, "leave_type": "unpaid"}) == {}
+
+
+class TestFillToolArgs:
+    """Tests for filling agent tool calls, with the LLM as fallback."""
+
+    def test_extracted_args_skip_llm(self):
+        """Arguments found in the message cost no model call."""
+        from src.agents.nodes.slot_filler import fill_tool_args
+        from src.agents.testing import StubLLMFactory, use_llm
+
+        with use_llm(StubLLMFactory()) as factory:
+            args = fill_tool_args(
+                "submit_leave_request", "Book sick leave 2026-03-10 to 2026-03-12"
+            )
+        assert args == {
+            "start_date": "2026-03-10",
+            "end_date": "2026-03-12",
+            "leave_type": "sick",
+        }
+        assert factory.calls == []
+
+    def test_only_the_tools_args_are_kept(self):
+        """Values the tool does not take are dropped."""
+        from src.agents.nodes.slot_filler import fill_tool_args
+
+        args = fill_tool_args("request_ewa_advance", "R800 on 3 March", {"month": "x"})
+        assert args == {"amount": 800.0}
+        assert fill_tool_args("get_leave_balance", "R800 on 3 March") == {}
+
+    def test_missing_required_arg_asks_llm(self):
+        """A leave request without dates falls back to one LLM call."""
+        from src.agents.nodes.slot_filler import fill_tool_args
+
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(
+            content='{"start_date": "2026-12-24", "leave_type": "holiday"}'
+        )
+        with patch("src.agents.nodes.slot_filler.get_llm", return_value=llm):
+            args = fill_tool_args("submit_leave_request", "Leave for Christmas Eve")
+        assert args == {"start_date": "2026-12-24"}
+        assert llm.invoke.call_count == 1
+
+    def test_unparsed_numbers_ask_llm(self):
+        """Digits that did not become an argument fall back to the LLM."""
+        from src.agents.nodes.slot_filler import fill_tool_args
+
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content='{"amount": 700}')
+        with patch("src.agents.nodes.slot_filler.get_llm", return_value=llm):
+            args = fill_tool_args("request_ewa_advance", "I need 700 now")
+        assert args == {"amount": 700.0}
+
+    def test_router_args_are_overridden_by_extraction(self):
+        """Extracted values win over the routing call's arguments."""
+        from src.agents.nodes.slot_filler import fill_tool_args
+
+        args = fill_tool_args(
+            "get_payslip", "payslip for 2025-11", {"month": "2025-10"}
+        )
+        assert args == {"month": "2025-11"}
+
+    def test_hr_agent_passes_extracted_dates(self):
+        """hr_agent books the dates the message names."""
+        from src.agents.nodes.hr_agent import hr_agent
+        from src.agents.state import create_initial_state
+
+        state = create_initial_state(
+            "EMP001", "Book family leave 2026-03-10 to 2026-03-11"
+        )
+        state["tool_call"] = {"name": "submit_leave_request", "args": {}}
+        with patch("src.agents.nodes.hr_agent.submit_leave_request") as submit:
+            submit.return_value = {"success": True, "data": {}}
+            hr_agent(state)
+        submit.assert_called_once_with("EMP001", "2026-03-10", "2026-03-11", "family")
+
+    def test_hr_agent_asks_for_missing_dates(self):
+        """A leave request without dates asks for them and books nothing."""
+        from src.agents.nodes.hr_agent import hr_agent
+        from src.agents.state import create_initial_state
+
+        state = create_initial_state("EMP001", "I'd like to take some leave")
+        state["tool_call"] = {"name": "submit_leave_request", "args": {}}
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content="{}")
+        with patch("src.agents.nodes.slot_filler.get_llm", return_value=llm):
+            with patch("src.agents.nodes.hr_agent.submit_leave_request") as submit:
+                result = hr_agent(state)
+        submit.assert_not_called()
+        assert result["tool_results"]["success"] is False
+        assert result["tool_results"]["code"] == "MISSING_DATES"
+
+    def test_relative_dates_count_from_demo_today(self):
+        """The extractor and the tools agree on what "tomorrow" means."""
+        from src.agents.nodes.slot_filler import fill_tool_args
+        from src.mcp_server.tools.ewa_tools import DEMO_TODAY
+
+        args = fill_tool_args("submit_leave_request", "Book annual leave tomorrow")
+        assert args["start_date"] == "2026-02-11"
+        assert DEMO_TODAY.isoformat() == "2026-02-10"
+
+    def test_llm_prompt_uses_demo_today(self):
+        """The LLM fallback is told the same date the tools use."""
+        from src.agents.nodes.slot_filler import fill_tool_args
+
+        llm = MagicMock()
+        llm.invoke.return_value = MagicMock(content="{}")
+        with patch("src.agents.nodes.slot_filler.get_llm", return_value=llm):
+            fill_tool_args("submit_leave_request", "Leave for Christmas Eve")
+        assert "Today is 2026-02-10." in llm.invoke.call_args[0][0]
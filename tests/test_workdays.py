@@ -0,0 +1,113 @@
+"""Tests for business-day counting on the South African holiday calendar."""
+
+import random
+import warnings
+from datetime import date, timedelta
+
+from src.workdays import (
+    count_business_days,
+    count_business_days_batch,
+    easter_sunday,
+    public_holidays,
+)
+
+
+def _loop_count(start: date, end: date) -> int:
+    """Reference implementation: walk the range one day at a time."""
+    holidays = {
+        day
+        for year in range(start.year, end.year + 1)
+        for day, _ in public_holidays(year)
+    }
+    days = 0
+    current = start
+    while current <= end:
+        if current.weekday() < 5 and current not in holidays:
+            days += 1
+        current += timedelta(days=1)
+    return days
+
+
+class TestHolidayCalendar:
+    """Tests for the cached per-year public holiday calendar."""
+
+    def test_easter_dates(self):
+        """Easter Sunday matches known dates."""
+        assert easter_sunday(2024) == date(2024, 3, 31)
+        assert easter_sunday(2025) == date(2025, 4, 20)
+        assert easter_sunday(2026) == date(2026, 4, 5)
+
+    def test_easter_based_holidays(self):
+        """Good Friday and Family Day follow Easter."""
+        holidays = dict(public_holidays(2026))
+        assert holidays[date(2026, 4, 3)] == "Good Friday"
+        assert holidays[date(2026, 4, 6)] == "Family Day"
+
+    def test_sunday_holiday_observed_on_monday(self):
+        """Women's Day on Sunday 9 Aug 2026 moves to Monday 10 Aug."""
+        holidays = dict(public_holidays(2026))
+        assert date(2026, 8, 10) in holidays
+        assert "observed" in holidays[date(2026, 8, 10)]
+
+    def test_saturday_holiday_not_observed(self):
+        """Human Rights Day on Saturday 21 Mar 2026 has no substitute day."""
+        holidays = dict(public_holidays(2026))
+        assert date(2026, 3, 23) not in holidays
+
+    def test_declared_holiday_included(self):
+        """One-off proclaimed holidays are part of their year's calendar."""
+        assert date(2024, 5, 29) in dict(public_holidays(2024))
+
+    def test_calendar_is_cached(self):
+        """Repeated lookups return the same object."""
+        assert public_holidays(2026) is public_holidays(2026)
+
+
+class TestCountBusinessDays:
+    """Tests for count_business_days and count_business_days_batch."""
+
+    def test_plain_week(self):
+        """Mon-Fri with no holidays is five days."""
+        assert count_business_days(date(2026, 3, 2), date(2026, 3, 6)) == 5
+
+    def test_weekend_only(self):
+        """A weekend has no business days."""
+        assert count_business_days(date(2026, 3, 7), date(2026, 3, 8)) == 0
+
+    def test_holidays_excluded(self):
+        """Freedom Day and Workers' Day are excluded."""
+        assert count_business_days(date(2026, 4, 27), date(2026, 5, 1)) == 3
+
+    def test_reversed_range(self):
+        """End before start counts as zero."""
+        assert count_business_days(date(2026, 3, 6), date(2026, 3, 2)) == 0
+
+    def test_matches_day_by_day_loop(self):
+        """Random ranges, including multi-year ones, match the reference loop."""
+        rng = random.Random(7)
+        for _ in range(500):
+            start = date(2015, 1, 1) + timedelta(days=rng.randrange(4000))
+            end = start + timedelta(days=rng.randrange(1500))
+            assert count_business_days(start, end) == _loop_count(start, end)
+
+    def test_batch_matches_single(self):
+        """Batch results equal per-range results, in order."""
+        rng = random.Random(11)
+        ranges = []
+        for _ in range(300):
+            start = date(2020, 1, 1) + timedelta(days=rng.randrange(2500))
+            ranges.append((start, start + timedelta(days=rng.randrange(-5, 800))))
+        expected = [count_business_days(start, end) for start, end in ranges]
+        assert count_business_days_batch(ranges) == expected
+
+    def test_batch_raises_no_deprecation_warning(self):
+        """The NumPy path does not rely on deprecated datetime arithmetic."""
+        with warnings.catch_warnings():
+            warnings.simplefilter("error", DeprecationWarning)
+            assert count_business_days_batch(
+                [(date(2026, 3, 2), date(2026, 3, 6))]
+            ) == [5]
+
+    def test_batch_empty(self):
+        """An empty batch returns an empty list."""
+        assert count_business_days_batch([]) == []